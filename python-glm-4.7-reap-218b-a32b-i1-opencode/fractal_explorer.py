@@ -4,26 +4,6 @@ import tkinter as tk
 from datetime import datetime
 import multiprocessing
 
-# Import all fractal implementations to register them
-from fractals.mandelbrot import *
-from fractals.julia import *
-from fractals.multibrot import *
-from fractals.burning_ship import *
-from fractals.tricorn import *
-from fractals.phoenix import *
-from fractals.newton import *
-from fractals.cubic_julia import *
-from fractals.feather import *
-from fractals.spider import *
-from fractals.orbit_trap import *
-from fractals.pickover_stalks import *
-from fractals.interior_distance import *
-from fractals.exterior_distance import *
-from fractals.deribail import *
-
-# Import palette implementations
-from palettes.standard import *
-
 # Import navigation, rendering, and UI components
 from navigation import ZoomController
 from rendering import RenderEngine
@@ -33,6 +13,10 @@ from ui import UIManager
 import fractals
 import palettes
 
+# Register the built-in fractals and palettes
+fractals.load_builtin_fractals()
+palettes.load_builtin_palettes()
+
 
 class FractalExplorer:
     """Main application controller."""
@@ -50,6 +34,11 @@ class FractalExplorer:
         # Track previous state to detect if only iterations changed
         self.last_bounds = None
         
+        # Progress updates pump the Tk event loop, so UI events can ask for a
+        # render while one is running; those are deferred until it finishes
+        self._rendering = False
+        self._render_pending = False
+        
         # Initialize UI manager with window size and pass variables
         self.ui_manager = UIManager(self.root)
         self.ui_manager.fractal_var = self.fractal_var
@@ -120,7 +109,27 @@ class FractalExplorer:
         return palettes.get_palette(pid)
     
     def render(self):
-        """Render the fractal with current settings."""
+        """Render the fractal with current settings.
+        
+        A render requested while one is in progress (from an event handled
+        during a progress update) runs once the current render is done.
+        """
+        if self._rendering:
+            self._render_pending = True
+            return
+        
+        self._rendering = True
+        try:
+            self._render()
+        finally:
+            self._rendering = False
+        
+        if self._render_pending:
+            self._render_pending = False
+            self.root.after_idle(self.render)
+    
+    def _render(self):
+        """Render and display one image with the current settings."""
         
         import time
         start_time = time.time()
@@ -149,9 +158,16 @@ class FractalExplorer:
         )
         self.last_bounds = current_bounds.copy()
         
+        workers = max(1, multiprocessing.cpu_count() - 1)
+        last_percent = [-1]
+        
         def progress_callback(completed, total):
+            # Tiles complete out of order and often; only repaint the title
+            # (which pumps the Tk event loop) when the percentage moves
             percent = int(100 * completed / total)
-            workers = max(1, multiprocessing.cpu_count() - 1)
+            if percent == last_percent[0]:
+                return
+            last_percent[0] = percent
             self.ui_manager.show_status(f"Rendering: {percent}% ({workers} workers)")
         
         # Skip preview - render directly to detailed version
@@ -269,6 +285,10 @@ class FractalExplorer:
     
     def save_image(self):
         """Save the current fractal image as PNG."""
+        if self._rendering:
+            self.ui_manager.show_status("Render in progress - save again when it completes")
+            return
+        
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"fractal_{timestamp}.png"
         
@@ -301,7 +321,10 @@ class FractalExplorer:
     
     def run(self):
         """Start the main event loop."""
-        self.root.mainloop()
+        try:
+            self.root.mainloop()
+        finally:
+            self.render_engine.close()
 
 
 def main():
@@ -1,11 +1,34 @@
 """Fractal base classes and registry system."""
 
 import cmath
+import importlib
+from math import log as _log
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 
 _fractal_registry: Dict[str, type] = {}
 
+# Built-in fractal modules, in the order they are listed in the UI
+_BUILTIN_MODULES = (
+    "mandelbrot",
+    "julia",
+    "multibrot",
+    "burning_ship",
+    "tricorn",
+    "phoenix",
+    "newton",
+    "cubic_julia",
+    "feather",
+    "spider",
+    "orbit_trap",
+    "pickover_stalks",
+    "interior_distance",
+    "exterior_distance",
+    "deribail",
+)
+
 
 class FractalBase:
     """Base class for all fractal implementations."""
@@ -13,6 +36,7 @@ class FractalBase:
     name: str = ""
     description: str = ""
     parameters: Dict[str, Any] = {}
+    kernel_id: Optional[str] = None
     
     def __init__(self):
         self.params = self.parameters.copy()
@@ -34,6 +58,61 @@ class FractalBase:
         """
         return float(max_iter)
     
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        """Compute iteration values for one row of pixels.
+        
+        The default implementation calls compute_pixel for every pixel;
+        fractals with a vectorized kernel can override it.
+        
+        Args:
+            xs: Real coordinates of the pixel centers in the row
+            y: Imaginary coordinate shared by the row
+            max_iter: Maximum iterations to perform
+            
+        Returns:
+            float64 array with one value per entry of xs
+        """
+        compute_pixel = self.compute_pixel
+        values = np.empty(len(xs), dtype=np.float64)
+        
+        for px, x in enumerate(xs.tolist()):
+            values[px] = compute_pixel(x, y, max_iter)
+        
+        return values
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        """Compute iteration values for a whole grid of pixel centers.
+        
+        The default implementation calls compute_row for every row;
+        fractals with a 2D vectorized kernel can override it.
+        
+        Args:
+            xmin: Minimum real coordinate
+            xmax: Maximum real coordinate
+            ymin: Minimum imaginary coordinate
+            ymax: Maximum imaginary coordinate
+            width: Grid width in pixels
+            height: Grid height in pixels
+            max_iter: Maximum iterations to perform
+            dtype: Coordinate precision (np.float32 or np.float64) for
+                vectorized kernels; the per-pixel path always uses float64
+            
+        Returns:
+            Array of shape (height, width) with row 0 at ymax
+        """
+        dx = (xmax - xmin) / width
+        dy = (ymax - ymin) / height
+        
+        xs = xmin + (np.arange(width, dtype=np.float64) + 0.5) * dx
+        values = np.empty((height, width), dtype=np.float64)
+        
+        for py in range(height):
+            values[py] = self.compute_row(xs, ymax - (py + 0.5) * dy, max_iter)
+        
+        return values
+    
     def set_parameter(self, name: str, value: Any) -> None:
         """Set a parameter for this fractal."""
         if name in self.params:
@@ -59,6 +138,12 @@ def register_fractal(fractal_id: str):
     return decorator
 
 
+def load_builtin_fractals() -> None:
+    """Import the built-in fractal modules so they register themselves."""
+    for module_name in _BUILTIN_MODULES:
+        importlib.import_module(f"{__name__}.{module_name}")
+
+
 def get_fractal(fractal_id: str) -> Optional[FractalBase]:
     """Get an instance of a registered fractal.
     
@@ -80,11 +165,7 @@ def list_fractals() -> Dict[str, str]:
     Returns:
         Dictionary mapping fractal IDs to their names
     """
-    result = {}
-    for fid, cls in _fractal_registry.items():
-        instance = cls()
-        result[fid] = instance.name
-    return result
+    return {fid: cls.name for fid, cls in _fractal_registry.items()}
 
 
 def smooth_coloring(z: complex, i: int, max_iter: int, power: float = 2.0) -> float:
@@ -106,5 +187,9 @@ def smooth_coloring(z: complex, i: int, max_iter: int, power: float = 2.0) -> fl
     if abs_z < 1e-10:
         return float(i)
     
+    if power > 1 and abs_z > 1:
+        log_power = _log(power)
+        return i + 1 - _log(_log(abs_z) / log_power) / log_power
+    
     nu = cmath.log(cmath.log(abs_z) / cmath.log(power)) / cmath.log(power)
     return i + 1 - nu.real
\ No newline at end of file
@@ -0,0 +1,547 @@
+"""Vectorized escape-time kernels shared by the z^n + c fractal family."""
+
+import math
+import os
+from decimal import Decimal, localcontext
+from functools import lru_cache, partial
+from typing import Callable, Optional
+
+import numpy as np
+
+try:
+    from numba import config as numba_config, guvectorize, njit, prange
+    # The TBB threading layer leaves forked render pool workers hanging at
+    # exit; the workqueue layer is fork-friendly and we only call from one
+    # thread. A layer chosen through NUMBA_THREADING_LAYER is left alone.
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        numba_config.THREADING_LAYER = "workqueue"
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# The quadratic kernel compacts escaped lanes out once they reach this
+# fraction (1/N) of the active set
+_COMPACT_FRACTION = 16
+
+
+def pixel_grid(xmin: float, xmax: float, ymin: float, ymax: float,
+               width: int, height: int, dtype=np.float64) -> np.ndarray:
+    """Build the complex coordinates of every pixel center.
+
+    Args:
+        xmin: Minimum real coordinate
+        xmax: Maximum real coordinate
+        ymin: Minimum imaginary coordinate
+        ymax: Maximum imaginary coordinate
+        width: Grid width in pixels
+        height: Grid height in pixels
+        dtype: Float type of the coordinates (np.float32 or np.float64)
+
+    Returns:
+        complex array (complex64 for float32) of shape (height, width)
+        with row 0 at ymax
+    """
+    dx = (xmax - xmin) / width
+    dy = (ymax - ymin) / height
+
+    xs = xmin + (np.arange(width, dtype=np.float64) + 0.5) * dx
+    ys = ymax - (np.arange(height, dtype=np.float64) + 0.5) * dy
+
+    grid = xs[np.newaxis, :] + 1j * ys[:, np.newaxis]
+    return grid.astype(np.result_type(dtype, np.complex64), copy=False)
+
+
+def in_main_cardioid_or_bulb(c: np.ndarray) -> np.ndarray:
+    """Closed-form test for the Mandelbrot main cardioid and period-2 bulb.
+
+    Points inside either region never escape, so callers can assign them
+    max_iter without iterating.
+
+    Args:
+        c: Complex parameters (any shape)
+
+    Returns:
+        Boolean array with the same shape as c
+    """
+    x = c.real
+    y2 = c.imag * c.imag
+    xq = x - 0.25
+    q = xq * xq + y2
+    return (q * (q + xq) <= 0.25 * y2) | ((x + 1.0) * (x + 1.0) + y2 <= 0.0625)
+
+
+def escape_time(z0: np.ndarray, c, max_iter: int, power: float = 2.0,
+                pow_fn: Optional[Callable] = None) -> np.ndarray:
+    """Iterate z = z^power + c over a whole array with smooth coloring.
+
+    Matches the per-pixel compute_pixel/smooth_coloring pair: a lane that
+    escapes before update i gets i + 1 - log(log|z| / log p) / log p, and
+    lanes that never escape get max_iter. complex64 input is iterated in
+    single precision, anything else in double. Escaped lanes are masked out of
+    the bailout test and compacted away once they reach 1/_COMPACT_FRACTION
+    of the active set, so the remaining work shrinks with the active set
+    without reindexing every array on every step.
+
+    Args:
+        z0: Starting z values (any shape)
+        c: Constant added each step, scalar or array broadcastable to z0
+        max_iter: Maximum iterations to perform
+        power: Exponent used in the iteration and smooth coloring
+        pow_fn: Optional specialized z -> z**power function
+
+    Returns:
+        float64 array with the same shape as z0
+    """
+    shape = np.shape(z0)
+    values = np.full(shape, float(max_iter), dtype=np.float64)
+    out = values.reshape(-1)
+
+    if pow_fn is None and power == 2.0:
+        _escape_time_quadratic(z0, c, max_iter, out)
+        return values
+
+    ctype = _complex_type(z0)
+    z = np.array(z0, dtype=ctype).reshape(-1)
+    if np.ndim(c):
+        c = np.broadcast_to(np.asarray(c, dtype=ctype), shape).reshape(-1).copy()
+    idx = np.arange(z.size)
+    done = np.zeros(z.size, dtype=bool)
+    n_done = 0
+
+    log_power = np.log(power)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            mag2 = z.real * z.real + z.imag * z.imag
+            escaped = mag2 > 4.0
+            if n_done:
+                escaped &= ~done
+
+            n_escaped = np.count_nonzero(escaped)
+            if n_escaped:
+                log_abs = 0.5 * np.log(mag2[escaped])
+                out[idx[escaped]] = i + 1 - np.log(log_abs / log_power) / log_power
+
+                done |= escaped
+                n_done += n_escaped
+                if n_done * _COMPACT_FRACTION >= idx.size:
+                    active = ~done
+                    idx = idx[active]
+                    if idx.size == 0:
+                        break
+                    z = z[active]
+                    if np.ndim(c):
+                        c = c[active]
+                    done = np.zeros(z.size, dtype=bool)
+                    n_done = 0
+
+            if pow_fn is not None:
+                z = pow_fn(z)
+            else:
+                z = z ** power
+            z += c
+
+    return values
+
+
+def _complex_type(z0) -> np.dtype:
+    """complex64 for single-precision input, complex128 otherwise."""
+    dtype = np.asarray(z0).dtype
+    if dtype in (np.float32, np.complex64):
+        return np.dtype(np.complex64)
+    return np.dtype(np.complex128)
+
+
+def _escape_time_quadratic(z0, c, max_iter: int, out: np.ndarray) -> None:
+    """z = z^2 + c on split real/imaginary arrays, writing into out.
+
+    Each step computes zr^2 and zi^2 once and reuses them for both the
+    bailout test and the update, using in-place ufuncs on preallocated
+    buffers. Escaped lanes are only compacted out once they make up
+    1/_COMPACT_FRACTION of the active set; until then they keep iterating
+    (and may overflow harmlessly) but are masked out of the bailout test.
+    """
+    shape = np.shape(z0)
+    ctype = _complex_type(z0)
+    z0 = np.asarray(z0, dtype=ctype).reshape(-1)
+    zr = z0.real.copy()
+    zi = z0.imag.copy()
+    if np.ndim(c):
+        c = np.broadcast_to(np.asarray(c, dtype=ctype), shape).reshape(-1)
+        cr = c.real.copy()
+        ci = c.imag.copy()
+    else:
+        cr = complex(c).real
+        ci = complex(c).imag
+    idx = np.arange(zr.size)
+
+    zr2 = np.empty_like(zr)
+    zi2 = np.empty_like(zi)
+    mag2 = np.empty_like(zr)
+    done = np.zeros(zr.size, dtype=bool)
+    n_done = 0
+    log2 = math.log(2.0)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            np.multiply(zr, zr, out=zr2)
+            np.multiply(zi, zi, out=zi2)
+            np.add(zr2, zi2, out=mag2)
+            escaped = mag2 > 4.0
+            if n_done:
+                escaped &= ~done
+
+            n_escaped = np.count_nonzero(escaped)
+            if n_escaped:
+                log_abs = 0.5 * np.log(mag2[escaped])
+                out[idx[escaped]] = i + 1 - np.log(log_abs / log2) / log2
+
+                done |= escaped
+                n_done += n_escaped
+                if n_done * _COMPACT_FRACTION >= idx.size:
+                    active = ~done
+                    idx = idx[active]
+                    if idx.size == 0:
+                        break
+                    zr = zr[active]
+                    zi = zi[active]
+                    zr2 = zr2[active]
+                    zi2 = zi2[active]
+                    mag2 = np.empty_like(zr)
+                    done = np.zeros(zr.size, dtype=bool)
+                    n_done = 0
+                    if np.ndim(cr):
+                        cr = cr[active]
+                        ci = ci[active]
+
+            # zi = 2 * zr * zi + ci, then zr = zr^2 - zi^2 + cr
+            np.multiply(zr, zi, out=zi)
+            zi *= 2.0
+            zi += ci
+            np.subtract(zr2, zi2, out=zr)
+            zr += cr
+
+
+def reference_orbit(cx: Decimal, cy: Decimal, max_iter: int, digits: int) -> np.ndarray:
+    """Iterate z = z^2 + c at high precision and round the orbit to complex128.
+
+    Args:
+        cx: Real part of the reference point
+        cy: Imaginary part of the reference point
+        max_iter: Maximum iterations to perform
+        digits: Decimal digits of working precision
+
+    Returns:
+        complex128 array Z[0..N] with Z[0] = 0, ending at max_iter or at the
+        first point with |Z| > 2 (included)
+    """
+    orbit = [0j]
+
+    with localcontext() as ctx:
+        ctx.prec = digits
+        zr = zi = Decimal(0)
+        for _ in range(max_iter):
+            zr, zi = zr * zr - zi * zi + cx, 2 * zr * zi + cy
+            z = complex(float(zr), float(zi))
+            orbit.append(z)
+            if z.real * z.real + z.imag * z.imag > 4.0:
+                break
+
+    return np.array(orbit, dtype=np.complex128)
+
+
+def perturbation_escape(orbit: np.ndarray, dc: np.ndarray, max_iter: int) -> np.ndarray:
+    """Mandelbrot escape values from offsets dc around a reference orbit.
+
+    Each lane tracks dz = z - Z[m] in double precision with
+    dz' = (2 Z[m] + dz) dz + dc, so pixels much closer together than double
+    precision can resolve in absolute coordinates still get distinct orbits.
+    A lane is rebased onto the start of the orbit (dz = z, m = 0) when
+    |z| < |dz| or when it reaches the end of the reference orbit. Smooth
+    values match escape_time.
+
+    Args:
+        orbit: Reference orbit from reference_orbit
+        dc: Offsets of each pixel from the reference point (any shape)
+        max_iter: Maximum iterations to perform
+
+    Returns:
+        float64 array with the same shape as dc
+    """
+    shape = np.shape(dc)
+    values = np.full(shape, float(max_iter), dtype=np.float64)
+    out = values.reshape(-1)
+
+    dc = np.array(dc, dtype=np.complex128).reshape(-1)
+    dz = np.zeros_like(dc)
+    m = np.zeros(dc.size, dtype=np.intp)
+    idx = np.arange(dc.size)
+    last = len(orbit) - 1
+    log2 = math.log(2.0)
+
+    with np.errstate(over="ignore", invalid="ignore"):
+        for i in range(max_iter):
+            z = orbit[m] + dz
+            mag2 = z.real * z.real + z.imag * z.imag
+            escaped = mag2 > 4.0
+
+            if escaped.any():
+                log_abs = 0.5 * np.log(mag2[escaped])
+                out[idx[escaped]] = i + 1 - np.log(log_abs / log2) / log2
+
+                active = ~escaped
+                idx = idx[active]
+                if idx.size == 0:
+                    break
+                z = z[active]
+                dz = dz[active]
+                dc = dc[active]
+                m = m[active]
+                mag2 = mag2[active]
+
+            rebase = (mag2 < dz.real * dz.real + dz.imag * dz.imag) | (m == last)
+            if rebase.any():
+                dz[rebase] = z[rebase]
+                m[rebase] = 0
+
+            dz = (2.0 * orbit[m] + dz) * dz + dc
+            m += 1
+
+    return values
+
+
+def mandelbrot_perturbation(xmin: float, xmax: float, ymin: float, ymax: float,
+                            width: int, height: int, max_iter: int) -> np.ndarray:
+    """Compute a deep-zoom Mandelbrot grid by perturbation around its center.
+
+    Args:
+        xmin: Minimum real coordinate
+        xmax: Maximum real coordinate
+        ymin: Minimum imaginary coordinate
+        ymax: Maximum imaginary coordinate
+        width: Grid width in pixels
+        height: Grid height in pixels
+        max_iter: Maximum iterations to perform
+
+    Returns:
+        float64 array of shape (height, width) with row 0 at ymax
+    """
+    dx = (xmax - xmin) / width
+    dy = (ymax - ymin) / height
+
+    # Enough digits to resolve a pixel at this scale, plus guard digits
+    span = min(xmax - xmin, ymax - ymin)
+    digits = max(30, 20 - int(math.floor(math.log10(span))))
+
+    cx = (Decimal(xmin) + Decimal(xmax)) / 2
+    cy = (Decimal(ymin) + Decimal(ymax)) / 2
+    orbit = reference_orbit(cx, cy, max_iter, digits)
+
+    # Offsets are measured from the grid center, so they stay exact at depth
+    dxs = (np.arange(width, dtype=np.float64) + 0.5 - width / 2) * dx
+    dys = (height / 2 - np.arange(height, dtype=np.float64) - 0.5) * dy
+    dc = dxs[np.newaxis, :] + 1j * dys[:, np.newaxis]
+
+    return perturbation_escape(orbit, dc, max_iter)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, parallel=True, fastmath=True)
+    def _escape_rows(xmin, dx, ymax, dy, width, py_start, py_end, max_iter,
+                     julia, cr, ci, out):
+        log2 = math.log(2.0)
+        for py in prange(py_start, py_end):
+            y = ymax - (py + 0.5) * dy
+            for px in range(width):
+                x = xmin + (px + 0.5) * dx
+                if julia:
+                    zr = x
+                    zi = y
+                    ar = cr
+                    ai = ci
+                else:
+                    zr = 0.0
+                    zi = 0.0
+                    ar = x
+                    ai = y
+
+                value = float(max_iter)
+                if not julia:
+                    # Main cardioid and period-2 bulb never escape
+                    xq = x - 0.25
+                    q = xq * xq + y * y
+                    if (q * (q + xq) <= 0.25 * y * y
+                            or (x + 1.0) * (x + 1.0) + y * y <= 0.0625):
+                        out[py - py_start, px] = value
+                        continue
+
+                for n in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 > 4.0:
+                        value = n + 1 - math.log(0.5 * math.log(zr2 + zi2) / log2) / log2
+                        break
+                    zi = 2.0 * zr * zi + ai
+                    zr = zr2 - zi2 + ar
+
+                out[py - py_start, px] = value
+
+    @guvectorize(["void(complex128[:], int64, float64[:])"], "(n),()->(n)",
+                 target="parallel", cache=True)
+    def mandelbrot_gufunc(c, max_iter, out):
+        """Smooth Mandelbrot values for c as a parallel generalized ufunc.
+
+        Broadcasts over any leading dimensions of c, so a (height, width)
+        grid runs its rows on Numba's thread pool.
+        """
+        log2 = math.log(2.0)
+        for k in range(c.shape[0]):
+            x = c[k].real
+            y = c[k].imag
+            value = float(max_iter)
+
+            xq = x - 0.25
+            q = xq * xq + y * y
+            if (q * (q + xq) <= 0.25 * y * y
+                    or (x + 1.0) * (x + 1.0) + y * y <= 0.0625):
+                out[k] = value
+                continue
+
+            zr = 0.0
+            zi = 0.0
+            for n in range(max_iter):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 > 4.0:
+                    value = n + 1 - math.log(0.5 * math.log(zr2 + zi2) / log2) / log2
+                    break
+                zi = 2.0 * zr * zi + y
+                zr = zr2 - zi2 + x
+
+            out[k] = value
+
+    def mandelbrot_rows(xmin: float, dx: float, ymax: float, dy: float, width: int,
+                        py_start: int, py_end: int, max_iter: int, out: np.ndarray) -> None:
+        """Fill out[0:py_end-py_start] with smooth Mandelbrot values (Numba, multithreaded).
+
+        Args:
+            xmin: Real coordinate of the left image edge
+            dx: Pixel width in the complex plane
+            ymax: Imaginary coordinate of the top image edge
+            dy: Pixel height in the complex plane
+            width: Image width in pixels
+            py_start: First row to compute
+            py_end: One past the last row to compute
+            max_iter: Maximum iterations to perform
+            out: float64 array of shape (py_end - py_start, width)
+        """
+        _escape_rows(xmin, dx, ymax, dy, width, py_start, py_end, max_iter,
+                     False, 0.0, 0.0, out)
+
+    def julia_rows(xmin: float, dx: float, ymax: float, dy: float, width: int,
+                   py_start: int, py_end: int, max_iter: int, out: np.ndarray,
+                   c: complex) -> None:
+        """Fill out[0:py_end-py_start] with smooth Julia values for constant c.
+
+        Args:
+            xmin: Real coordinate of the left image edge
+            dx: Pixel width in the complex plane
+            ymax: Imaginary coordinate of the top image edge
+            dy: Pixel height in the complex plane
+            width: Image width in pixels
+            py_start: First row to compute
+            py_end: One past the last row to compute
+            max_iter: Maximum iterations to perform
+            out: float64 array of shape (py_end - py_start, width)
+            c: Julia constant
+        """
+        c = complex(c)
+        _escape_rows(xmin, dx, ymax, dy, width, py_start, py_end, max_iter,
+                     True, c.real, c.imag, out)
+
+
+if NUMBA_AVAILABLE:
+    from numba import cuda
+
+    @cuda.jit
+    def _mandelbrot_cuda_kernel(xmin, dx, ymax, dy, max_iter, out):
+        px, py = cuda.grid(2)
+        if px >= out.shape[1] or py >= out.shape[0]:
+            return
+
+        x = xmin + (px + 0.5) * dx
+        y = ymax - (py + 0.5) * dy
+
+        xq = x - 0.25
+        q = xq * xq + y * y
+        if q * (q + xq) <= 0.25 * y * y or (x + 1.0) * (x + 1.0) + y * y <= 0.0625:
+            out[py, px] = max_iter
+            return
+
+        log2 = math.log(2.0)
+        zr = 0.0
+        zi = 0.0
+        for n in range(max_iter):
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                out[py, px] = n + 1 - math.log(0.5 * math.log(zr2 + zi2) / log2) / log2
+                return
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
+
+        out[py, px] = max_iter
+
+    def mandelbrot_cuda(xmin: float, dx: float, ymax: float, dy: float,
+                        width: int, height: int, max_iter: int) -> np.ndarray:
+        """Compute smooth Mandelbrot values on the GPU, one thread per pixel.
+
+        Args:
+            xmin: Real coordinate of the left image edge
+            dx: Pixel width in the complex plane
+            ymax: Imaginary coordinate of the top image edge
+            dy: Pixel height in the complex plane
+            width: Image width in pixels
+            height: Image height in pixels
+            max_iter: Maximum iterations to perform
+
+        Returns:
+            float64 array of shape (height, width) with row 0 at ymax
+        """
+        out = cuda.device_array((height, width), dtype=np.float64)
+        blocks = ((width + 15) // 16, (height + 15) // 16)
+        _mandelbrot_cuda_kernel[blocks, (16, 16)](xmin, dx, ymax, dy, max_iter, out)
+        return out.copy_to_host()
+
+
+@lru_cache(maxsize=None)
+def cuda_available() -> bool:
+    """Return True if Numba can reach a CUDA device (checked once, on first use)."""
+    if not NUMBA_AVAILABLE:
+        return False
+    try:
+        return cuda.is_available()
+    except Exception:
+        return False
+
+
+def get_row_kernel(fractal) -> Optional[Callable]:
+    """Return a compiled row kernel for a fractal, if one is available.
+
+    Args:
+        fractal: Fractal instance; its kernel_id selects the kernel
+
+    Returns:
+        Callable with the mandelbrot_rows signature, or None when Numba is
+        not installed or the fractal has no compiled kernel
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+
+    kernel_id = getattr(fractal, "kernel_id", None)
+    if kernel_id == "mandelbrot":
+        return mandelbrot_rows
+    if kernel_id == "julia":
+        return partial(julia_rows, c=fractal.get_parameter("c"))
+    return None
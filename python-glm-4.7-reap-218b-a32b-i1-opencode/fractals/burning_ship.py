@@ -1,6 +1,6 @@
 """Burning ship fractal implementation."""
 
-from . import FractalBase, register_fractal
+from . import FractalBase, register_fractal, smooth_coloring
 
 
 @register_fractal("burning_ship")
@@ -19,7 +19,7 @@ class BurningShip(FractalBase):
         
         for i in range(max_iter):
             if abs(z) > 2:
-                return float(i)
+                return smooth_coloring(z, i, max_iter, 2.0)
             z = (abs(z.real) + 1j * abs(z.imag)) ** 2 + c
         
         return float(max_iter)
\ No newline at end of file
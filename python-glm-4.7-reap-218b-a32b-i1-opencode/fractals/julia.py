@@ -1,6 +1,9 @@
 """Julia set implementations with presets."""
 
+import numpy as np
+
 from . import FractalBase, register_fractal, smooth_coloring
+from ._kernels import escape_time, pixel_grid
 
 
 @register_fractal("julia")
@@ -9,6 +12,7 @@ class Julia(FractalBase):
     
     name = "Julia Set"
     description = "z = z² + c (c fixed)"
+    kernel_id = "julia"
     parameters = {"c": -0.75 + 0.1j}
     
     def get_default_bounds(self) -> dict:
@@ -24,6 +28,15 @@ class Julia(FractalBase):
             z = z * z + c
         
         return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        return escape_time(xs + 1j * y, self.get_parameter("c", -0.75 + 0.1j), max_iter)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        z = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        return escape_time(z, self.get_parameter("c", -0.75 + 0.1j), max_iter)
 
 
 @register_fractal("julia_dendrite")
@@ -32,6 +45,7 @@ class JuliaDendrite(FractalBase):
     
     name = "Julia Dendrite"
     description = "z = z² - 1 (dendrite)"
+    kernel_id = "julia"
     parameters = {"c": -1.0 + 0j}
     
     def get_default_bounds(self) -> dict:
@@ -46,6 +60,15 @@ class JuliaDendrite(FractalBase):
             z = z * z - 1
         
         return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        return escape_time(xs + 1j * y, -1.0 + 0j, max_iter)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        z = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        return escape_time(z, -1.0 + 0j, max_iter)
 
 
 @register_fractal("julia_dragon")
@@ -54,6 +77,7 @@ class JuliaDragon(FractalBase):
     
     name = "Julia Dragon"
     description = "z = z² + c (dragon)"
+    kernel_id = "julia"
     parameters = {"c": 0.36 + 0.1j}
     
     def get_default_bounds(self) -> dict:
@@ -68,6 +92,15 @@ class JuliaDragon(FractalBase):
             z = z * z + (0.36 + 0.1j)
         
         return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        return escape_time(xs + 1j * y, 0.36 + 0.1j, max_iter)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        z = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        return escape_time(z, 0.36 + 0.1j, max_iter)
 
 
 @register_fractal("julia_spiral")
@@ -76,6 +109,7 @@ class JuliaSpiral(FractalBase):
     
     name = "Julia Spiral"
     description = "z = z² + c (spiral)"
+    kernel_id = "julia"
     parameters = {"c": -0.7269 + 0.1889j}
     
     def get_default_bounds(self) -> dict:
@@ -89,4 +123,13 @@ class JuliaSpiral(FractalBase):
                 return smooth_coloring(z, i, max_iter, 2.0)
             z = z * z + (-0.7269 + 0.1889j)
         
-        return float(max_iter)
\ No newline at end of file
+        return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        return escape_time(xs + 1j * y, -0.7269 + 0.1889j, max_iter)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        z = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        return escape_time(z, -0.7269 + 0.1889j, max_iter)
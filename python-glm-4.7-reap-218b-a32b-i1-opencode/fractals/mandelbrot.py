@@ -1,6 +1,24 @@
 """Mandelbrot set implementation."""
 
+import numpy as np
+
 from . import FractalBase, register_fractal, smooth_coloring
+from ._kernels import NUMBA_AVAILABLE, escape_time, in_main_cardioid_or_bulb, pixel_grid
+
+if NUMBA_AVAILABLE:
+    from ._kernels import mandelbrot_gufunc
+
+
+def _mandelbrot_values(c: np.ndarray, max_iter: int) -> np.ndarray:
+    """Smooth escape values for c, skipping the cardioid and period-2 bulb."""
+    if NUMBA_AVAILABLE:
+        return mandelbrot_gufunc(c, max_iter)
+    
+    values = np.full(c.shape, float(max_iter))
+    outside = ~in_main_cardioid_or_bulb(c)
+    c = c[outside]
+    values[outside] = escape_time(np.zeros_like(c), c, max_iter)
+    return values
 
 
 @register_fractal("mandelbrot")
@@ -9,11 +27,17 @@ class Mandelbrot(FractalBase):
     
     name = "Mandelbrot Set"
     description = "z = z² + c"
+    kernel_id = "mandelbrot"
     
     def get_default_bounds(self) -> dict:
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.375, "ymax": 1.375}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
+        # Main cardioid and period-2 bulb never escape
+        q = (x - 0.25) ** 2 + y * y
+        if q * (q + (x - 0.25)) <= 0.25 * y * y or (x + 1) ** 2 + y * y <= 0.0625:
+            return float(max_iter)
+        
         c = complex(x, y)
         z = 0j
         
@@ -22,4 +46,13 @@ class Mandelbrot(FractalBase):
                 return smooth_coloring(z, i, max_iter, 2.0)
             z = z * z + c
         
-        return float(max_iter)
\ No newline at end of file
+        return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        return _mandelbrot_values(xs + 1j * y, max_iter)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        c = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        return _mandelbrot_values(c, max_iter)
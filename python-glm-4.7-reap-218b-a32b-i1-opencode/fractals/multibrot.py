@@ -1,6 +1,48 @@
 """Multibrot set implementation."""
 
+from typing import Any, Callable, Optional
+
+import numpy as np
+
 from . import FractalBase, register_fractal, smooth_coloring
+from ._kernels import escape_time, pixel_grid
+
+
+def _make_int_pow(n: int) -> Callable[[complex], complex]:
+    """Build a specialized z -> z**n function for a positive integer power.
+    
+    The function body is generated with exponentiation by squaring so that
+    small integer powers become a handful of complex multiplies instead of
+    going through the generic complex.__pow__ path.
+    
+    Args:
+        n: Positive integer exponent
+    
+    Returns:
+        Compiled function computing z**n
+    """
+    lines = ["def _pow(z):"]
+    result = None
+    square = "z"
+    k = 0
+    while n:
+        if n & 1:
+            if result is None:
+                result = square
+            else:
+                lines.append(f"    r{k} = {result} * {square}")
+                result = f"r{k}"
+                k += 1
+        n >>= 1
+        if n:
+            lines.append(f"    s{k} = {square} * {square}")
+            square = f"s{k}"
+            k += 1
+    lines.append(f"    return {result}")
+    
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_pow"]
 
 
 @register_fractal("multibrot")
@@ -11,6 +53,33 @@ class Multibrot(FractalBase):
     description = "z = z^n + c (n configurable)"
     parameters = {"power": 3.0}
     
+    def __init__(self):
+        super().__init__()
+        self._pow = self._build_pow(self.get_parameter("power", 3.0))
+    
+    @staticmethod
+    def _build_pow(power: float) -> Optional[Callable[[complex], complex]]:
+        """Return a specialized power function, or None for non-integer powers."""
+        if power >= 1 and float(power).is_integer():
+            return _make_int_pow(int(power))
+        return None
+    
+    def __getstate__(self) -> dict:
+        # Generated functions cannot be pickled for worker processes
+        state = self.__dict__.copy()
+        del state["_pow"]
+        return state
+    
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._pow = self._build_pow(self.get_parameter("power", 3.0))
+    
+    def set_parameter(self, name: str, value: Any) -> None:
+        """Set a parameter, respecializing the power function if needed."""
+        super().set_parameter(name, value)
+        if name == "power":
+            self._pow = self._build_pow(self.get_parameter("power", 3.0))
+    
     def get_default_bounds(self) -> dict:
         return {"xmin": -1.75, "xmax": 1.25, "ymin": -1.5, "ymax": 1.5}
     
@@ -18,10 +87,29 @@ class Multibrot(FractalBase):
         c = complex(x, y)
         z = 0j
         power = self.get_parameter("power", 3.0)
+        pow_fn = self._pow
         
-        for i in range(max_iter):
-            if abs(z) > 2:
-                return smooth_coloring(z, i, max_iter, power)
-            z = z ** power + c
+        if pow_fn is not None:
+            for i in range(max_iter):
+                if abs(z) > 2:
+                    return smooth_coloring(z, i, max_iter, power)
+                z = pow_fn(z) + c
+        else:
+            for i in range(max_iter):
+                if abs(z) > 2:
+                    return smooth_coloring(z, i, max_iter, power)
+                z = z ** power + c
         
-        return float(max_iter)
\ No newline at end of file
+        return float(max_iter)
+    
+    def compute_row(self, xs: np.ndarray, y: float, max_iter: int) -> np.ndarray:
+        c = xs + 1j * y
+        power = self.get_parameter("power", 3.0)
+        return escape_time(np.zeros_like(c), c, max_iter, power, self._pow)
+    
+    def compute_grid(self, xmin: float, xmax: float, ymin: float, ymax: float,
+                     width: int, height: int, max_iter: int,
+                     dtype=np.float64) -> np.ndarray:
+        c = pixel_grid(xmin, xmax, ymin, ymax, width, height, dtype)
+        power = self.get_parameter("power", 3.0)
+        return escape_time(np.zeros_like(c), c, max_iter, power, self._pow)
@@ -3,6 +3,10 @@
 from . import FractalBase, register_fractal
 
 
+# The three roots of unity for z³ - 1 = 0
+_ROOTS = (1 + 0j, -0.5 + 0.866j, -0.5 - 0.866j)
+
+
 @register_fractal("newton")
 class Newton(FractalBase):
     """Newton's method visualization for z³ - 1 = 0."""
@@ -16,11 +20,8 @@ class Newton(FractalBase):
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         z = complex(x, y)
         
-        # Define the three roots of unity
-        roots = [1+0j, -0.5 + 0.866j, -0.5 - 0.866j]
-        
         for i in range(max_iter):
-            for r in roots:
+            for r in _ROOTS:
                 if abs(z - r) < 0.001:
                     return float(i)
             
@@ -1,8 +1,17 @@
 """Orbit trap Mandelbrot variant."""
 
+from math import fabs, sqrt
+
 from . import FractalBase, register_fractal
 
 
+_TRAP_POINT = 0
+_TRAP_CROSS = 1
+_TRAP_CIRCLE = 2
+
+_TRAP_MODES = {"point": _TRAP_POINT, "cross": _TRAP_CROSS}
+
+
 @register_fractal("orbit_trap")
 class OrbitTrap(FractalBase):
     """Mandelbrot with orbit trap coloring - tracks distance to geometric shapes."""
@@ -15,28 +24,48 @@ class OrbitTrap(FractalBase):
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.375, "ymax": 1.375}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        c = complex(x, y)
-        z = 0j
         trap_type = self.get_parameter("trap_type", "circle")
         trap_radius = self.get_parameter("trap_radius", 0.5)
+        mode = _TRAP_MODES.get(trap_type, _TRAP_CIRCLE)
 
-        min_dist = float('inf')
-        
-        for i in range(max_iter):
-            if trap_type == "point":
-                dist = abs(z)
-            elif trap_type == "cross":
-                dist = min(abs(z.real), abs(z.imag))
-            else:
-                dist = abs(abs(z) - trap_radius)
-            
-            if dist < min_dist:
-                min_dist = dist
-            
-            if abs(z) > 2:
-                trapped_val = int(min_dist * 500)
-                return max_iter - min(max_iter, trapped_val)
-            
-            z = z * z + c
+        zr = zi = 0.0
+
+        if mode == _TRAP_POINT:
+            # Track the squared distance and take the root once at bailout
+            min_dist2 = zr * zr + zi * zi
+            for _ in range(1, max_iter):
+                zr, zi = zr * zr - zi * zi + x, 2.0 * zr * zi + y
+                mag2 = zr * zr + zi * zi
+                if mag2 < min_dist2:
+                    min_dist2 = mag2
+                if mag2 > 4.0:
+                    return self._trapped_value(sqrt(min_dist2), max_iter)
+        elif mode == _TRAP_CROSS:
+            min_dist = min(fabs(zr), fabs(zi))
+            for _ in range(1, max_iter):
+                zr, zi = zr * zr - zi * zi + x, 2.0 * zr * zi + y
+                ar = fabs(zr)
+                ai = fabs(zi)
+                if ar < min_dist:
+                    min_dist = ar
+                if ai < min_dist:
+                    min_dist = ai
+                if zr * zr + zi * zi > 4.0:
+                    return self._trapped_value(min_dist, max_iter)
+        else:
+            min_dist = fabs(sqrt(zr * zr + zi * zi) - trap_radius)
+            for _ in range(1, max_iter):
+                zr, zi = zr * zr - zi * zi + x, 2.0 * zr * zi + y
+                mag2 = zr * zr + zi * zi
+                dist = fabs(sqrt(mag2) - trap_radius)
+                if dist < min_dist:
+                    min_dist = dist
+                if mag2 > 4.0:
+                    return self._trapped_value(min_dist, max_iter)
         
-        return float(max_iter)
\ No newline at end of file
+        return float(max_iter)
+
+    @staticmethod
+    def _trapped_value(min_dist: float, max_iter: int) -> int:
+        """Map the closest trap approach to an iteration-like value."""
+        return max_iter - min(max_iter, int(min_dist * 500))
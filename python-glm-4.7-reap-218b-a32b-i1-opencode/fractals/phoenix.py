@@ -1,6 +1,6 @@
 """Phoenix fractal implementation."""
 
-from . import FractalBase, register_fractal
+from . import FractalBase, register_fractal, smooth_coloring
 
 
 @register_fractal("phoenix")
@@ -22,7 +22,7 @@ class Phoenix(FractalBase):
         
         for i in range(max_iter):
             if abs(z) > 2:
-                return float(i)
+                return smooth_coloring(z, i, max_iter, 2.0)
             temp = z
             z = z * z + c + p * z_prev
             z_prev = temp
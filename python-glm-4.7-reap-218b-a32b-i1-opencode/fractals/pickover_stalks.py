@@ -1,5 +1,7 @@
 """Pickover stalks Mandelbrot variant."""
 
+from math import fabs
+
 from . import FractalBase, register_fractal
 
 
@@ -14,25 +16,22 @@ class PickoverStalks(FractalBase):
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.375, "ymax": 1.375}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        c = complex(x, y)
-        z = 0j
+        zr = zi = 0.0
         
-        min_real_dist = float('inf')
-        min_imag_dist = float('inf')
+        # The closest approach to either axis is all that feeds the result
+        min_dist = min(fabs(zr), fabs(zi))
         
-        for i in range(max_iter):
-            real_dist = abs(z.real)
-            imag_dist = abs(z.imag)
-            
-            if real_dist < min_real_dist:
-                min_real_dist = real_dist
-            if imag_dist < min_imag_dist:
-                min_imag_dist = imag_dist
+        for _ in range(1, max_iter):
+            zr, zi = zr * zr - zi * zi + x, 2.0 * zr * zi + y
             
-            if abs(z) > 2:
-                stalk_val = int((min(min_real_dist, min_imag_dist)) * 1000)
-                return max_iter - stalk_val
+            real_dist = fabs(zr)
+            imag_dist = fabs(zi)
+            if real_dist < min_dist:
+                min_dist = real_dist
+            if imag_dist < min_dist:
+                min_dist = imag_dist
             
-            z = z * z + c
+            if zr * zr + zi * zi > 4.0:
+                return max_iter - int(min_dist * 1000)
         
-        return float(max_iter)
\ No newline at end of file
+        return float(max_iter)
@@ -1,6 +1,6 @@
 """Tricorn (Mandelbar) fractal implementation."""
 
-from . import FractalBase, register_fractal
+from . import FractalBase, register_fractal, smooth_coloring
 
 
 @register_fractal("tricorn")
@@ -19,7 +19,7 @@ class Tricorn(FractalBase):
         
         for i in range(max_iter):
             if abs(z) > 2:
-                return float(i)
+                return smooth_coloring(z, i, max_iter, 2.0)
             z = (z.conjugate()) ** 2 + c
         
         return float(max_iter)
\ No newline at end of file
@@ -1,9 +1,25 @@
 """Palette base classes and registry system."""
 
+import importlib
 from typing import Dict, Any, Optional
 
+import numpy as np
+
 
 _palette_registry: Dict[str, type] = {}
+_palette_instances: Dict[str, "PaletteBase"] = {}
+
+# Built-in palette modules, imported by load_builtin_palettes
+_BUILTIN_MODULES = ("standard",)
+
+# Lookup table entries per unit of iteration value
+LUT_OVERSAMPLE = 16
+
+# Lookup tables kept per palette instance, one per (parameters, max_val)
+LUT_CACHE_SIZE = 16
+
+# Per hue sector, indices into (v, p, q, t) for the red, green and blue channels
+_HSV_SECTOR_INDEX = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
 
 
 class PaletteBase:
@@ -15,6 +31,7 @@ class PaletteBase:
     
     def __init__(self):
         self.params = self.parameters.copy()
+        self._lut_cache: Dict[tuple, np.ndarray] = {}
     
     def get_color(self, value: float, max_val: float) -> tuple:
         """Get RGB color for a given iteration value.
@@ -28,6 +45,47 @@ class PaletteBase:
         """
         return (0, 0, 0)
     
+    def build_lut(self, max_val: float) -> np.ndarray:
+        """Sample get_color into a color lookup table.
+        
+        Entry k holds the color for value k / LUT_OVERSAMPLE, so smooth
+        (fractional) iteration values keep sub-iteration color resolution.
+        The last entry is the color for max_val itself. Channels are clamped
+        to 0-255, so rounding at the ends of a gradient cannot overflow uint8.
+        
+        Args:
+            max_val: Maximum iteration count
+            
+        Returns:
+            uint8 array of shape (max_val * LUT_OVERSAMPLE + 1, 3)
+        """
+        size = int(max_val * LUT_OVERSAMPLE) + 1
+        get_color = self.get_color
+        colors = [get_color(k / LUT_OVERSAMPLE, max_val) for k in range(size)]
+        
+        return np.clip(colors, 0, 255).astype(np.uint8)
+    
+    def get_colors(self, values: np.ndarray, max_val: float) -> np.ndarray:
+        """Get RGB colors for an array of iteration values.
+        
+        Args:
+            values: Array of iteration counts or smooth coloring values
+            max_val: Maximum iteration count
+            
+        Returns:
+            uint8 array with shape values.shape + (3,)
+        """
+        key = (tuple(sorted(self.params.items())), max_val)
+        lut = self._lut_cache.get(key)
+        if lut is None:
+            if len(self._lut_cache) >= LUT_CACHE_SIZE:
+                self._lut_cache.clear()
+            lut = self._lut_cache[key] = self.build_lut(max_val)
+            lut.flags.writeable = False
+        indices = (np.asarray(values) * LUT_OVERSAMPLE).astype(np.intp)
+        
+        return np.take(lut, indices, axis=0, mode="clip")
+    
     def set_parameter(self, name: str, value: Any) -> None:
         """Set a parameter for this palette."""
         if name in self.params:
@@ -49,12 +107,22 @@ def register_palette(palette_id: str):
     """
     def decorator(cls):
         _palette_registry[palette_id] = cls
+        _palette_instances.pop(palette_id, None)
         return cls
     return decorator
 
 
+def load_builtin_palettes() -> None:
+    """Import the built-in palette modules so they register themselves."""
+    for module_name in _BUILTIN_MODULES:
+        importlib.import_module(f"{__name__}.{module_name}")
+
+
 def get_palette(palette_id: str) -> Optional[PaletteBase]:
-    """Get an instance of a registered palette.
+    """Get the shared instance of a registered palette.
+    
+    Instances are created on first use and cached, so repeated lookups
+    do not pay the palette construction cost again.
     
     Args:
         palette_id: Identifier of the palette to instantiate
@@ -62,10 +130,12 @@ def get_palette(palette_id: str) -> Optional[PaletteBase]:
     Returns:
         Palette instance or None if not found
     """
-    cls = _palette_registry.get(palette_id)
-    if cls:
-        return cls()
-    return None
+    instance = _palette_instances.get(palette_id)
+    if instance is None:
+        cls = _palette_registry.get(palette_id)
+        if cls:
+            instance = _palette_instances[palette_id] = cls()
+    return instance
 
 
 def list_palettes() -> Dict[str, str]:
@@ -74,11 +144,7 @@ def list_palettes() -> Dict[str, str]:
     Returns:
         Dictionary mapping palette IDs to their names
     """
-    result = {}
-    for pid, cls in _palette_registry.items():
-        instance = cls()
-        result[pid] = instance.name
-    return result
+    return {pid: cls.name for pid, cls in _palette_registry.items()}
 
 
 def hsv_to_rgb(h: float, s: float, v: float) -> tuple:
@@ -92,29 +158,13 @@ def hsv_to_rgb(h: float, s: float, v: float) -> tuple:
     Returns:
         Tuple of (r, g, b) in range 0-255
     """
-    import math
-    
     if s == 0:
         return (int(v * 255), int(v * 255), int(v * 255))
     
     i = int(h * 6)
     f = h * 6 - i
     
-    p = v * (1 - s)
-    q = v * (1 - s * f)
-    r_ = v * (1 - s * (1 - f))
-    
-    if i == 0:
-        rgb = (v, r_, p)
-    elif i == 1:
-        rgb = (q, v, p)
-    elif i == 2:
-        rgb = (p, v, r_)
-    elif i == 3:
-        rgb = (p, q, v)
-    elif i == 4:
-        rgb = (r_, p, v)
-    else:
-        rgb = (v, p, q)
+    channels = (v, v * (1 - s), v * (1 - s * f), v * (1 - s * (1 - f)))
+    ri, gi, bi = _HSV_SECTOR_INDEX[i if i < 5 else 5]
     
-    return (int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
\ No newline at end of file
+    return (int(channels[ri] * 255), int(channels[gi] * 255), int(channels[bi] * 255))
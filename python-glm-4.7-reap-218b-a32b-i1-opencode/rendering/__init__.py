@@ -2,6 +2,8 @@
 
 from typing import Callable, Optional
 
+import numpy as np
+
 
 class RenderEngine:
     """Main rendering engine for fractals."""
@@ -17,6 +19,8 @@ class RenderEngine:
             self.workers = max(1, multiprocessing.cpu_count() - 1)
         else:
             self.workers = max(1, workers)
+        
+        self._renderer = None
     
     def render(self, fractal, palette, zoom_controller, width: int, height: int,
                max_iter: int, progress_callback: Optional[Callable[[int, int], None]] = None):
@@ -34,9 +38,11 @@ class RenderEngine:
         Returns:
             2D numpy array of RGB values
         """
-        from .parallel import ParallelRenderer
+        if self._renderer is None:
+            from .parallel import ParallelRenderer
+            self._renderer = ParallelRenderer(self.workers)
         
-        renderer = ParallelRenderer(self.workers)
+        renderer = self._renderer
         
         bounds = zoom_controller.get_bounds()
         
@@ -50,8 +56,14 @@ class RenderEngine:
             progress_callback=progress_callback
         )
     
+    def close(self):
+        """Release the worker pool and shared memory held between renders."""
+        if self._renderer is not None:
+            self._renderer.close()
+            self._renderer = None
+    
     def render_preview(self, fractal, palette, zoom_controller, 
-                       preview_scale: int = 10) -> list:
+                       preview_scale: int = 10) -> np.ndarray:
         """Render a quick blocky preview of the fractal.
         
         Args:
@@ -61,28 +73,16 @@ class RenderEngine:
             preview_scale: Scale factor for preview (higher = more blocky)
             
         Returns:
-            2D list of RGB values scaled down
+            numpy array of RGB values shape (height, width, 3), scaled down
         """
         width = zoom_controller.width // preview_scale
         height = zoom_controller.height // preview_scale
         
-        result = []
         bounds = zoom_controller.get_bounds()
         
-        dx = (bounds["xmax"] - bounds["xmin"]) / width
-        dy = (bounds["ymax"] - bounds["ymin"]) / height
-        
-        for py in range(height):
-            row = []
-            y = bounds["ymax"] - (py + 0.5) * dy
-            
-            for px in range(width):
-                x = bounds["xmin"] + (px + 0.5) * dx
-                
-                value = fractal.compute_pixel(x, y, max_iter=50)
-                color = palette.get_color(value, 50)
-                row.append(color)
-            
-            result.append(row)
+        values = fractal.compute_grid(
+            bounds["xmin"], bounds["xmax"], bounds["ymin"], bounds["ymax"],
+            width, height, max_iter=50, dtype=np.float32
+        )
         
-        return result
\ No newline at end of file
+        return palette.get_colors(values, 50)
@@ -1,51 +1,107 @@
 """Parallel computation for fractal rendering."""
 
 import multiprocessing
+import pickle
+from multiprocessing.shared_memory import SharedMemory
 from typing import Callable, Optional
 import numpy as np
 
+from fractals._kernels import cuda_available, get_row_kernel, mandelbrot_perturbation
+
+
+# Edge length in pixels of the square tiles handed to the pool
+TILE = 64
+
+# Mandelbrot views whose pixels are narrower than this switch to
+# perturbation rendering: near |c| ~ 1 a step this small is only a few dozen
+# double-precision ulps, so direct float64 coordinates turn blocky
+DEEP_ZOOM_PIXEL = 1e-14
+
+# Per-process state: the fractal being rendered, set once by _init_worker,
+# and the shared value block currently attached by _attach_result
+_FRACTAL = None
+_SHARED_MEMORY = None
+
+
+def _init_worker(fractal_instance) -> None:
+    """Pool initializer: store the fractal for the lifetime of the worker.
+    
+    The fractal is pickled once per worker process here rather than once
+    per work item.
+    
+    Args:
+        fractal_instance: Fractal instance to render
+    """
+    global _FRACTAL
+    _FRACTAL = fractal_instance
+
+
+def _attach_result(shm_name: str, width: int, height: int) -> np.ndarray:
+    """Return this worker's view of the shared iteration-value plane.
+    
+    The block is attached on first use and reattached only when the
+    renderer has replaced it.
+    
+    Args:
+        shm_name: Name of the SharedMemory block holding the values
+        width: Plane width in pixels
+        height: Plane height in pixels
+        
+    Returns:
+        float32 array of shape (height, width) backed by the shared block
+    """
+    global _SHARED_MEMORY
+    if _SHARED_MEMORY is None or _SHARED_MEMORY.name != shm_name:
+        if _SHARED_MEMORY is not None:
+            _SHARED_MEMORY.close()
+        _SHARED_MEMORY = SharedMemory(name=shm_name)
+    
+    return np.ndarray((height, width), dtype=np.float32, buffer=_SHARED_MEMORY.buf)
+
 
 def _render_worker(args):
     """Worker function for parallel rendering.
     
+    Iteration values are written straight into the shared value plane
+    instead of being pickled back to the parent process, which colors
+    the whole image in one batch afterwards.
+    
     Args:
-        args: Tuple of (fractal_class_id, palette_class_id, row_indices,
-                       bounds, width, height, max_iter)
+        args: Tuple of (shm_name, ty_start, ty_end, tx_start, tx_end, xmin,
+                       xmax, ymin, ymax, width, height, max_iter)
                        
     Returns:
-        List of (row_index, RGB_values) tuples
+        Number of pixels written
     """
-    from fractals import get_fractal
-    from palettes import get_palette
+    (shm_name, ty_start, ty_end, tx_start, tx_end, xmin, xmax, ymin, ymax,
+     width, height, max_iter) = args
     
-    (fractal_instance, palette_instance, row_indices,
-     bounds, width, height, max_iter) = args
+    result = _attach_result(shm_name, width, height)
     
-    dx = (bounds["xmax"] - bounds["xmin"]) / width
-    dy = (bounds["ymax"] - bounds["ymin"]) / height
+    dx = (xmax - xmin) / width
+    dy = (ymax - ymin) / height
     
-    results = []
+    # The tile is a small grid of its own, so vectorized fractals compute
+    # it in a single compute_grid call
+    result[ty_start:ty_end, tx_start:tx_end] = _FRACTAL.compute_grid(
+        xmin + tx_start * dx, xmin + tx_end * dx,
+        ymax - ty_end * dy, ymax - ty_start * dy,
+        tx_end - tx_start, ty_end - ty_start, max_iter
+    )
     
-    for py in row_indices:
-        y = bounds["ymax"] - (py + 0.5) * dy
-        
-        rgb_row = np.zeros((width, 3), dtype=np.uint8)
-        
-        for px in range(width):
-            x = bounds["xmin"] + (px + 0.5) * dx
-            
-            value = fractal_instance.compute_pixel(x, y, max_iter)
-            color = palette_instance.get_color(value, max_iter)
-            
-            rgb_row[px] = color
-        
-        results.append((py, rgb_row))
-    
-    return results
+    return (ty_end - ty_start) * (tx_end - tx_start)
 
 
 class ParallelRenderer:
-    """Parallel renderer using multiprocessing."""
+    """Parallel renderer using multiprocessing.
+    
+    The worker pool and the shared value block are kept between renders.
+    The pool is only rebuilt when the fractal (type or parameters) changes,
+    and the block only when the image grows. Call close() when done.
+    
+    Renders share that pool and block, so render() must not be re-entered
+    (for example from a Tk event handled by a progress callback).
+    """
     
     def __init__(self, workers: int = None):
         """Initialize the parallel renderer.
@@ -57,6 +113,50 @@ class ParallelRenderer:
             self.workers = max(1, multiprocessing.cpu_count() - 1)
         else:
             self.workers = max(1, workers)
+        
+        self._pool = None
+        self._pool_key = None
+        self._shm = None
+        self._rendering = False
+    
+    def _get_pool(self, fractal):
+        """Return a pool whose workers hold this fractal, reusing the current one if possible."""
+        key = pickle.dumps(fractal)
+        if self._pool is not None and key == self._pool_key:
+            return self._pool
+        
+        self._close_pool()
+        self._pool = multiprocessing.Pool(processes=self.workers, initializer=_init_worker,
+                                          initargs=(fractal,))
+        self._pool_key = key
+        return self._pool
+    
+    def _get_shared_memory(self, size: int) -> SharedMemory:
+        """Return a shared block of at least size bytes, replacing it if too small."""
+        if self._shm is not None and self._shm.size >= size:
+            return self._shm
+        
+        self._release_shared_memory()
+        self._shm = SharedMemory(create=True, size=size)
+        return self._shm
+    
+    def _close_pool(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_key = None
+    
+    def _release_shared_memory(self) -> None:
+        if self._shm is not None:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+    
+    def close(self) -> None:
+        """Shut down the worker pool and free the shared value block."""
+        self._close_pool()
+        self._release_shared_memory()
     
     def render(self, fractal, palette, bounds: dict, width: int, height: int,
                max_iter: int, progress_callback: Optional[Callable[[int, int], None]] = None):
@@ -73,43 +173,119 @@ class ParallelRenderer:
             
         Returns:
             2D numpy array of RGB values shape (height, width, 3)
+            
+        Raises:
+            RuntimeError: If called while another render is in progress
         """
-        result = np.zeros((height, width, 3), dtype=np.uint8)
+        # A nested render would replace the pool or shared block, or
+        # overwrite the value plane, underneath the render in progress
+        if self._rendering:
+            raise RuntimeError("ParallelRenderer.render called during another render")
         
-        rows_per_worker = height // self.workers
+        self._rendering = True
+        try:
+            return self._render(fractal, palette, bounds, width, height, max_iter,
+                                progress_callback)
+        finally:
+            self._rendering = False
+    
+    def _render(self, fractal, palette, bounds: dict, width: int, height: int,
+                max_iter: int, progress_callback: Optional[Callable[[int, int], None]] = None):
+        """Render one image; see render()."""
+        values = None
+        if getattr(fractal, "kernel_id", None) == "mandelbrot":
+            pixel = min((bounds["xmax"] - bounds["xmin"]) / width,
+                        (bounds["ymax"] - bounds["ymin"]) / height)
+            if pixel < DEEP_ZOOM_PIXEL:
+                values = mandelbrot_perturbation(bounds["xmin"], bounds["xmax"],
+                                                 bounds["ymin"], bounds["ymax"],
+                                                 width, height, max_iter)
+            elif cuda_available():
+                from fractals._kernels import mandelbrot_cuda
+                dx = (bounds["xmax"] - bounds["xmin"]) / width
+                dy = (bounds["ymax"] - bounds["ymin"]) / height
+                values = mandelbrot_cuda(bounds["xmin"], dx, bounds["ymax"], dy,
+                                         width, height, max_iter)
+        
+        if values is not None:
+            result = palette.get_colors(values, max_iter)
+            
+            if progress_callback:
+                progress_callback(height, height)
+            
+            return result
+        
+        kernel = get_row_kernel(fractal)
+        if kernel is not None:
+            return self._render_compiled(kernel, palette, bounds, width, height,
+                                         max_iter, progress_callback)
+        
+        # Small square tiles handed out on demand keep every worker busy even
+        # though iteration counts vary wildly across the image.
+        # Work items are plain numbers; the fractal travels once per worker.
+        shape = (height, width)
+        shm = self._get_shared_memory(height * width * np.dtype(np.float32).itemsize)
+        
+        xmin, xmax = bounds["xmin"], bounds["xmax"]
+        ymin, ymax = bounds["ymin"], bounds["ymax"]
         worker_args = []
         
-        for i in range(self.workers):
-            start_row = i * rows_per_worker
-            if i == self.workers - 1:
-                end_row = height
-            else:
-                end_row = start_row + rows_per_worker
+        for ty_start in range(0, height, TILE):
+            for tx_start in range(0, width, TILE):
+                worker_args.append((
+                    shm.name,
+                    ty_start, min(ty_start + TILE, height),
+                    tx_start, min(tx_start + TILE, width),
+                    xmin, xmax, ymin, ymax,
+                    width,
+                    height,
+                    max_iter
+                ))
+        
+        completed_pixels = 0
+        
+        pool = self._get_pool(fractal)
+        for pixels_done in pool.imap_unordered(_render_worker, worker_args, chunksize=1):
+            completed_pixels += pixels_done
             
-            row_indices = list(range(start_row, end_row))
+            if progress_callback:
+                progress_callback(completed_pixels // width, height)
+        
+        values = np.ndarray(shape, dtype=np.float32, buffer=shm.buf)
+        result = palette.get_colors(values, max_iter)
+        del values
+        
+        if progress_callback:
+            progress_callback(height, height)
+        
+        return result
+    
+    def _render_compiled(self, kernel, palette, bounds: dict, width: int, height: int,
+                         max_iter: int,
+                         progress_callback: Optional[Callable[[int, int], None]] = None):
+        """Render with a compiled multithreaded row kernel, skipping the process pool.
+        
+        Args:
+            kernel: Row kernel from fractals._kernels.get_row_kernel
+            palette: Palette instance for coloring
+            bounds: Coordinate bounds dictionary
+            width: Image width in pixels
+            height: Image height in pixels
+            max_iter: Maximum iterations per pixel
+            progress_callback: Optional callback function (completed_rows, total_rows)
             
-            worker_args.append((
-                fractal,
-                palette,
-                row_indices,
-                bounds,
-                width,
-                height,
-                max_iter
-            ))
-        
-        completed_rows = 0
-        
-        with multiprocessing.Pool(processes=self.workers) as pool:
-            for worker_results in pool.imap(_render_worker, worker_args):
-                for py, rgb_row in worker_results:
-                    result[py] = rgb_row
-                    completed_rows += 1
-                    
-                    if progress_callback and completed_rows % 10 == 0:
-                        progress_callback(completed_rows, height)
+        Returns:
+            2D numpy array of RGB values shape (height, width, 3)
+        """
+        dx = (bounds["xmax"] - bounds["xmin"]) / width
+        dy = (bounds["ymax"] - bounds["ymin"]) / height
+        
+        values = np.empty((height, width), dtype=np.float64)
+        kernel(bounds["xmin"], dx, bounds["ymax"], dy, width, 0, height, max_iter, values)
+        
+        result = palette.get_colors(values, max_iter)
         
         if progress_callback:
             progress_callback(height, height)
         
-        return result
\ No newline at end of file
+        return result
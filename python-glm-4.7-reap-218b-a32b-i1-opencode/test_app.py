@@ -1,23 +1,6 @@
 """Quick test script for Fractal Explorer."""
 
 import tkinter as tk
-from fractals.mandelbrot import *
-from fractals.julia import *
-from fractals.multibrot import *
-from fractals.burning_ship import *
-from fractals.tricorn import *
-from fractals.phoenix import *
-from fractals.newton import *
-from fractals.cubic_julia import *
-from fractals.feather import *
-from fractals.spider import *
-from fractals.orbit_trap import *
-from fractals.pickover_stalks import *
-from fractals.interior_distance import *
-from fractals.exterior_distance import *
-from fractals.deribail import *
-
-from palettes.standard import *
 
 import fractals
 import palettes
@@ -29,6 +12,13 @@ from ui import UIManager
 
 def main():
     """Run a quick test of the application."""
+    fractals.load_builtin_fractals()
+    palettes.load_builtin_palettes()
+    
+    # Every palette must sample into a valid lookup table
+    for palette_id in palettes.list_palettes():
+        palettes.get_palette(palette_id).build_lut(256)
+    
     root = tk.Tk()
     root.title("Fractal Explorer Test")
     
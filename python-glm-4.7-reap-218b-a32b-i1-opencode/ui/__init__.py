@@ -4,6 +4,12 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Dict, Any, Callable, Optional
 
+try:
+    from PIL import Image, ImageTk
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
 
 class UIManager:
     """Manages the Tkinter user interface."""
@@ -34,10 +40,13 @@ class UIManager:
         self.render_callback_ref = None
         
         # Track resize state to avoid continuous rendering
-        self._resize_in_progress = False
-        self._last_resize_time = 0
+        self._render_after_idle_id = None
         self._pending_render = False
         
+        # Last full-resolution image, rescaled as a stand-in while resizing
+        self._last_full_image = None
+        self._photo = None
+        
         # Track slider state for delayed render on release
         self._slider_change_time = 0
         self._slider_pending_render = False
@@ -187,27 +196,42 @@ class UIManager:
                     new_width = event.width
                     new_height = event.height - 60
                     
-                    if new_width > 0 and new_height > 0:
-                        self._resize_in_progress = True
-                        self.width = new_width
-                        self.height = new_height
-                        self.canvas.config(width=new_width, height=new_height)
-                        
-                        import time as t
-                        self._last_resize_time = t.time()
-                        
-                        def delayed_render():
-                            if not self._resize_in_progress:
-                                return
-                            
-                            if t.time() - self._last_resize_time > 0.3:
-                                self._resize_in_progress = False
-                                render_callback()
-                        
-                        self.root.after(500, delayed_render)
+                    if new_width <= 0 or new_height <= 0:
+                        return
+                    if (new_width, new_height) == (self.width, self.height):
+                        return
+                    
+                    self.width = new_width
+                    self.height = new_height
+                    self.canvas.config(width=new_width, height=new_height)
+                    
+                    # Stretch the last render right away, then re-render
+                    # once the window has stopped changing size
+                    self._show_scaled_preview()
+                    
+                    if self._render_after_idle_id is not None:
+                        self.root.after_cancel(self._render_after_idle_id)
+                    
+                    def render_after_idle():
+                        self._render_after_idle_id = None
+                        render_callback()
+                    
+                    self._render_after_idle_id = self.root.after(500, render_after_idle)
             
             self.root.bind("<Configure>", on_resize)
     
+    def _show_scaled_preview(self):
+        """Blit the last full render bilinearly scaled to the current canvas size."""
+        if not PIL_AVAILABLE or self._last_full_image is None:
+            return
+        
+        img = Image.fromarray(self._last_full_image)
+        img = img.resize((self.width, self.height), Image.BILINEAR)
+        
+        self._photo = ImageTk.PhotoImage(img)
+        self.canvas.delete("all")
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
+    
     def on_click_start(self, event):
         """Handle click start for zoom selection."""
         if event.widget != self.canvas:
@@ -274,16 +298,17 @@ class UIManager:
     def display_image(self, image_data):
         """Display the rendered fractal image.
         
+        The image is drawn as a single PhotoImage, scaled up by the integer
+        preview factor for low-resolution previews.
+        
         Args:
             image_data: 2D numpy array of RGB values or list of lists
         """
         import numpy as np
         
-        if isinstance(image_data, np.ndarray):
-            height, width = image_data.shape[:2]
-        else:
-            height = len(image_data)
-            width = len(image_data[0]) if height > 0 else 0
+        image = np.ascontiguousarray(image_data, dtype=np.uint8)
+        height, width = image.shape[:2]
+        self._last_full_image = image
         
         # Remove any zoom selection rectangle
         if self.zoom_rect_tag:
@@ -293,37 +318,25 @@ class UIManager:
             except:
                 pass
         
-        self.canvas.delete("all")
-        
         preview_scale = max(1, min(self.width // width, self.height // height))
         
-        display_width = min(width * preview_scale, self.width)
-        display_height = min(height * preview_scale, self.height)
-        
-        block_size = max(1, min(
-            (self.width + display_width - 1) // display_width,
-            (self.height + display_height - 1) // display_height
-        ))
-        
-        for py in range(0, height, block_size):
-            for px in range(0, width, block_size):
-                if isinstance(image_data, np.ndarray):
-                    color = tuple(map(int, image_data[py, px]))
-                else:
-                    color = image_data[min(py, height - 1)][min(px, width - 1)]
-                
-                x1 = px * preview_scale
-                y1 = py * preview_scale
-                x2 = min((px + block_size) * preview_scale, self.width)
-                y2 = min((py + block_size) * preview_scale, self.height)
-                
-                hex_color = f"#{color[0]:02x}{color[1]:02x}{color[2]:02x}"
-                
-                self.canvas.create_rectangle(
-                    x1, y1, x2, y2,
-                    fill=hex_color,
-                    outline=""
-                )
+        if PIL_AVAILABLE:
+            img = Image.fromarray(image)
+            if preview_scale > 1:
+                img = img.resize((width * preview_scale, height * preview_scale),
+                                 Image.NEAREST)
+            photo = ImageTk.PhotoImage(img)
+        else:
+            # Tk decodes binary PPM data natively
+            header = f"P6 {width} {height} 255\n".encode()
+            photo = tk.PhotoImage(data=header + image.tobytes(), format="PPM")
+            if preview_scale > 1:
+                photo = photo.zoom(preview_scale)
+        
+        # Keep a reference or Tk drops the image
+        self._photo = photo
+        self.canvas.delete("all")
+        self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
         
         self.root.update()
     
@@ -8,30 +8,12 @@ import tkinter as tk
 from tkinter import messagebox
 import multiprocessing as mp
 import os
+from collections import deque, namedtuple
 from typing import Dict, Any, Optional, TYPE_CHECKING
 
 # Import modular components
-from fractals import FractalRegistry
-from fractals.mandelbrot import *   # Mandelbrot
-from fractals.julia import *        # Julia variants
-from fractals.burning_ship import * # Burning Ship
-from fractals.tricorn import *      # Tricorn
-from fractals.multibrot import *    # Multibrot (z³, z⁴, z⁵)
-from fractals.phoenix import *      # Phoenix
-from fractals.newton import *       # Newton
-from fractals.cubic_julia import *  # Cubic Julia
-from fractals.feather import *      # Feather
-from fractals.spider import *       # Spider
-from fractals.orbit_trap import *   # Orbit Trap Mandelbrot
-from fractals.pickover_stalks import *    # Pickover Stalks
-from fractals.interior_distance import *  # Interior Distance
-from fractals.exterior_distance import *  # Exterior Distance
-from fractals.deribail import *     # Derivative Bailout
-from fractals.nova import *         # Nova (Newton's method variant)
-from fractals.barnsley_fern import * # Barnsley Fern IFS
-from fractals.ifs_fractals import *  # Sierpinski Triangle, Carpet, Dragon Curve, Maple Leaf
+from fractals import FractalRegistry  # Importing the package registers every fractal
 from palettes import PaletteRegistry
-from palettes.standard import *     # Standard palettes
 from navigation import ZoomController
 from ui import UIManager
 from rendering import RenderEngine
@@ -45,6 +27,22 @@ MAX_HISTORY_SIZE: int = 50
 RESIZE_DEBOUNCE_MS: int = 200
 RESIZE_REENABLE_DELAY_MS: int = 300
 MIN_VALID_DIMENSION: int = 1
+MOUSE_STATUS_INTERVAL_MS: int = 33  # Refresh mouse coordinates at most ~30 Hz
+
+# Immutable history entry: bounds as (xmin, xmax, ymin, ymax) and fractal
+# params as sorted (name, value) pairs, so duplicate checks are one compare
+State = namedtuple('State', 'bounds fparams palette max_iter')
+
+
+class FractalHistory:
+    """Undo/redo states for one fractal and the position within them."""
+    
+    __slots__ = ('states', 'index')
+    
+    def __init__(self, max_size: int) -> None:
+        self.states: deque = deque(maxlen=max_size)
+        self.index: int = -1
+
 
 # Type checking imports for forward references
 if TYPE_CHECKING:
@@ -81,9 +79,12 @@ class FractalExplorer:
         self.max_iter = DEFAULT_ITERATIONS
         self._resize_after_id = None  # For debouncing resize events
         self._disable_resize = False  # Flag to disable resize during fractal switches
+        self._last_mouse = (0, 0)  # Latest pointer position over the canvas
+        self._status_after_id = None  # For throttling mouse coordinate updates
         
         # Current fractal and palette
         self.fractal_name = "mandelbrot"
+        self._safe_name = self._sanitize_filename(self.fractal_name)  # For saved images
         self.fractal_params = {}
         self.palette_name = "smooth"
         self.palette_params = {"hue": 0.0, "saturation": 0.8, "value": 0.9}
@@ -94,12 +95,12 @@ class FractalExplorer:
         self.palette_storage = {}
         
         # Per-fractal history for undo/redo (back/forward navigation)
-        self.fractal_histories = {}  # fractal_name -> list of states
-        self.fractal_history_indices = {}  # fractal_name -> current index
+        self.fractal_histories: Dict[str, FractalHistory] = {}
         self.max_history_size = MAX_HISTORY_SIZE
         
         # Parallel processing
         self.num_workers = max(1, mp.cpu_count() - 1)
+        self.backend = "auto"  # "cpu" or "cuda" to force; auto uses a GPU for large views
         
         # Controllers
         self.ui_manager = UIManager(self)
@@ -119,36 +120,44 @@ class FractalExplorer:
     def _initialize_fractal_history(self) -> None:
         """Initialize history for the current fractal."""
         if self.fractal_name not in self.fractal_histories:
-            self.fractal_histories[self.fractal_name] = []
-            self.fractal_history_indices[self.fractal_name] = -1
             self._push_current_state()
     
-    def _get_fractal_history(self) -> list:
-        """Get history list for current fractal."""
-        return self.fractal_histories.get(self.fractal_name, [])
-    
-    def _get_fractal_history_index(self) -> int:
-        """Get history index for current fractal."""
-        return self.fractal_history_indices.get(self.fractal_name, -1)
-    
-    def _set_fractal_history_index(self, index: int) -> None:
-        """Set history index for current fractal."""
-        self.fractal_history_indices[self.fractal_name] = index
+    def _get_fractal_history(self) -> FractalHistory:
+        """Get history for current fractal, creating it on first use."""
+        history = self.fractal_histories.get(self.fractal_name)
+        if history is None:
+            history = FractalHistory(self.max_history_size)
+            self.fractal_histories[self.fractal_name] = history
+        return history
     
     def _load_initial_bounds(self) -> None:
-        """Load initial bounds for current fractal."""
-        if self.fractal_name not in self.bounds_storage:
-            fractal = FractalRegistry.create(self.fractal_name)
-            self.bounds_storage[self.fractal_name] = fractal.get_default_bounds()
+        """Load saved or default bounds for current fractal."""
+        self.set_bounds(self.get_bounds())
     
     def get_bounds(self) -> Dict[str, float]:
         """Get current viewport bounds."""
-        return self.bounds_storage.get(self.fractal_name, 
-                                       FractalRegistry.create(self.fractal_name).get_default_bounds())
+        bounds = self.bounds_storage.get(self.fractal_name)
+        if bounds is None:
+            bounds = FractalRegistry.default_bounds(self.fractal_name)
+        return bounds
     
     def set_bounds(self, bounds: Dict[str, float]) -> None:
         """Set viewport bounds."""
         self.bounds_storage[self.fractal_name] = bounds.copy()
+        self._update_pixel_mapping()
+    
+    def _update_pixel_mapping(self) -> None:
+        """Precompute the pixel -> complex plane mapping for the current view."""
+        bounds = self.get_bounds()
+        self._px2cx_ox = bounds['xmin']
+        self._px2cx_sx = (bounds['xmax'] - bounds['xmin']) / self.width
+        self._px2cx_oy = bounds['ymax']
+        self._px2cx_sy = (bounds['ymax'] - bounds['ymin']) / self.height
+    
+    def pixel_to_complex(self, x: float, y: float) -> complex:
+        """Convert canvas pixel coordinates to the complex plane."""
+        return complex(self._px2cx_ox + x * self._px2cx_sx,
+                       self._px2cx_oy - y * self._px2cx_sy)
     
     def render(self) -> None:
         """Render the fractal."""
@@ -156,8 +165,7 @@ class FractalExplorer:
     
     def reset_view(self) -> None:
         """Reset to default view."""
-        fractal = FractalRegistry.create(self.fractal_name)
-        self.bounds_storage[self.fractal_name] = fractal.get_default_bounds()
+        self.set_bounds(FractalRegistry.default_bounds(self.fractal_name))
         self.max_iter = DEFAULT_ITERATIONS
         self.iter_storage[self.fractal_name] = DEFAULT_ITERATIONS
         self.iter_var.set(DEFAULT_ITERATIONS)
@@ -180,14 +188,7 @@ class FractalExplorer:
             messagebox.showerror("Save Failed", f"Cannot create images directory: {str(e)}")
             return
         
-        # Sanitize filename (remove any problematic characters)
-        safe_name = "".join(c for c in self.fractal_name if c.isalnum() or c in ('-', '_')).rstrip()
-        
-        # Handle edge case where filename becomes empty after sanitization
-        if not safe_name:
-            safe_name = "unnamed_fractal"
-        
-        filename = os.path.join(images_dir, f"fractal_{safe_name}_{self.max_iter}iter.png")
+        filename = os.path.join(images_dir, f"fractal_{self._safe_name}_{self.max_iter}iter.png")
         
         try:
             # Check if file already exists
@@ -197,116 +198,109 @@ class FractalExplorer:
                 if not response:
                     return
             
-            # Save the image
-            self.image.save(filename)
+            # Save the image; IFS frames are wrapped as RGBA, PNGs stay RGB
+            image = self.image
+            if image.mode == 'RGBA':
+                image = image.convert('RGB')
+            image.save(filename)
             messagebox.showinfo("Save Successful", f"Image saved as {filename}")
         except PermissionError:
             messagebox.showerror("Save Failed", f"Permission denied. Cannot write to '{filename}'.\nTry a different location or check file permissions.")
         except Exception as e:
             messagebox.showerror("Save Failed", f"Failed to save image: {str(e)}")
     
+    @staticmethod
+    def _sanitize_filename(name: str) -> str:
+        """Strip characters that are unsafe in filenames from a fractal name."""
+        safe_name = "".join(c for c in name if c.isalnum() or c in ('-', '_')).rstrip()
+        
+        # Handle edge case where filename becomes empty after sanitization
+        return safe_name or "unnamed_fractal"
+    
     def _push_current_state(self) -> None:
         """Save current state to the current fractal's history."""
-        # Initialize history for this fractal if needed
-        if self.fractal_name not in self.fractal_histories:
-            self.fractal_histories[self.fractal_name] = []
-            self.fractal_history_indices[self.fractal_name] = -1
-        
-        history = self.fractal_histories[self.fractal_name]
-        history_index = self.fractal_history_indices[self.fractal_name]
-        
-        state = {
-            'bounds': self.get_bounds().copy(),
-            'fractal_params': self.fractal_params.copy(),
-            'palette_name': self.palette_name,
-            'max_iter': self.max_iter
-        }
-        
-        # Check if this state is identical to the current state in history
-        if history and history_index >= 0 and history_index < len(history):
-            current_state = history[history_index]
-            if (current_state['bounds'] == state['bounds'] and
-                current_state['fractal_params'] == state['fractal_params'] and
-                current_state['palette_name'] == state['palette_name'] and
-                current_state['max_iter'] == state['max_iter']):
-                # State hasn't changed, don't push duplicate
-                return
+        history = self._get_fractal_history()
+        states = history.states
+        
+        bounds = self.get_bounds()
+        state = State(
+            bounds=(bounds['xmin'], bounds['xmax'], bounds['ymin'], bounds['ymax']),
+            fparams=tuple(sorted(self.fractal_params.items())),
+            palette=self.palette_name,
+            max_iter=self.max_iter
+        )
+        
+        # State hasn't changed, don't push duplicate
+        if 0 <= history.index < len(states) and states[history.index] == state:
+            return
         
         # Remove any future states if we're not at the end
-        if history_index < len(history) - 1:
-            history[:] = history[:history_index + 1]
-        
-        # Add new state
-        history.append(state)
+        while len(states) > history.index + 1:
+            states.pop()
         
-        # Limit history size
-        if len(history) > self.max_history_size:
-            history.pop(0)
-            self.fractal_history_indices[self.fractal_name] = len(history) - 1
-        else:
-            self.fractal_history_indices[self.fractal_name] += 1
+        # Add new state (the deque drops the oldest one once full)
+        states.append(state)
+        history.index = len(states) - 1
         
         self._update_history_buttons()
     
     def go_back(self) -> None:
         """Navigate to previous state (undo) for current fractal."""
-        history_index = self._get_fractal_history_index()
-        if history_index > 0:
-            self._set_fractal_history_index(history_index - 1)
-            history = self._get_fractal_history()
-            self._restore_state(history[self._get_fractal_history_index()])
+        history = self._get_fractal_history()
+        if history.index > 0:
+            history.index -= 1
+            self._restore_state(history.states[history.index])
             self._update_history_buttons()
     
     def go_forward(self) -> None:
         """Navigate to next state (redo) for current fractal."""
-        history_index = self._get_fractal_history_index()
         history = self._get_fractal_history()
-        if history_index < len(history) - 1:
-            self._set_fractal_history_index(history_index + 1)
-            self._restore_state(history[self._get_fractal_history_index()])
+        if history.index < len(history.states) - 1:
+            history.index += 1
+            self._restore_state(history.states[history.index])
             self._update_history_buttons()
     
     def _update_history_buttons(self) -> None:
         """Update back/forward button states for current fractal."""
         # Check if UI manager has the buttons
         if hasattr(self, 'ui_manager') and hasattr(self.ui_manager, 'back_btn'):
-            history_index = self._get_fractal_history_index()
             history = self._get_fractal_history()
             
             # Enable back button if we can go back
-            if history_index > 0:
+            if history.index > 0:
                 self.ui_manager.back_btn.config(state='normal')
             else:
                 self.ui_manager.back_btn.config(state='disabled')
             
             # Enable forward button if we can go forward
-            if history_index < len(history) - 1:
+            if history.index < len(history.states) - 1:
                 self.ui_manager.forward_btn.config(state='normal')
             else:
                 self.ui_manager.forward_btn.config(state='disabled')
     
-    def _restore_state(self, state: Dict[str, Any]) -> None:
+    def _restore_state(self, state: State) -> None:
         """Restore application state from a history entry (same fractal only)."""
         # Restore fractal parameters
-        if state.get('fractal_params'):
-            self.fractal_params = state['fractal_params'].copy()
+        if state.fparams:
+            self.fractal_params = dict(state.fparams)
             self.ui_manager.create_fractal_params_ui()
         
         # Restore palette
-        if state.get('palette_name'):
-            self.palette_name = state['palette_name']
+        if state.palette:
+            self.palette_name = state.palette
             self.palette_var.set(self.palette_name)
             self.palette_storage[self.fractal_name] = self.palette_name
         
         # Restore iteration limit
-        if state.get('max_iter'):
-            self.max_iter = state['max_iter']
+        if state.max_iter:
+            self.max_iter = state.max_iter
             self.iter_storage[self.fractal_name] = self.max_iter
             self.iter_var.set(self.max_iter)
             self.iter_label.configure(text=str(self.max_iter))
         
         # Restore bounds
-        self.bounds_storage[self.fractal_name] = state['bounds'].copy()
+        xmin, xmax, ymin, ymax = state.bounds
+        self.set_bounds({'xmin': xmin, 'xmax': xmax, 'ymin': ymin, 'ymax': ymax})
         
         # Render
         self.render()
@@ -326,13 +320,9 @@ class FractalExplorer:
         
         # Switch to new fractal
         self.fractal_name = self.fractal_var.get()
+        self._safe_name = self._sanitize_filename(self.fractal_name)
         self.fractal_params = {}
         
-        # Initialize history for new fractal if needed
-        if self.fractal_name not in self.fractal_histories:
-            self.fractal_histories[self.fractal_name] = []
-            self.fractal_history_indices[self.fractal_name] = -1
-        
         # Update parameters UI
         self.ui_manager.create_fractal_params_ui()
         
@@ -484,15 +474,20 @@ class FractalExplorer:
         self.canvas.bind('<Motion>', self._on_mouse_move)
     
     def _on_mouse_move(self, event) -> None:
-        """Update status bar with mouse coordinates."""
+        """Record the pointer position and schedule a status bar update."""
+        self._last_mouse = (event.x, event.y)
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after(MOUSE_STATUS_INTERVAL_MS,
+                                                    self._flush_mouse_status)
+    
+    def _flush_mouse_status(self) -> None:
+        """Update status bar with the latest mouse coordinates."""
+        self._status_after_id = None
         try:
             # Convert screen coordinates to complex plane
-            bounds = self.get_bounds()
-            x_range = bounds['xmax'] - bounds['xmin']
-            y_range = bounds['ymax'] - bounds['ymin']
-            
-            x = bounds['xmin'] + (event.x / self.width) * x_range
-            y = bounds['ymax'] - (event.y / self.height) * y_range
+            mouse_x, mouse_y = self._last_mouse
+            x = self._px2cx_ox + mouse_x * self._px2cx_sx
+            y = self._px2cx_oy - mouse_y * self._px2cx_sy
             
             # Update status with coordinates
             self.status_var.set(f"Mouse: ({x:.6f}, {y:.6f})")
@@ -4,8 +4,42 @@ Fractal algorithms base module.
 Each fractal should inherit from FractalBase and implement compute_pixel().
 """
 
+import importlib
+import os
+import pkgutil
 from abc import ABC, abstractmethod
-from typing import Tuple, Dict, Any, Optional, Type
+from typing import Tuple, Dict, Any, Optional, Type, Callable
+
+import numpy as np
+
+try:
+    from numba import config as numba_config
+    # Render pools are forked after compiled kernels may have started Numba's
+    # threads; only the workqueue layer survives that cleanly. A layer chosen
+    # through NUMBA_THREADING_LAYER is left alone.
+    if "NUMBA_THREADING_LAYER" not in os.environ:
+        numba_config.THREADING_LAYER = "workqueue"
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Constants
+FLOAT32_MIN_PIXEL_SIZE: float = 1e-5  # float32 needs pixels this wide relative to |coordinates|
+NUMPY_BAND_PIXELS: int = 1 << 17  # Pixels per compute_image_numpy call, so working arrays stay in cache
+COMPACT_FRACTION: float = 0.25  # Escaped share of the working arrays that triggers dropping them
+KERNEL_LANES: int = 8  # Pixels iterated in lockstep by lane-blocked kernels (one SIMD block)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def linspace_jit(start: float, stop: float, num: int) -> np.ndarray:
+        """np.linspace for parallel Numba kernels.
+        
+        Numba's parallel=True version of np.linspace returns NaN for num=1,
+        so kernels get their axes from this serially compiled copy.
+        """
+        return np.linspace(start, stop, num)
 
 
 class FractalBase(ABC):
@@ -15,11 +49,24 @@ class FractalBase(ABC):
     name: str = "Base Fractal"
     description: str = "Base fractal class"
     parameters: Dict[str, Dict[str, Any]] = {}  # Parameter definitions
+    parallel_kernel: bool = False  # compute_image is a thread-parallel Numba kernel
     
     def __init__(self, **params):
         """Initialize with parameters."""
         self.params = params
     
+    def uses_parallel_kernel(self, bounds: Dict[str, float]) -> bool:
+        """
+        Whether compute_image over these bounds runs a thread-parallel kernel.
+        
+        Such renders fill all cores from one process, so the renderer calls
+        compute_image directly instead of spreading tiles over workers.
+        
+        Args:
+            bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+        """
+        return NUMBA_AVAILABLE and self.parallel_kernel
+    
     @abstractmethod
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """
@@ -34,6 +81,70 @@ class FractalBase(ABC):
         """
         pass
     
+    def compute_image(self, bounds: Dict[str, float], width: int, height: int,
+                      max_iter: int, backend: str = "auto",
+                      preview: bool = False) -> np.ndarray:
+        """
+        Compute pixel values for a whole viewport.
+        
+        Fractals with a compiled batch kernel override this; the default
+        is compute_image_numpy in float64. Previews (the renderer's
+        low-resolution quick look) may trade accuracy on the set boundary
+        for speed and iterate in float32 while the pixels are wide enough
+        for it (see preview_dtype). Compiled kernels are float64 either way,
+        so overrides only pass preview on to this NumPy fallback.
+        Large views go through it in bands of whole rows of about
+        NUMPY_BAND_PIXELS, so each band's working arrays stay in cache
+        across iterations instead of streaming from memory.
+        
+        Args:
+            bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+            width, height: Image dimensions
+            max_iter: Maximum iterations
+            backend: "auto", "cpu" or "cuda" (see fractals.cuda_kernels.use_cuda);
+                fractals without a CUDA kernel always run on the CPU
+            preview: Allow the float32 NumPy path; final renders keep float64
+            
+        Returns:
+            Float array of shape (height, width) with row 0 at ymax
+        """
+        dtype = preview_dtype(bounds, width, height) if preview else np.float64
+        rows = max(1, NUMPY_BAND_PIXELS // max(1, width))
+        if height <= rows:
+            return self.compute_image_numpy(bounds, width, height, max_iter, dtype=dtype)
+        
+        # Band bounds come from the rows of the whole view, as render tiles do
+        y = np.linspace(bounds["ymin"], bounds["ymax"], height)[::-1]
+        values = np.empty((height, width), dtype=np.float64)
+        for start in range(0, height, rows):
+            end = min(height, start + rows)
+            band = {"xmin": bounds["xmin"], "xmax": bounds["xmax"],
+                    "ymin": float(y[end - 1]), "ymax": float(y[start])}
+            values[start:end] = self.compute_image_numpy(band, width, end - start, max_iter,
+                                                         dtype=dtype)
+        return values
+    
+    def compute_image_numpy(self, bounds: Dict[str, float], width: int, height: int,
+                            max_iter: int, dtype: type = np.float64) -> np.ndarray:
+        """
+        Compute pixel values for a whole viewport without compiled code.
+        
+        Fractals that can iterate whole arrays override this (usually with
+        escape_time_numpy); the default calls compute_pixel once per pixel.
+        Arguments and result are as for compute_image, plus dtype, the float
+        type of the working arrays (np.float32 for the renderer's quick look,
+        see preview_dtype and rendering.parallel.compute_fractal_preview).
+        The per-pixel default always iterates in float64.
+        """
+        # Python floats: scalar arithmetic on NumPy float64s is several times slower
+        x = np.linspace(bounds["xmin"], bounds["xmax"], width).tolist()
+        y = np.linspace(bounds["ymin"], bounds["ymax"], height).tolist()
+        values = np.empty((height, width), dtype=np.float64)
+        for i in range(height):
+            y_coord = y[height - 1 - i]
+            values[i] = [self.compute_pixel(x_coord, y_coord, max_iter) for x_coord in x]
+        return values
+    
     def get_default_bounds(self) -> Dict[str, float]:
         """Return default viewport bounds."""
         return {"xmin": -2.0, "xmax": 2.0, "ymin": -2.0, "ymax": 2.0}
@@ -51,13 +162,17 @@ class FractalRegistry:
     """Registry for fractal implementations."""
     
     _fractals: Dict[str, Type[FractalBase]] = {}
+    _sorted_names: Optional[list] = None  # Sorted fractal names, rebuilt after register
     
     @classmethod
     def register(cls, name: str, fractal_class: Type[FractalBase]):
         """Register a fractal implementation."""
         if not issubclass(fractal_class, FractalBase):
             raise ValueError(f"Fractal must inherit from FractalBase: {fractal_class}")
+        # Default bounds are read once here so lookups never build an instance
+        fractal_class._default_bounds = fractal_class().get_default_bounds()
         cls._fractals[name] = fractal_class
+        cls._sorted_names = None
     
     @classmethod
     def get(cls, name: str) -> Optional[Type[FractalBase]]:
@@ -67,7 +182,9 @@ class FractalRegistry:
     @classmethod
     def list_fractals(cls) -> list:
         """List all registered fractal names."""
-        return sorted(cls._fractals.keys())
+        if cls._sorted_names is None:
+            cls._sorted_names = sorted(cls._fractals.keys())
+        return list(cls._sorted_names)
     
     @classmethod
     def create(cls, name: str, **params) -> FractalBase:
@@ -76,6 +193,17 @@ class FractalRegistry:
         if fractal_class is None:
             raise ValueError(f"Unknown fractal: {name}")
         return fractal_class(**params)
+    
+    @classmethod
+    def default_bounds(cls, name: str) -> Dict[str, float]:
+        """Get a fractal's default bounds without creating an instance.
+        
+        Returns a fresh copy each call, since callers adjust bounds in place.
+        """
+        fractal_class = cls.get(name)
+        if fractal_class is None:
+            raise ValueError(f"Unknown fractal: {name}")
+        return fractal_class._default_bounds.copy()
 
 
 # Decorator for easy registration
@@ -102,3 +230,147 @@ def parse_complex_string(s: str) -> complex:
     if s.endswith("j") and not any(c in s for c in "+-"):
         s = s[:-1]
     return complex(s)
+
+
+def coordinate_grid(bounds: Dict[str, float], width: int,
+                    height: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build the real and imaginary coordinate of every pixel in a viewport.
+    
+    Only one row of x and one column of y are computed; the full grids are
+    broadcast views of them, so this is cheap enough to call per tile.
+    
+    Args:
+        bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+        width, height: Image dimensions
+        
+    Returns:
+        (x, y) float64 arrays of shape (height, width) with row 0 at ymax
+    """
+    x = np.linspace(bounds["xmin"], bounds["xmax"], width)
+    y = np.linspace(bounds["ymin"], bounds["ymax"], height)[::-1]
+    return (np.broadcast_to(x[None, :], (height, width)),
+            np.broadcast_to(y[:, None], (height, width)))
+
+
+def preview_dtype(bounds: Dict[str, float], width: int, height: int) -> type:
+    """
+    Pick the cheapest float type that still resolves a viewport's pixels.
+    
+    float32 halves the memory traffic of the NumPy iteration, but its 24-bit
+    mantissa quantizes coordinates visibly once pixels shrink toward its
+    spacing (after a zoom of a few hundred times into the default views).
+    
+    Args:
+        bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+        width, height: Image dimensions
+        
+    Returns:
+        np.float32 while pixels are at least FLOAT32_MIN_PIXEL_SIZE wide
+        relative to the largest coordinate, else np.float64
+    """
+    pixel = min((bounds["xmax"] - bounds["xmin"]) / width,
+                (bounds["ymax"] - bounds["ymin"]) / height)
+    scale = max(1.0, abs(bounds["xmin"]), abs(bounds["xmax"]),
+                abs(bounds["ymin"]), abs(bounds["ymax"]))
+    return np.float32 if pixel >= FLOAT32_MIN_PIXEL_SIZE * scale else np.float64
+
+
+def count_dtype(max_iter: int) -> type:
+    """Smallest unsigned integer type that holds iteration counts up to max_iter."""
+    return np.uint16 if max_iter <= np.iinfo(np.uint16).max else np.uint32
+
+
+def smooth_counts(counts: np.ndarray, mag2: np.ndarray, max_iter: int,
+                  degree: float = 2.0) -> np.ndarray:
+    """
+    Turn escape iterations into smooth (fractional) counts.
+    
+    Args:
+        counts: Integer array with the iteration at which each orbit escaped,
+            max_iter where it never did
+        mag2: |z|² at escape, same shape as counts (ignored where not escaped)
+        max_iter: Maximum iterations
+        degree: Polynomial degree used for the smoothing logarithm
+        
+    Returns:
+        Float64 array of counts' shape; max_iter where the orbit never escaped
+    """
+    values = counts.astype(np.float64)
+    escaped = counts < max_iter
+    log_degree = np.log(degree)
+    log_zn = 0.5 * np.log(mag2[escaped].astype(np.float64))
+    values[escaped] += 1 - np.log(log_zn / log_degree) / log_degree
+    return values
+
+
+def escape_time_numpy(zr: np.ndarray, zi: np.ndarray, cr, ci, max_iter: int,
+                      step: Callable[..., Tuple[np.ndarray, np.ndarray]],
+                      degree: float = 2.0, smooth: bool = True,
+                      dtype: type = np.float64) -> np.ndarray:
+    """
+    Run an escape-time iteration over whole arrays.
+    
+    Real and imaginary parts live in separate float arrays, so every step
+    is plain float arithmetic that NumPy runs through its SIMD loops. Escaped
+    pixels (|z| > 2) are masked out and keep iterating until COMPACT_FRACTION
+    of the working arrays has escaped, then dropped in one compaction, so
+    steps mostly touch running orbits without copying the arrays on every
+    iteration that has an escape. Escapes are recorded as an integer count
+    and a float32 |z|² and smoothed in one pass at the end.
+    
+    Args:
+        zr, zi: Starting values, float arrays of any (shared) shape
+        cr, ci: Constant term, float arrays of zr's shape or scalars
+        max_iter: Maximum iterations
+        step: Function(zr, zi, cr, ci) -> (zr, zi) for the next iteration
+        degree: Polynomial degree used for the smoothing logarithm
+        smooth: Return smooth (fractional) counts, or the escape iteration
+        dtype: Float type of the working arrays; np.float32 packs twice as
+            many values per SIMD register and halves the memory traffic
+        
+    Returns:
+        Float64 array of zr's shape; max_iter where the orbit never escaped
+    """
+    shape = np.shape(zr)
+    zr = np.array(zr, dtype=dtype).ravel()
+    zi = np.array(zi, dtype=dtype).ravel()
+    cr = np.broadcast_to(np.asarray(cr, dtype=dtype), shape).ravel()
+    ci = np.broadcast_to(np.asarray(ci, dtype=dtype), shape).ravel()
+    active = np.arange(zr.size)
+    running = np.ones(zr.size, dtype=bool)
+    num_running = zr.size
+    counts = np.full(zr.size, max_iter, dtype=count_dtype(max_iter))
+    escape_mag2 = np.zeros(zr.size, dtype=np.float32)
+    
+    # Masked-out orbits may overflow before they are dropped
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            escaped = mag2 > 4.0
+            escaped &= running
+            if escaped.any():
+                counts[active[escaped]] = i
+                escape_mag2[active[escaped]] = mag2[escaped]
+                running &= ~escaped
+                num_running -= np.count_nonzero(escaped)
+                if not num_running:
+                    break
+                if num_running <= (1.0 - COMPACT_FRACTION) * running.size:
+                    zr, zi, active = zr[running], zi[running], active[running]
+                    cr, ci = cr[running], ci[running]
+                    running = np.ones(num_running, dtype=bool)
+            zr, zi = step(zr, zi, cr, ci)
+    
+    if not smooth:
+        return counts.astype(np.float64).reshape(shape)
+    return smooth_counts(counts, escape_mag2, max_iter, degree).reshape(shape)
+
+
+def _autoload() -> None:
+    """Import every module in this package so its @register_fractal classes register."""
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module(f"{__name__}.{module.name}")
+
+
+_autoload()
@@ -4,6 +4,38 @@ import numpy as np
 from . import register_fractal
 from .ifs_base import IFSFractalBase
 
+# Affine maps as rows of (a, b, c, d, e, f):
+# x' = a*x + b*y + e, y' = c*x + d*y + f
+FERN_MAPS = np.array([
+    [0.0, 0.0, 0.0, 0.16, 0.0, 0.0],        # Stem (1%)
+    [0.85, 0.04, -0.04, 0.85, 0.0, 1.6],    # Leaflets (85%)
+    [0.2, -0.26, 0.23, 0.22, 0.0, 1.6],     # Left leaflet (7%)
+    [-0.15, 0.28, 0.26, 0.24, 0.0, 0.44],   # Right leaflet (7%)
+])
+FERN_CUM_PROBS = np.array([0.01, 0.86, 0.93, 1.0])
+
+# Per-variant (maps, cumulative probabilities), selected once per instance
+VARIANT_TABLES = {
+    "tree": (np.array([
+        [0.0, 0.0, 0.0, 0.5, 0.0, 0.0],
+        [0.6, 0.0, 0.0, 0.6, 0.0, 2.0],
+        [0.4, 0.3, -0.3, 0.4, -1.0, 1.0],
+        [0.4, -0.3, 0.3, 0.4, 1.0, 1.0],
+    ]), np.array([0.05, 0.5, 0.75, 1.0])),
+    "spiral": (np.array([
+        [0.0, 0.0, 0.0, 0.16, 0.0, 0.0],
+        [0.85, 0.02, -0.02, 0.85, 0.0, 1.6],
+        [0.09, -0.28, 0.3, 0.11, 0.0, 1.6],
+        [-0.09, 0.28, 0.3, 0.09, 0.0, 0.44],
+    ]), np.array([0.01, 0.86, 0.93, 1.0])),
+    "crystal": (np.array([
+        [0.0, 0.0, 0.0, 0.25, 0.0, -0.4],
+        [0.95, 0.005, -0.005, 0.93, -0.002, 0.5],
+        [0.035, -0.2, 0.16, 0.04, -0.09, 0.02],
+        [-0.04, 0.2, 0.16, 0.04, 0.083, 0.12],
+    ]), np.array([0.02, 0.86, 0.93, 1.0])),
+}
+
 
 @register_fractal("barnsley_fern")
 class BarnsleyFernFractal(IFSFractalBase):
@@ -20,6 +52,8 @@ class BarnsleyFernFractal(IFSFractalBase):
             "description": "Number of points to generate"
         }
     }
+    _affine_maps = FERN_MAPS
+    _cum_probs = FERN_CUM_PROBS
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -33,26 +67,6 @@ class BarnsleyFernFractal(IFSFractalBase):
     def get_default_bounds(self):
         return {"xmin": -3.0, "xmax": 3.0, "ymin": -1.0, "ymax": 11.0}
     
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply one iteration of Barnsley fern IFS."""
-        r = np.random.random()
-        
-        if r < 0.01:
-            # Stem (1%)
-            return (0.0, 0.16 * y)
-        elif r < 0.86:
-            # Leaflets (85%)
-            return (0.85 * x + 0.04 * y,
-                   -0.04 * x + 0.85 * y + 1.6)
-        elif r < 0.93:
-            # Left leaflet (7%)
-            return (0.2 * x - 0.26 * y,
-                   0.23 * x + 0.22 * y + 1.6)
-        else:
-            # Right leaflet (7%)
-            return (-0.15 * x + 0.28 * y,
-                   0.26 * x + 0.24 * y + 0.44)
-    
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Not used for IFS - render_to_image is used instead."""
         return 0.0
@@ -88,52 +102,12 @@ class BarnsleyFernVariantFractal(IFSFractalBase):
             self.num_points = 100000
         self.num_points = max(10000, min(500000, self.num_points))
         self.variant = self.params.get("variant", "tree")
+        self._affine_maps, self._cum_probs = VARIANT_TABLES.get(
+            self.variant, VARIANT_TABLES["crystal"])
     
     def get_default_bounds(self):
         return {"xmin": -5.0, "xmax": 5.0, "ymin": -2.0, "ymax": 12.0}
     
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply variant IFS transformation."""
-        r = np.random.random()
-        
-        if self.variant == "tree":
-            # Tree-like
-            if r < 0.05:
-                return (0.0, 0.5 * y)
-            elif r < 0.5:
-                return (0.6 * x, 0.6 * y + 2.0)
-            elif r < 0.75:
-                return (0.4 * x + 0.3 * y - 1.0, -0.3 * x + 0.4 * y + 1.0)
-            else:
-                return (0.4 * x - 0.3 * y + 1.0, 0.3 * x + 0.4 * y + 1.0)
-        
-        elif self.variant == "spiral":
-            # Spiral fern
-            if r < 0.01:
-                return (0.0, 0.16 * y)
-            elif r < 0.86:
-                return (0.85 * x + 0.02 * y,
-                       -0.02 * x + 0.85 * y + 1.6)
-            elif r < 0.93:
-                return (0.09 * x - 0.28 * y,
-                       0.3 * x + 0.11 * y + 1.6)
-            else:
-                return (-0.09 * x + 0.28 * y,
-                       0.3 * x + 0.09 * y + 0.44)
-        
-        else:  # crystal
-            if r < 0.02:
-                return (0.0, 0.25 * y - 0.4)
-            elif r < 0.86:
-                return (0.95 * x + 0.005 * y - 0.002,
-                       -0.005 * x + 0.93 * y + 0.5)
-            elif r < 0.93:
-                return (0.035 * x - 0.2 * y - 0.09,
-                       0.16 * x + 0.04 * y + 0.02)
-            else:
-                return (-0.04 * x + 0.2 * y + 0.083,
-                       0.16 * x + 0.04 * y + 0.12)
-    
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Not used for IFS - render_to_image is used instead."""
         return 0.0
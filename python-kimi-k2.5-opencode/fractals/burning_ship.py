@@ -1,7 +1,49 @@
 """Burning Ship fractal implementation."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, escape_time_numpy, register_fractal, NUMBA_AVAILABLE
+from . import cuda_kernels
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _burning_ship_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Escape-time values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                zr = 0.0
+                zi = 0.0
+                value = float(max_iter)
+                for i in range(max_iter):
+                    mag2 = zr * zr + zi * zi
+                    if mag2 > 4.0:
+                        log_zn = 0.5 * np.log(mag2)
+                        value = i + 1 - np.log(log_zn / np.log(2.0)) / np.log(2.0)
+                        break
+                    zr, zi = zr * zr - zi * zi + cr, 2.0 * abs(zr) * abs(zi) + ci
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _burning_ship_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
+
+
+def _burning_ship_step(zr, zi, cr, ci):
+    """One Burning Ship step over arrays: (|Re(z)| + i|Im(z)|)² + c."""
+    return zr * zr - zi * zi + cr, 2.0 * np.abs(zr * zi) + ci
 
 
 @register_fractal("burning_ship")
@@ -11,20 +53,47 @@ class BurningShipFractal(FractalBase):
     name = "Burning Ship"
     description = "z = (|Re(z)| + i|Im(z)|)² + c"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.5, "ymin": -2.0, "ymax": 1.0}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Burning Ship iteration with smooth coloring."""
-        c = complex(x, y)
-        z = 0j
+        zr = zi = 0.0
+        saved_r, saved_i = zr, zi  # Periodicity check
+        period = save_at = PERIOD_START
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(2)) / np.log(2)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                log_zn = 0.5 * math.log(zr2 + zi2)
+                nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                 return i + 1 - nu
-            z = (abs(z.real) + 1j * abs(z.imag)) ** 2 + c
+            zi = 2.0 * abs(zr * zi) + y
+            zr = zr2 - zi2 + x
+            dr = zr - saved_r
+            di = zi - saved_i
+            if dr * dr + di * di < PERIODICITY_EPS:
+                return max_iter
+            if i == save_at:
+                saved_r, saved_i = zr, zi
+                period = min(2 * period, PERIOD_MAX)
+                save_at += period
         
         return max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if cuda_kernels.use_cuda(backend, width, height):
+            return cuda_kernels.compute_image_cuda(cuda_kernels.burning_ship_kernel, bounds, width,
+                                                   height, max_iter)
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _burning_ship_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                                    bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        return escape_time_numpy(0.0 * cr, 0.0 * ci, cr, ci, max_iter, _burning_ship_step,
+                                 dtype=dtype)
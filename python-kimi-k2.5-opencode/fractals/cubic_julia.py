@@ -1,7 +1,49 @@
 """Cubic Julia set implementation."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal, parse_complex_string
+from . import FractalBase, coordinate_grid, escape_time_numpy, register_fractal, parse_complex_string, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+_INV_LOG3: float = 1.0 / math.log(3.0)  # Smooth-coloring log base
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _cubic_julia_kernel(xmin, xmax, ymin, ymax, width, height, max_iter, cr, ci):
+        """Escape-time values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            for col in range(width):
+                zr = xs[col]
+                zi = ys[height - 1 - row]
+                value = float(max_iter)
+                for i in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 > 4.0:
+                        log_zn = 0.5 * np.log(zr2 + zi2)
+                        value = i + 1 - np.log(log_zn / np.log(3.0)) / np.log(3.0)
+                        break
+                    zr, zi = zr * (zr2 - 3.0 * zi2) + cr, zi * (3.0 * zr2 - zi2) + ci
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _cubic_julia_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 0.0, 0.0)
+
+
+def _cubic_julia_step(zr, zi, cr, ci):
+    """One cubic Julia step over arrays: z³ + c on separate real/imaginary parts."""
+    zr2 = zr * zr
+    zi2 = zi * zi
+    return zr * (zr2 - 3.0 * zi2) + cr, zi * (3.0 * zr2 - zi2) + ci
 
 
 @register_fractal("cubic_julia")
@@ -17,6 +59,7 @@ class CubicJuliaFractal(FractalBase):
             "description": "Complex constant c"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -27,13 +70,38 @@ class CubicJuliaFractal(FractalBase):
         return {"xmin": -1.5, "xmax": 1.5, "ymin": -1.5, "ymax": 1.5}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        z = complex(x, y)
+        zr, zi = x, y
+        cr, ci = self.c.real, self.c.imag
+        saved_r, saved_i = zr, zi  # Periodicity check
+        period = save_at = PERIOD_START
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(3)) / np.log(3)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                log_zn = 0.5 * math.log(zr2 + zi2)
+                nu = math.log(log_zn * _INV_LOG3) * _INV_LOG3
                 return i + 1 - nu
-            z = z ** 3 + self.c
+            zr, zi = zr * (zr2 - 3.0 * zi2) + cr, zi * (3.0 * zr2 - zi2) + ci
+            dr = zr - saved_r
+            di = zi - saved_i
+            if dr * dr + di * di < PERIODICITY_EPS:
+                return max_iter
+            if i == save_at:
+                saved_r, saved_i = zr, zi
+                period = min(2 * period, PERIOD_MAX)
+                save_at += period
         
         return max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _cubic_julia_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                                   bounds["ymax"], width, height, max_iter,
+                                   self.c.real, self.c.imag)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        zr, zi = coordinate_grid(bounds, width, height)
+        return escape_time_numpy(zr, zi, self.c.real, self.c.imag, max_iter,
+                                 _cubic_julia_step, degree=3, dtype=dtype)
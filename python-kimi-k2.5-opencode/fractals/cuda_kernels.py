@@ -0,0 +1,169 @@
+"""CUDA escape-time kernels for large renders (optional, needs a CUDA GPU)."""
+
+import math
+import numpy as np
+from typing import Dict
+
+try:
+    from numba import cuda
+    CUDA_AVAILABLE = cuda.is_available()
+except ImportError:
+    CUDA_AVAILABLE = False
+
+# Constants
+CUDA_THREADS_PER_BLOCK = (16, 16)
+CUDA_MIN_PIXELS: int = 1920 * 1080  # Smaller grids finish sooner on the CPU kernels
+CUDA_FASTMATH: bool = True  # Set False to compare results closely with the CPU kernels
+BACKENDS = ("auto", "cpu", "cuda")
+
+
+if CUDA_AVAILABLE:
+    @cuda.jit(device=True, fastmath=CUDA_FASTMATH)
+    def _smooth(i, mag2, log_degree):
+        """Smooth escape count from the squared magnitude at escape."""
+        log_zn = 0.5 * math.log(mag2)
+        return i + 1 - math.log(log_zn / log_degree) / log_degree
+
+    @cuda.jit(fastmath=CUDA_FASTMATH)
+    def mandelbrot_kernel(out, xmin, dx, ymin, dy, max_iter):
+        """One thread per pixel of z = z² + c, with z0 = 0 and c the pixel."""
+        ix, iy = cuda.grid(2)
+        height, width = out.shape
+        if ix >= width or iy >= height:
+            return
+        cr = xmin + ix * dx
+        ci = ymin + (height - 1 - iy) * dy
+        # Main cardioid and period-2 bulb never escape
+        xq = cr - 0.25
+        q = xq * xq + ci * ci
+        if q * (q + xq) <= 0.25 * ci * ci or (cr + 1) * (cr + 1) + ci * ci <= 0.0625:
+            out[iy, ix] = max_iter
+            return
+        zr = 0.0
+        zi = 0.0
+        value = float(max_iter)
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                value = _smooth(i, mag2, math.log(2.0))
+                break
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+        out[iy, ix] = value
+
+    @cuda.jit(fastmath=CUDA_FASTMATH)
+    def julia_kernel(out, xmin, dx, ymin, dy, max_iter, cr, ci):
+        """One thread per pixel of z = z² + c, with z0 the pixel and c fixed."""
+        ix, iy = cuda.grid(2)
+        height, width = out.shape
+        if ix >= width or iy >= height:
+            return
+        zr = xmin + ix * dx
+        zi = ymin + (height - 1 - iy) * dy
+        value = float(max_iter)
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                value = _smooth(i, mag2, math.log(2.0))
+                break
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+        out[iy, ix] = value
+
+    @cuda.jit(fastmath=CUDA_FASTMATH)
+    def burning_ship_kernel(out, xmin, dx, ymin, dy, max_iter):
+        """One thread per pixel of z = (|Re(z)| + i|Im(z)|)² + c."""
+        ix, iy = cuda.grid(2)
+        height, width = out.shape
+        if ix >= width or iy >= height:
+            return
+        cr = xmin + ix * dx
+        ci = ymin + (height - 1 - iy) * dy
+        zr = 0.0
+        zi = 0.0
+        value = float(max_iter)
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                value = _smooth(i, mag2, math.log(2.0))
+                break
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * abs(zr * zi) + ci
+        out[iy, ix] = value
+
+    @cuda.jit(fastmath=CUDA_FASTMATH)
+    def multibrot_kernel(out, xmin, dx, ymin, dy, max_iter, power):
+        """One thread per pixel of z = z^power + c."""
+        ix, iy = cuda.grid(2)
+        height, width = out.shape
+        if ix >= width or iy >= height:
+            return
+        cr = xmin + ix * dx
+        ci = ymin + (height - 1 - iy) * dy
+        zr = 0.0
+        zi = 0.0
+        value = float(max_iter)
+        for i in range(max_iter):
+            mag2 = zr * zr + zi * zi
+            if mag2 > 4.0:
+                value = _smooth(i, mag2, math.log(float(power)))
+                break
+            # z ** power by square-and-multiply
+            br = zr
+            bi = zi
+            pr = 1.0
+            pi = 0.0
+            n = power
+            while n:
+                if n & 1:
+                    pr, pi = pr * br - pi * bi, pr * bi + pi * br
+                n >>= 1
+                if n:
+                    br, bi = br * br - bi * bi, 2.0 * br * bi
+            zr = pr + cr
+            zi = pi + ci
+        out[iy, ix] = value
+
+
+def use_cuda(backend: str, width: int, height: int) -> bool:
+    """
+    Decide whether a render should run on the GPU.
+
+    Args:
+        backend: "cuda" (GPU), "cpu" (never the GPU), or "auto" (the GPU
+            when one is present and the grid has at least CUDA_MIN_PIXELS)
+        width, height: Image dimensions
+
+    Returns:
+        True to run on the GPU
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend: {backend}")
+    if backend == "cuda":
+        if not CUDA_AVAILABLE:
+            raise ValueError("CUDA backend requested but no CUDA device is available")
+        return True
+    return backend == "auto" and CUDA_AVAILABLE and width * height >= CUDA_MIN_PIXELS
+
+
+def compute_image_cuda(kernel, bounds: Dict[str, float], width: int, height: int,
+                       max_iter: int, *args) -> np.ndarray:
+    """
+    Launch an escape-time kernel over a viewport and copy the values back.
+
+    Pixel coordinates follow np.linspace over the bounds, as on the CPU.
+
+    Args:
+        kernel: One of the *_kernel functions in this module
+        bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+        width, height: Image dimensions
+        max_iter: Maximum iterations
+        *args: Extra kernel arguments (Julia constant, Multibrot power)
+
+    Returns:
+        Float array of shape (height, width) with row 0 at ymax
+    """
+    dx = (bounds["xmax"] - bounds["xmin"]) / max(1, width - 1)
+    dy = (bounds["ymax"] - bounds["ymin"]) / max(1, height - 1)
+    out = cuda.device_array((height, width), dtype=np.float64)
+    blocks = (-(-width // CUDA_THREADS_PER_BLOCK[0]), -(-height // CUDA_THREADS_PER_BLOCK[1]))
+    kernel[blocks, CUDA_THREADS_PER_BLOCK](out, bounds["xmin"], dx, bounds["ymin"], dy,
+                                           max_iter, *args)
+    return out.copy_to_host()
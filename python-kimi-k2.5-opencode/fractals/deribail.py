@@ -1,7 +1,10 @@
 """Derivative bailout (deribail) Mandelbrot implementation."""
 
-import numpy as np
+import math
 from . import FractalBase, register_fractal
+from .mandelbrot_utils import in_main_body
+
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
 
 
 @register_fractal("mandelbrot_deribail")
@@ -34,6 +37,7 @@ class MandelbrotDeribailFractal(FractalBase):
         except (ValueError, TypeError):
             self.bailout = 100.0
         self.bailout = max(10.0, min(1000.0, self.bailout))
+        self._inv_log_bailout = 1.0 / math.log(self.bailout + 1)
         
         try:
             self.blend = float(self.params.get("blend", 0.5))
@@ -46,65 +50,64 @@ class MandelbrotDeribailFractal(FractalBase):
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Mandelbrot with derivative bailout."""
-        c = complex(x, y)
-        z = 0
-        dz = 0  # Derivative dz/dc
+        # With the standard bailout alone, main-body points never escape.
+        # Any derivative weight can bail inside, where |dz/dc| grows large.
+        if self.blend < 0.01 and in_main_body(x, y):
+            return float(max_iter)
+        
+        zr = zi = 0.0
+        dzr = dzi = 0.0  # Derivative dz/dc
+        bailout2 = self.bailout * self.bailout
         
         for i in range(max_iter):
-            # Standard bailout condition
-            z_mag = abs(z)
-            
-            # Derivative bailout condition
-            dz_mag = abs(dz)
-            
-            # Check for NaN or infinity
-            if np.isnan(z_mag) or np.isinf(z_mag) or np.isnan(dz_mag) or np.isinf(dz_mag):
-                return float(i)
+            # Squared magnitudes; square roots are only taken where needed
+            z_mag2 = zr * zr + zi * zi
+            dz_mag2 = dzr * dzr + dzi * dzi
             
-            # Cap values to prevent overflow
-            if z_mag > 1e10 or dz_mag > 1e10:
+            # Cap values to prevent overflow (NaN and infinity fail too)
+            if not (z_mag2 <= 1e20 and dz_mag2 <= 1e20):
                 return float(i)
             
             # Blended bailout: combination of both
             if self.blend < 0.01:
                 # Pure standard bailout
-                bail = z_mag > 2
+                bail = z_mag2 > 4.0
             elif self.blend > 0.99:
                 # Pure derivative bailout
-                bail = dz_mag > self.bailout
+                bail = dz_mag2 > bailout2
             else:
                 # Blended condition
-                z_factor = z_mag / 2.0
-                dz_factor = dz_mag / self.bailout
+                z_factor = math.sqrt(z_mag2) / 2.0
+                dz_factor = math.sqrt(dz_mag2) / self.bailout
                 bail = (1 - self.blend) * z_factor + self.blend * dz_factor > 1
             
             if bail:
                 # For smooth coloring, we need |z| > 2
                 # If bailed due to derivative, we might have |z| < 2
                 # In that case, just return the iteration count
-                if z_mag <= 2:
+                if z_mag2 <= 4.0:
                     return float(i)
                 
                 # Standard smooth iteration
-                log_zn = np.log(z_mag)
-                nu = np.log(log_zn / np.log(2)) / np.log(2)
+                log_zn = 0.5 * math.log(z_mag2)
+                nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                 
                 # Mix in derivative information for coloring
-                if dz_mag > 0:
-                    dz_contrib = np.log(dz_mag + 1) / np.log(self.bailout + 1)
+                if dz_mag2 > 0:
+                    dz_contrib = math.log(math.sqrt(dz_mag2) + 1) * self._inv_log_bailout
                 else:
                     dz_contrib = 0
                 
                 # Return blended value
                 result = (i + 1 - nu) * (1 + self.blend * dz_contrib)
                 # Ensure we return a valid float
-                if np.isnan(result) or np.isinf(result):
+                if not math.isfinite(result):
                     return float(i)
                 return float(result)
             
-            # Update z and dz
-            dz = 2 * z * dz + 1
-            z = z * z + c
+            # Update dz = 2 z dz + 1 and z = z^2 + c
+            dzr, dzi = 2.0 * (zr * dzr - zi * dzi) + 1.0, 2.0 * (zr * dzi + zi * dzr)
+            zr, zi = zr * zr - zi * zi + x, 2.0 * zr * zi + y
         
         # Did not escape
         return float(max_iter)
@@ -1,7 +1,10 @@
 """Exterior distance estimation for Mandelbrot set."""
 
-import numpy as np
+import math
 from . import FractalBase, register_fractal
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS, in_main_body
+
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
 
 
 @register_fractal("mandelbrot_exterior")
@@ -37,20 +40,26 @@ class MandelbrotExteriorFractal(FractalBase):
         Uses the analytic distance estimate formula:
         distance ≈ |z| * log|z| / |dz/dc|
         """
-        c = complex(x, y)
-        z = 0
-        dz = 0  # Derivative of z with respect to c
+        if in_main_body(x, y):
+            return max_iter
+        
+        zr = zi = 0.0
+        dzr = dzi = 0.0  # Derivative of z with respect to c
+        saved_r, saved_i = zr, zi  # Periodicity check
+        period = save_at = PERIOD_START
         
         for i in range(max_iter):
-            if abs(z) > 2:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
                 # Compute exterior distance estimate
                 # Formula: distance ≈ |z| * log|z| / |dz/dc|
-                abs_z = abs(z)
-                abs_dz = abs(dz)
+                abs_z = math.sqrt(zr2 + zi2)
+                abs_dz = math.hypot(dzr, dzi)
                 
                 if abs_dz > 1e-10:
                     # Distance estimate
-                    distance = abs_z * np.log(abs_z) / abs_dz
+                    distance = abs_z * math.log(abs_z) / abs_dz
                     
                     # Normalize for coloring
                     # Scale distance and apply power for contrast adjustment
@@ -62,14 +71,23 @@ class MandelbrotExteriorFractal(FractalBase):
                     return val
                 else:
                     # Fallback to regular iteration count
-                    log_zn = np.log(abs_z)
-                    nu = np.log(log_zn / np.log(2)) / np.log(2)
+                    log_zn = math.log(abs_z)
+                    nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                     return i + 1 - nu
             
             # Update z and dz
             # dz = 2*z*dz + 1
-            dz = 2 * z * dz + 1
-            z = z * z + c
+            dzr, dzi = 2.0 * (zr * dzr - zi * dzi) + 1.0, 2.0 * (zr * dzi + zi * dzr)
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
+            dr = zr - saved_r
+            di = zi - saved_i
+            if dr * dr + di * di < PERIODICITY_EPS:
+                return max_iter
+            if i == save_at:
+                saved_r, saved_i = zr, zi
+                period = min(2 * period, PERIOD_MAX)
+                save_at += period
         
         # Did not escape - inside the set
         return max_iter
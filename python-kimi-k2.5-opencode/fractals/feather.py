@@ -1,7 +1,48 @@
 """Feather fractal implementation."""
 
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, escape_time_numpy, register_fractal, NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _feather_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Escape-time values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                c2 = cr * cr + ci * ci
+                value = float(max_iter)
+                if c2 >= 1e-20:
+                    # z / c = z * conj(c) / |c|^2
+                    ir = cr / c2
+                    ii = -ci / c2
+                    zr = cr
+                    zi = ci
+                    for i in range(max_iter):
+                        if zr * zr + zi * zi > 4.0:
+                            value = float(i)
+                            break
+                        zr, zi = (zr * zr - zi * zi + zr * ir - zi * ii,
+                                  2.0 * zr * zi + zr * ii + zi * ir)
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _feather_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
+
+
+def _feather_step(zr, zi, ir, ii):
+    """One Feather step over arrays: z² + z * (1/c), with 1/c given as (ir, ii)."""
+    return zr * zr - zi * zi + zr * ir - zi * ii, 2.0 * zr * zi + zr * ii + zi * ir
 
 
 @register_fractal("feather")
@@ -11,21 +52,42 @@ class FeatherFractal(FractalBase):
     name = "Feather"
     description = "z = z² + z/c"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 2.5, "ymin": -2.5, "ymax": 2.5}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        c = complex(x, y)
-        if abs(c) < 1e-10:
+        c2 = x * x + y * y
+        if c2 < 1e-20:
             return float(max_iter)
         
+        # z / c = z * (1/c), with 1/c = conj(c) / |c|^2
+        ir, ii = x / c2, -y / c2
+        
         # Start with z = c instead of z = 0 to avoid staying at 0
-        z = c
+        zr, zi = x, y
         
         for i in range(max_iter):
-            if abs(z) > 2:
+            if zr * zr + zi * zi > 4.0:
                 return float(i)
-            z = z * z + z / c
+            zr, zi = zr * zr - zi * zi + zr * ir - zi * ii, 2.0 * zr * zi + zr * ii + zi * ir
         
         return float(max_iter)
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _feather_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                               bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        c2 = cr * cr + ci * ci
+        # c = 0 has no 1/c; starting from z = 0 there keeps it at 0 (max_iter)
+        origin = c2 < 1e-20
+        c2 = np.where(origin, 1.0, c2)
+        zr = np.where(origin, 0.0, cr)
+        zi = np.where(origin, 0.0, ci)
+        return escape_time_numpy(zr, zi, cr / c2, -ci / c2, max_iter, _feather_step,
+                                 smooth=False, dtype=dtype)
@@ -1,20 +1,112 @@
 """IFS (Iterated Function System) fractal base and renderer."""
 
 import numpy as np
-from abc import abstractmethod
-from typing import Dict, Tuple
-from . import FractalBase
+from typing import Dict, Optional, Tuple
+from . import FractalBase, NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import get_num_threads, njit, prange
 
 # Constants
 IFS_SKIP_ITERATIONS: int = 20
 DEFAULT_IFS_POINTS: int = 100000
 IFS_GAMMA: float = 0.5
 IFS_COLOR_TINT: Tuple[float, float, float] = (0.3, 0.9, 0.2)  # RGB multipliers
+IFS_CHAINS: int = 1024  # Independent chains advanced together without Numba
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _affine_generate(maps, cum_probs, n, seed, streams):
+        """Run an affine chaos game for n points as independent parallel streams.
+        
+        Stream s fills its own contiguous slice of the output from a
+        generator seeded with seed + s, so the result only depends on the
+        arguments and not on how streams are scheduled onto threads. The
+        output has shape (2, n): one contiguous row of x and one of y.
+        """
+        points = np.empty((2, n))
+        chunk = -(-n // streams)
+        for s in prange(streams):
+            np.random.seed(seed + s)
+            start = s * chunk
+            count = min(n, start + chunk) - start
+            x = 0.0
+            y = 0.0
+            for i in range(IFS_SKIP_ITERATIONS + count):
+                k = np.searchsorted(cum_probs, np.random.random(), side="right")
+                x, y = (maps[k, 0] * x + maps[k, 1] * y + maps[k, 4],
+                        maps[k, 2] * x + maps[k, 3] * y + maps[k, 5])
+                if i >= IFS_SKIP_ITERATIONS:
+                    points[0, start + i - IFS_SKIP_ITERATIONS] = x
+                    points[1, start + i - IFS_SKIP_ITERATIONS] = y
+        return points
+
+
+def generate_affine_points(maps: np.ndarray, cum_probs: np.ndarray,
+                           num_points: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Generate points of an IFS made of affine maps chosen at random.
+    
+    Map k sends (x, y) to (a*x + b*y + e, c*x + d*y + f) with
+    (a, b, c, d, e, f) = maps[k] and is picked when a uniform draw r falls in
+    [cum_probs[k-1], cum_probs[k]). Selection is a searchsorted into the
+    threshold table, so there is no per-map branch. With Numba installed the
+    chaos game runs as one compiled stream per Numba thread. Otherwise
+    IFS_CHAINS independent chains are advanced together (the attractor does
+    not depend on the starting point), with every draw and map choice made up
+    front from a PCG64 Generator.
+    
+    Args:
+        maps: Array of shape (k, 6) with one row of coefficients per map
+        cum_probs: Array of shape (k,) with cumulative probabilities ending at 1
+        num_points: Number of points to generate
+        seed: Random seed (default: drawn from NumPy's global generator, so
+            np.random.seed still makes renders reproducible)
+        
+    Returns:
+        Numpy array of shape (num_points, 2) with (x, y) coordinates, a
+        transposed view so that each column is contiguous in memory
+    """
+    if seed is None:
+        seed = np.random.randint(2 ** 30)
+    
+    if NUMBA_AVAILABLE:
+        streams = max(1, min(get_num_threads(), num_points))
+        return _affine_generate(maps, cum_probs, num_points, seed, streams).T
+    
+    chains = max(1, min(IFS_CHAINS, num_points))
+    steps = -(-num_points // chains)
+    points = np.empty((2, steps * chains), dtype=np.float64)
+    a, b, c, d, e, f = maps.T
+    
+    rng = np.random.default_rng(seed)
+    draws = rng.random((IFS_SKIP_ITERATIONS + steps, chains))
+    choices = np.searchsorted(cum_probs, draws, side="right")
+    
+    x = np.zeros(chains)
+    y = np.zeros(chains)
+    
+    for step, k in enumerate(choices):
+        x, y = a[k] * x + b[k] * y + e[k], c[k] * x + d[k] * y + f[k]
+        
+        # Skip first few iterations to reach attractor
+        if step >= IFS_SKIP_ITERATIONS:
+            start = (step - IFS_SKIP_ITERATIONS) * chains
+            points[0, start:start + chains] = x
+            points[1, start:start + chains] = y
+    
+    return points[:, :num_points].T
 
 
 class IFSFractalBase(FractalBase):
     """Base class for IFS fractals that generate points rather than escape-time."""
     
+    # Affine IFS: rows of (a, b, c, d, e, f) and matching cumulative map
+    # probabilities. When set, generate_points uses generate_affine_points.
+    _affine_maps: Optional[np.ndarray] = None
+    _cum_probs: Optional[np.ndarray] = None
+    
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """
         Not used for IFS fractals - they use iterate_point() and render_to_image().
@@ -22,18 +114,25 @@ class IFSFractalBase(FractalBase):
         """
         raise NotImplementedError("IFS fractals use render_to_image() instead of compute_pixel()")
     
-    @abstractmethod
-    def iterate_point(self, x: float, y: float) -> Tuple[float, float]:
+    def iterate_point(self, x: float, y: float, r: float) -> Tuple[float, float]:
         """
         Apply one iteration of the IFS to a point.
         
+        Affine fractals look the map up in their table; IFS fractals
+        without one override this.
+        
         Args:
             x, y: Current point coordinates
+            r: Uniform random draw in [0, 1) that picks the map
             
         Returns:
             (new_x, new_y) after applying transformation
         """
-        pass
+        if self._affine_maps is None:
+            raise NotImplementedError("IFS fractals without _affine_maps must implement iterate_point()")
+        k = np.searchsorted(self._cum_probs, r, side="right")
+        a, b, c, d, e, f = self._affine_maps[k]
+        return (a * x + b * y + e, c * x + d * y + f)
     
     def get_initial_point(self) -> Tuple[float, float]:
         """Get starting point for IFS iteration."""
@@ -47,21 +146,30 @@ class IFSFractalBase(FractalBase):
             num_points: Number of points to generate
             
         Returns:
-            Numpy array of shape (num_points, 2) with (x, y) coordinates
+            Numpy array of shape (num_points, 2) with (x, y) coordinates,
+            stored column by column (see generate_affine_points)
         """
-        points = np.zeros((num_points, 2), dtype=np.float64)
+        if self._affine_maps is not None:
+            return generate_affine_points(self._affine_maps, self._cum_probs, num_points)
+        
+        xs = [0.0] * num_points
+        ys = [0.0] * num_points
         x, y = self.get_initial_point()
         
+        # Every map choice drawn in one call instead of one call per point
+        draws = np.random.random(IFS_SKIP_ITERATIONS + num_points).tolist()
+        
         # Skip first few iterations to reach attractor
-        for _ in range(IFS_SKIP_ITERATIONS):
-            x, y = self.iterate_point(x, y)
+        for r in draws[:IFS_SKIP_ITERATIONS]:
+            x, y = self.iterate_point(x, y, r)
         
         # Generate points
-        for i in range(num_points):
-            x, y = self.iterate_point(x, y)
-            points[i] = [x, y]
+        for i, r in enumerate(draws[IFS_SKIP_ITERATIONS:]):
+            x, y = self.iterate_point(x, y, r)
+            xs[i] = x
+            ys[i] = y
         
-        return points
+        return np.array([xs, ys], dtype=np.float64).T
     
     def render_to_image(self, width: int, height: int, bounds: Dict[str, float], 
                        num_points: int = DEFAULT_IFS_POINTS) -> np.ndarray:
@@ -76,44 +184,72 @@ class IFSFractalBase(FractalBase):
         Returns:
             RGB image array of shape (height, width, 3)
         """
-        # Generate points
         points = self.generate_points(num_points)
-        
-        # Create histogram/image buffer
-        img_buffer = np.zeros((height, width), dtype=np.float64)
-        
-        # Map points to pixel coordinates (vectorized)
-        x_min, x_max = bounds['xmin'], bounds['xmax']
-        y_min, y_max = bounds['ymin'], bounds['ymax']
-        
-        x_scale = width / (x_max - x_min)
-        y_scale = height / (y_max - y_min)
-        
-        # Vectorized coordinate transformation
-        px = ((points[:, 0] - x_min) * x_scale).astype(np.int32)
-        py = ((y_max - points[:, 1]) * y_scale).astype(np.int32)  # Flip y
-        
-        # Filter points within bounds
-        mask = (px >= 0) & (px < width) & (py >= 0) & (py < height)
-        px_valid = px[mask]
-        py_valid = py[mask]
-        
-        # Accumulate using numpy (faster than Python loop)
-        np.add.at(img_buffer, (py_valid, px_valid), 1)
-        
-        # Normalize
-        max_val = img_buffer.max()
-        if max_val > 0:
-            img_buffer = img_buffer / max_val
-        
-        # Vectorized RGB conversion
-        # Apply gamma correction and scale to 0-255
-        intensity = (255 * img_buffer ** IFS_GAMMA).astype(np.uint8)
-        
-        # Create RGB image with color tint (vectorized)
-        rgb_img = np.zeros((height, width, 3), dtype=np.uint8)
-        rgb_img[:, :, 0] = (intensity * IFS_COLOR_TINT[0]).astype(np.uint8)  # R
-        rgb_img[:, :, 1] = (intensity * IFS_COLOR_TINT[1]).astype(np.uint8)  # G
-        rgb_img[:, :, 2] = (intensity * IFS_COLOR_TINT[2]).astype(np.uint8)  # B
-        
-        return rgb_img
+        counts = bin_points(points, width, height, bounds)
+        return shade_counts(counts)
+
+
+def bin_points(points: np.ndarray, width: int, height: int,
+               bounds: Dict[str, float]) -> np.ndarray:
+    """
+    Count how many points land in each pixel.
+    
+    Args:
+        points: Array of shape (N, 2) with (x, y) coordinates
+        width, height: Image dimensions
+        bounds: Viewport bounds dict with keys 'xmin', 'xmax', 'ymin', 'ymax'
+        
+    Returns:
+        uint32 array of shape (height, width) with row 0 at ymax
+    """
+    x_min, x_max = bounds['xmin'], bounds['xmax']
+    y_min, y_max = bounds['ymin'], bounds['ymax']
+    
+    x_scale = width / (x_max - x_min)
+    y_scale = height / (y_max - y_min)
+    
+    # Vectorized coordinate transformation
+    px = ((points[:, 0] - x_min) * x_scale).astype(np.int32)
+    py = ((y_max - points[:, 1]) * y_scale).astype(np.int32)  # Flip y
+    
+    # Filter points within bounds
+    mask = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    
+    # One bincount over flat pixel indices instead of scattered increments;
+    # the histogram is kept between renders, so store it at half of int64's size
+    flat = py[mask] * width + px[mask]
+    return np.bincount(flat, minlength=width * height).astype(np.uint32).reshape(height, width)
+
+
+def shade_counts(counts: np.ndarray, alpha: bool = False) -> np.ndarray:
+    """
+    Convert per-pixel hit counts to a gamma-corrected, tinted RGB image.
+    
+    Counts are integers, so the color of every possible count is computed
+    once in a lookup table and the image is a single table lookup.
+    
+    Args:
+        counts: Integer array of shape (height, width) from bin_points
+        alpha: Append an opaque alpha channel (RGBA output that PIL can wrap
+            with Image.frombuffer without copying)
+        
+    Returns:
+        Image array of shape (height, width, 3), or (height, width, 4) with alpha
+    """
+    channels = 4 if alpha else 3
+    max_val = int(counts.max()) if counts.size else 0
+    if max_val == 0:
+        img = np.zeros(counts.shape + (channels,), dtype=np.uint8)
+        if alpha:
+            img[:, :, 3] = 255
+        return img
+    
+    # Gamma correction, 0-255 scale and tint in float, truncated once
+    brightness = 255 * (np.arange(max_val + 1, dtype=np.float64) / max_val) ** IFS_GAMMA
+    
+    lut = np.empty((max_val + 1, channels), dtype=np.uint8)
+    lut[:, :3] = brightness[:, None] * np.array(IFS_COLOR_TINT)
+    if alpha:
+        lut[:, 3] = 255
+    
+    return lut[counts]
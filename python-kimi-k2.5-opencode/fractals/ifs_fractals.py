@@ -4,6 +4,43 @@ import numpy as np
 from . import register_fractal
 from .ifs_base import IFSFractalBase
 
+# Affine maps as rows of (a, b, c, d, e, f):
+# x' = a*x + b*y + e, y' = c*x + d*y + f
+TRIANGLE_MAPS = np.array([
+    [0.5, 0.0, 0.0, 0.5, 0.0, 0.0],     # Bottom-left vertex (0, 0)
+    [0.5, 0.0, 0.0, 0.5, 0.5, 0.0],     # Bottom-right vertex (1, 0)
+    [0.5, 0.0, 0.0, 0.5, 0.25, 0.5],    # Top vertex (0.5, 1)
+])
+TRIANGLE_CUM_PROBS = np.array([0.333, 0.667, 1.0])
+
+# Eight 1/3-size squares around the empty center
+CARPET_MAPS = np.array([
+    [1/3, 0.0, 0.0, 1/3, 0.0, 2/3],     # Top-left
+    [1/3, 0.0, 0.0, 1/3, 1/3, 2/3],     # Top-center
+    [1/3, 0.0, 0.0, 1/3, 2/3, 2/3],     # Top-right
+    [1/3, 0.0, 0.0, 1/3, 0.0, 1/3],     # Middle-left
+    [1/3, 0.0, 0.0, 1/3, 2/3, 1/3],     # Middle-right
+    [1/3, 0.0, 0.0, 1/3, 0.0, 0.0],     # Bottom-left
+    [1/3, 0.0, 0.0, 1/3, 1/3, 0.0],     # Bottom-center
+    [1/3, 0.0, 0.0, 1/3, 2/3, 0.0],     # Bottom-right
+])
+CARPET_CUM_PROBS = np.array([0.125, 0.25, 0.375, 0.5, 0.625, 0.75, 0.875, 1.0])
+
+DRAGON_MAPS = np.array([
+    [0.5, -0.5, 0.5, 0.5, 0.0, 0.0],    # Rotate 45°, scale by 1/sqrt(2)
+    [-0.5, -0.5, 0.5, -0.5, 1.0, 0.0],  # Rotate 135°, scale by 1/sqrt(2), translate
+])
+DRAGON_CUM_PROBS = np.array([0.5, 1.0])
+
+MAPLE_MAPS = np.array([
+    [0.6, 0.01, -0.01, 0.6, 0.0, 1.5],  # Main stem and center
+    [0.4, -0.3, 0.3, 0.4, -1.5, 0.8],   # Left leaflets
+    [0.4, 0.3, -0.3, 0.4, 1.5, 0.8],    # Right leaflets
+    [0.3, 0.02, -0.02, 0.3, 0.0, 3.5],  # Top details
+    [0.5, 0.05, -0.05, 0.5, 0.0, 2.0],  # Fine details
+])
+MAPLE_CUM_PROBS = np.array([0.35, 0.55, 0.75, 0.90, 1.0])
+
 
 @register_fractal("sierpinski_triangle")
 class SierpinskiTriangleFractal(IFSFractalBase):
@@ -20,6 +57,8 @@ class SierpinskiTriangleFractal(IFSFractalBase):
             "description": "Number of points to generate"
         }
     }
+    _affine_maps = TRIANGLE_MAPS
+    _cum_probs = TRIANGLE_CUM_PROBS
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -31,20 +70,6 @@ class SierpinskiTriangleFractal(IFSFractalBase):
     
     def get_default_bounds(self):
         return {"xmin": -0.1, "xmax": 1.1, "ymin": -0.1, "ymax": 1.1}
-    
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply Sierpinski triangle IFS transformation."""
-        r = np.random.random()
-        
-        if r < 0.333:
-            # Contract toward bottom-left vertex (0, 0)
-            return (0.5 * x, 0.5 * y)
-        elif r < 0.667:
-            # Contract toward bottom-right vertex (1, 0)
-            return (0.5 * x + 0.5, 0.5 * y)
-        else:
-            # Contract toward top vertex (0.5, 1)
-            return (0.5 * x + 0.25, 0.5 * y + 0.5)
 
 
 @register_fractal("sierpinski_carpet")
@@ -62,6 +87,8 @@ class SierpinskiCarpetFractal(IFSFractalBase):
             "description": "Number of points to generate"
         }
     }
+    _affine_maps = CARPET_MAPS
+    _cum_probs = CARPET_CUM_PROBS
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -73,36 +100,6 @@ class SierpinskiCarpetFractal(IFSFractalBase):
     
     def get_default_bounds(self):
         return {"xmin": -0.1, "xmax": 1.1, "ymin": -0.1, "ymax": 1.1}
-    
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply Sierpinski carpet IFS (8 transformations, skipping center)."""
-        r = np.random.random()
-        
-        # 8 squares around the center (each 1/3 size)
-        if r < 0.125:
-            # Top-left
-            return (x / 3, y / 3 + 2/3)
-        elif r < 0.25:
-            # Top-center
-            return (x / 3 + 1/3, y / 3 + 2/3)
-        elif r < 0.375:
-            # Top-right
-            return (x / 3 + 2/3, y / 3 + 2/3)
-        elif r < 0.5:
-            # Middle-left
-            return (x / 3, y / 3 + 1/3)
-        elif r < 0.625:
-            # Middle-right
-            return (x / 3 + 2/3, y / 3 + 1/3)
-        elif r < 0.75:
-            # Bottom-left
-            return (x / 3, y / 3)
-        elif r < 0.875:
-            # Bottom-center
-            return (x / 3 + 1/3, y / 3)
-        else:
-            # Bottom-right
-            return (x / 3 + 2/3, y / 3)
 
 
 @register_fractal("dragon_curve")
@@ -120,6 +117,8 @@ class DragonCurveFractal(IFSFractalBase):
             "description": "Number of points to generate"
         }
     }
+    _affine_maps = DRAGON_MAPS
+    _cum_probs = DRAGON_CUM_PROBS
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -131,17 +130,6 @@ class DragonCurveFractal(IFSFractalBase):
     
     def get_default_bounds(self):
         return {"xmin": -0.5, "xmax": 1.3, "ymin": -0.5, "ymax": 0.9}
-    
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply Heighway dragon IFS."""
-        r = np.random.random()
-        
-        if r < 0.5:
-            # First transformation: rotate 45°, scale by 1/sqrt(2)
-            return (0.5 * x - 0.5 * y, 0.5 * x + 0.5 * y)
-        else:
-            # Second transformation: rotate 135°, scale by 1/sqrt(2), translate
-            return (-0.5 * x - 0.5 * y + 1, 0.5 * x - 0.5 * y)
 
 
 @register_fractal("maple_leaf")
@@ -159,6 +147,8 @@ class MapleLeafFractal(IFSFractalBase):
             "description": "Number of points to generate"
         }
     }
+    _affine_maps = MAPLE_MAPS
+    _cum_probs = MAPLE_CUM_PROBS
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -170,23 +160,3 @@ class MapleLeafFractal(IFSFractalBase):
     
     def get_default_bounds(self):
         return {"xmin": -3.8, "xmax": 3.8, "ymin": -1.0, "ymax": 6.0}
-    
-    def iterate_point(self, x: float, y: float) -> tuple:
-        """Apply maple leaf IFS."""
-        r = np.random.random()
-        
-        if r < 0.35:
-            # Main stem and center
-            return (0.6 * x + 0.01 * y, -0.01 * x + 0.6 * y + 1.5)
-        elif r < 0.55:
-            # Left leaflets
-            return (0.4 * x - 0.3 * y - 1.5, 0.3 * x + 0.4 * y + 0.8)
-        elif r < 0.75:
-            # Right leaflets  
-            return (0.4 * x + 0.3 * y + 1.5, -0.3 * x + 0.4 * y + 0.8)
-        elif r < 0.90:
-            # Top details
-            return (0.3 * x + 0.02 * y, -0.02 * x + 0.3 * y + 3.5)
-        else:
-            # Fine details
-            return (0.5 * x + 0.05 * y, -0.05 * x + 0.5 * y + 2.0)
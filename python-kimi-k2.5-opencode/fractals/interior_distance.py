@@ -1,8 +1,10 @@
 """Interior distance estimation for Mandelbrot set."""
 
-import numpy as np
+import math
 from . import FractalBase, register_fractal
 
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
+
 
 @register_fractal("mandelbrot_interior")
 class MandelbrotInteriorFractal(FractalBase):
@@ -33,41 +35,44 @@ class MandelbrotInteriorFractal(FractalBase):
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Mandelbrot with interior distance estimation."""
-        c = complex(x, y)
-        z = 0
-        dz = 0  # Derivative of z with respect to c
+        zr = zi = 0.0
+        dzr = dzi = 0.0  # Derivative of z with respect to c
         
         # First check if point is in the main cardioid
         q = (x - 0.25) ** 2 + y ** 2
         if q * (q + (x - 0.25)) <= 0.25 * y ** 2:
             # In main cardioid - estimate distance
             # Distance estimation for cardioid
-            dist = np.sqrt(q) * 2
+            dist = math.sqrt(q) * 2
             return max_iter * (1 - min(dist * self.smoothness, 1))
         
         # Check if in period-2 bulb
         if (x + 1) ** 2 + y ** 2 <= 0.0625:
             # In period-2 bulb
-            dist = np.sqrt((x + 1) ** 2 + y ** 2) * 4
+            dist = math.sqrt((x + 1) ** 2 + y ** 2) * 4
             return max_iter * (1 - min(dist * self.smoothness, 1))
         
         for i in range(max_iter):
-            if abs(z) > 2:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
                 # Escaped - use standard smooth iteration
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(2)) / np.log(2)
+                log_zn = 0.5 * math.log(zr2 + zi2)
+                nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                 return i + 1 - nu
             
             # Update derivative: dz = 2*z*dz + 1
-            dz = 2 * z * dz + 1
-            z = z * z + c
+            dzr, dzi = 2.0 * (zr * dzr - zi * dzi) + 1.0, 2.0 * (zr * dzi + zi * dzr)
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
         
         # Did not escape - estimate interior distance
         # Using the derivative to estimate distance to boundary
-        if abs(dz) > 1e-10:
+        abs_dz = math.hypot(dzr, dzi)
+        if abs_dz > 1e-10:
             # Interior distance estimate: ~ 1/|dz|
             # Points closer to boundary have smaller |dz|
-            dist_estimate = 1.0 / (abs(dz) * self.smoothness)
+            dist_estimate = 1.0 / (abs_dz * self.smoothness)
             
             # Normalize to [0, max_iter]
             # Smaller distance (closer to boundary) = higher value
@@ -1,7 +1,86 @@
 """Mandelbrot set implementation."""
 
+import math
+from decimal import Decimal, localcontext
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, count_dtype, escape_time_numpy, register_fractal, smooth_counts, NUMBA_AVAILABLE
+from . import cuda_kernels
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS, in_main_body
+
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
+PERTURBATION_MAX_WIDTH: float = 1e-10  # Narrower views iterate offsets from a reference orbit
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+    from .mandelbrot_utils import in_main_body_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _mandelbrot_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Escape-time values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                value = float(max_iter)
+                if in_main_body_jit(cr, ci):
+                    out[row, col] = value
+                    continue
+                zr = 0.0
+                zi = 0.0
+                for i in range(max_iter):
+                    mag2 = zr * zr + zi * zi
+                    if mag2 > 4.0:
+                        log_zn = 0.5 * np.log(mag2)
+                        value = i + 1 - np.log(log_zn / np.log(2.0)) / np.log(2.0)
+                        break
+                    zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _mandelbrot_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
+
+
+def _mandelbrot_step(zr, zi, cr, ci):
+    """One Mandelbrot step over arrays: z² + c on separate real/imaginary parts."""
+    zr2 = zr * zr
+    zi2 = zi * zi
+    return zr2 - zi2 + cr, 2.0 * zr * zi + ci
+
+
+def _reference_orbit(cr: float, ci: float, max_iter: int, digits: int):
+    """
+    Iterate z = z² + c for one point in decimal arithmetic.
+    
+    Args:
+        cr, ci: The reference point c
+        max_iter: Maximum iterations
+        digits: Significant decimal digits carried through the iteration
+        
+    Returns:
+        (zr, zi) float64 arrays of the orbit from z0 = 0, up to and including
+        the first point with |z| > 2 (max_iter + 1 points if it never escapes)
+    """
+    orbit_r = [0.0]
+    orbit_i = [0.0]
+    with localcontext() as ctx:
+        ctx.prec = digits
+        cr = Decimal(cr)
+        ci = Decimal(ci)
+        zr = zi = Decimal(0)
+        for _ in range(max_iter):
+            zr, zi = zr * zr - zi * zi + cr, 2 * zr * zi + ci
+            orbit_r.append(float(zr))
+            orbit_i.append(float(zi))
+            if zr * zr + zi * zi > 4:
+                break
+    return np.array(orbit_r), np.array(orbit_i)
 
 
 @register_fractal("mandelbrot")
@@ -11,20 +90,130 @@ class MandelbrotFractal(FractalBase):
     name = "Mandelbrot Set"
     description = "z = z² + c, the classic Mandelbrot set"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.25, "ymax": 1.25}
     
+    def uses_parallel_kernel(self, bounds):
+        # Deep zooms take the single-threaded perturbation path
+        return (bounds["xmax"] - bounds["xmin"] >= PERTURBATION_MAX_WIDTH
+                and super().uses_parallel_kernel(bounds))
+    
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Mandelbrot iteration with smooth coloring."""
-        c = complex(x, y)
-        z = 0j
+        if in_main_body(x, y):
+            return max_iter
+        
+        zr = zi = 0.0
+        saved_r, saved_i = zr, zi  # Periodicity check
+        period = save_at = PERIOD_START
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(2)) / np.log(2)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                log_zn = 0.5 * math.log(zr2 + zi2)
+                nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                 return i + 1 - nu
-            z = z * z + c
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
+            dr = zr - saved_r
+            di = zi - saved_i
+            if dr * dr + di * di < PERIODICITY_EPS:
+                return max_iter
+            if i == save_at:
+                saved_r, saved_i = zr, zi
+                period = min(2 * period, PERIOD_MAX)
+                save_at += period
         
         return max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        # float64 pixel coordinates lose their orbits at deep zoom
+        if bounds["xmax"] - bounds["xmin"] < PERTURBATION_MAX_WIDTH:
+            return self.compute_image_perturbation(bounds, width, height, max_iter)
+        if cuda_kernels.use_cuda(backend, width, height):
+            return cuda_kernels.compute_image_cuda(cuda_kernels.mandelbrot_kernel, bounds, width,
+                                                   height, max_iter)
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _mandelbrot_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                                  bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        # Main-body pixels are settled up front and never enter the loop
+        outside = ~in_main_body(cr, ci)
+        values = np.full((height, width), float(max_iter))
+        cr, ci = cr[outside], ci[outside]
+        values[outside] = escape_time_numpy(0.0 * cr, 0.0 * ci, cr, ci, max_iter,
+                                            _mandelbrot_step, dtype=dtype)
+        return values
+    
+    def compute_image_perturbation(self, bounds, width, height, max_iter):
+        """
+        Compute a deep-zoom viewport by perturbation from one reference orbit.
+        
+        The orbit Z of the view's center is iterated once in decimal
+        arithmetic. Every pixel c = c_ref + dc then only iterates its small
+        offset d from that orbit in float64, d' = 2·Z·d + d² + dc, which keeps
+        full relative precision however deep the zoom. A pixel rebases onto
+        the start of the orbit (d = Z + d) when it comes closer to zero than
+        its offset, or when the reference orbit has escaped.
+        
+        Arguments and result are as for compute_image.
+        """
+        cx = 0.5 * (bounds["xmin"] + bounds["xmax"])
+        cy = 0.5 * (bounds["ymin"] + bounds["ymax"])
+        dx = (bounds["xmax"] - bounds["xmin"]) / max(1, width - 1)
+        dy = (bounds["ymax"] - bounds["ymin"]) / max(1, height - 1)
+        digits = 20 + max(0, int(-math.log10(max(dx * width, 1e-300))))
+        orbit_r, orbit_i = _reference_orbit(cx, cy, max_iter, digits)
+        last = len(orbit_r) - 1
+        
+        # Offsets from the center, row 0 at ymax
+        dcr = (np.arange(width) - 0.5 * (width - 1)) * dx
+        dci = (0.5 * (height - 1) - np.arange(height)) * dy
+        dcr, dci = np.meshgrid(dcr, dci)
+        outside = ~in_main_body(cx + dcr, cy + dci)
+        counts = np.full(height * width, max_iter, dtype=count_dtype(max_iter))
+        escape_mag2 = np.zeros(height * width, dtype=np.float32)
+        
+        dcr, dci = dcr[outside], dci[outside]
+        active = np.flatnonzero(outside)
+        dr = np.zeros(active.size)
+        di = np.zeros(active.size)
+        n = np.zeros(active.size, dtype=np.intp)
+        
+        for i in range(max_iter):
+            zr_ref = orbit_r[n]
+            zi_ref = orbit_i[n]
+            zr = zr_ref + dr
+            zi = zi_ref + di
+            mag2 = zr * zr + zi * zi
+            escaped = mag2 > 4.0
+            if escaped.any():
+                counts[active[escaped]] = i
+                escape_mag2[active[escaped]] = mag2[escaped]
+                running = ~escaped
+                active, n = active[running], n[running]
+                dr, di, dcr, dci = dr[running], di[running], dcr[running], dci[running]
+                zr, zi, mag2 = zr[running], zi[running], mag2[running]
+                zr_ref, zi_ref = zr_ref[running], zi_ref[running]
+                if not active.size:
+                    break
+            
+            rebase = (mag2 < dr * dr + di * di) | (n == last)
+            if rebase.any():
+                dr[rebase] = zr[rebase]
+                di[rebase] = zi[rebase]
+                n[rebase] = 0
+                zr_ref[rebase] = 0.0
+                zi_ref[rebase] = 0.0
+            
+            dr, di = (2.0 * (zr_ref * dr - zi_ref * di) + dr * dr - di * di + dcr,
+                      2.0 * (zr_ref * di + zi_ref * dr + dr * di) + dci)
+            n += 1
+        
+        return smooth_counts(counts, escape_mag2, max_iter).reshape(height, width)
@@ -0,0 +1,37 @@
+"""Shared helpers for the Mandelbrot-family fractals."""
+
+from . import NUMBA_AVAILABLE
+
+if NUMBA_AVAILABLE:
+    from numba import njit
+
+# Periodicity checking: z is saved after PERIOD_START iterations, then after
+# intervals that double up to PERIOD_MAX. An orbit that comes back within
+# sqrt(PERIODICITY_EPS) of the saved z has settled on a cycle and never escapes.
+PERIOD_START: int = 16
+PERIOD_MAX: int = 1024
+PERIODICITY_EPS: float = 1e-20
+
+
+def in_main_body(x, y):
+    """
+    Check whether c = x + iy lies in the main cardioid or the period-2 bulb.
+    
+    Orbits of these points never escape, so callers can return max_iter
+    without iterating. Only arithmetic and comparisons are used, so x and y
+    may also be NumPy arrays, giving a boolean mask.
+    
+    Args:
+        x, y: Coordinates in the complex plane (floats or arrays)
+        
+    Returns:
+        True (or a mask that is True) where c is in the main body
+    """
+    xq = x - 0.25
+    y2 = y * y
+    q = xq * xq + y2
+    return (q * (q + xq) <= 0.25 * y2) | ((x + 1) * (x + 1) + y2 <= 0.0625)
+
+
+if NUMBA_AVAILABLE:
+    in_main_body_jit = njit(cache=True, inline="always")(in_main_body)
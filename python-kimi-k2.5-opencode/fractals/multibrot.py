@@ -1,7 +1,68 @@
 """Multibrot fractal implementation with configurable power."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, escape_time_numpy, register_fractal, NUMBA_AVAILABLE
+from . import cuda_kernels
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+def _complex_power(zr, zi, power):
+    """
+    Raise z to an integer power >= 1, on separate real/imaginary parts.
+    
+    Square-and-multiply, the same scheme CPython uses for complex ** int,
+    so power 8 is three squarings rather than seven multiplications.
+    Works on floats and on NumPy arrays alike.
+    """
+    while not power & 1:
+        zr, zi = zr * zr - zi * zi, 2.0 * zr * zi
+        power >>= 1
+    pr, pi = zr, zi
+    power >>= 1
+    while power:
+        zr, zi = zr * zr - zi * zi, 2.0 * zr * zi
+        if power & 1:
+            pr, pi = pr * zr - pi * zi, pr * zi + pi * zr
+        power >>= 1
+    return pr, pi
+
+
+if NUMBA_AVAILABLE:
+    _complex_power_jit = njit(cache=True, fastmath=True, inline="always")(_complex_power)
+    
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _multibrot_kernel(xmin, xmax, ymin, ymax, width, height, max_iter, power):
+        """Escape-time values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        log_power = np.log(float(power))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                zr = 0.0
+                zi = 0.0
+                value = float(max_iter)
+                for i in range(max_iter):
+                    mag2 = zr * zr + zi * zi
+                    if mag2 > 4.0:
+                        log_zn = 0.5 * np.log(mag2)
+                        value = i + 1 - np.log(log_zn / log_power) / log_power
+                        break
+                    pr, pi = _complex_power_jit(zr, zi, power)
+                    zr = pr + cr
+                    zi = pi + ci
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _multibrot_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 2)
 
 
 @register_fractal("multibrot")
@@ -19,6 +80,7 @@ class MultibrotFractal(FractalBase):
             "description": "Power n (2=Mandelbrot, 3, 4, 5, etc.)"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -28,6 +90,7 @@ class MultibrotFractal(FractalBase):
             self.power = 2
         # Clamp to valid range
         self.power = max(2, min(10, self.power))
+        self._inv_log_power = 1.0 / math.log(self.power)
     
     def get_default_bounds(self):
         # Center on zero with bounds to fit all powers
@@ -37,13 +100,42 @@ class MultibrotFractal(FractalBase):
         """Compute Multibrot iteration with smooth coloring."""
         c = complex(x, y)
         z = 0j
+        saved = z  # Periodicity check
+        period = save_at = PERIOD_START
         
         for i in range(max_iter):
             if abs(z) > 2:
                 # Smooth coloring based on power
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(self.power)) / np.log(self.power)
+                log_zn = math.log(abs(z))
+                nu = math.log(log_zn * self._inv_log_power) * self._inv_log_power
                 return i + 1 - nu
             z = z ** self.power + c
+            d = z - saved
+            if d.real * d.real + d.imag * d.imag < PERIODICITY_EPS:
+                return max_iter
+            if i == save_at:
+                saved = z
+                period = min(2 * period, PERIOD_MAX)
+                save_at += period
         
         return max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if cuda_kernels.use_cuda(backend, width, height):
+            return cuda_kernels.compute_image_cuda(cuda_kernels.multibrot_kernel, bounds, width,
+                                                   height, max_iter, self.power)
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _multibrot_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                                 bounds["ymax"], width, height, max_iter, self.power)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        power = self.power
+        
+        def step(zr, zi, cr, ci):
+            pr, pi = _complex_power(zr, zi, power)
+            return pr + cr, pi + ci
+        
+        return escape_time_numpy(0.0 * cr, 0.0 * ci, cr, ci, max_iter, step, degree=power,
+                                 dtype=dtype)
@@ -1,7 +1,59 @@
 """Newton fractal implementation."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, register_fractal, NUMBA_AVAILABLE
+
+# Roots of z^3 - 1, as separate real and imaginary parts
+_SQRT3_HALF: float = math.sqrt(3.0) / 2
+_ROOTS_R = (1.0, -0.5, -0.5)
+_ROOTS_I = (0.0, _SQRT3_HALF, -_SQRT3_HALF)
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _newton_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Newton iteration values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            for col in range(width):
+                zr = xs[col]
+                zi = ys[height - 1 - row]
+                value = float(max_iter)
+                for i in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 < 1e-20:
+                        break
+                    # z - (z^3 - 1) / (3 z^2)
+                    nr = zr * (zr2 - 3.0 * zi2) - 1.0
+                    ni = zi * (3.0 * zr2 - zi2)
+                    dr = 3.0 * (zr2 - zi2)
+                    di = 6.0 * zr * zi
+                    d2 = dr * dr + di * di
+                    zr = zr - (nr * dr + ni * di) / d2
+                    zi = zi - (ni * dr - nr * di) / d2
+                    found = False
+                    for j in range(3):
+                        er = zr - _ROOTS_R[j]
+                        ei = zi - _ROOTS_I[j]
+                        if er * er + ei * ei < 1e-12:
+                            value = i + j * max_iter / 3
+                            found = True
+                            break
+                    if found:
+                        break
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _newton_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
 
 
 @register_fractal("newton")
@@ -11,29 +63,75 @@ class NewtonFractal(FractalBase):
     name = "Newton"
     description = "Newton's method for z³ - 1 = 0"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.0, "xmax": 2.0, "ymin": -2.0, "ymax": 2.0}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        z = complex(x, y)
-        
-        roots = [
-            complex(1, 0),
-            complex(-0.5, np.sqrt(3)/2),
-            complex(-0.5, -np.sqrt(3)/2)
-        ]
+        zr, zi = x, y
         
         for i in range(max_iter):
-            if abs(z) < 1e-10:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 < 1e-20:
                 return float(max_iter)
             
-            z_new = z - (z**3 - 1) / (3 * z**2)
+            # z - (z^3 - 1) / (3 z^2)
+            nr = zr * (zr2 - 3.0 * zi2) - 1.0
+            ni = zi * (3.0 * zr2 - zi2)
+            dr = 3.0 * (zr2 - zi2)
+            di = 6.0 * zr * zi
+            d2 = dr * dr + di * di
+            zr = zr - (nr * dr + ni * di) / d2
+            zi = zi - (ni * dr - nr * di) / d2
             
-            for j, root in enumerate(roots):
-                if abs(z_new - root) < 1e-6:
+            for j in range(3):
+                er = zr - _ROOTS_R[j]
+                ei = zi - _ROOTS_I[j]
+                if er * er + ei * ei < 1e-12:
                     return float(i + j * max_iter / 3)
-            
-            z = z_new
         
         return float(max_iter)
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _newton_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                              bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        # The 1e-6 root test is below float32 resolution, so this stays float64
+        zr, zi = coordinate_grid(bounds, width, height)
+        zr = zr.ravel().copy()
+        zi = zi.ravel().copy()
+        active = np.arange(zr.size)
+        values = np.full(zr.size, float(max_iter))
+        
+        for i in range(max_iter):
+            # Orbits that hit the origin have no Newton step (max_iter)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            running = zr2 + zi2 >= 1e-20
+            
+            # z - (z^3 - 1) / (3 z^2)
+            nr = zr * (zr2 - 3.0 * zi2) - 1.0
+            ni = zi * (3.0 * zr2 - zi2)
+            dr = 3.0 * (zr2 - zi2)
+            di = 6.0 * zr * zi
+            d2 = np.where(running, dr * dr + di * di, 1.0)
+            zr = zr - (nr * dr + ni * di) / d2
+            zi = zi - (ni * dr - nr * di) / d2
+            
+            for j in range(3):
+                er = zr - _ROOTS_R[j]
+                ei = zi - _ROOTS_I[j]
+                converged = running & (er * er + ei * ei < 1e-12)
+                values[active[converged]] = i + j * max_iter / 3
+                running &= ~converged
+            
+            zr, zi, active = zr[running], zi[running], active[running]
+            if not active.size:
+                break
+        
+        return values.reshape(height, width)
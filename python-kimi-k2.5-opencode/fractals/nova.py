@@ -1,7 +1,77 @@
 """Nova fractal implementation (Newton's method applied to Mandelbrot)."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, count_dtype, register_fractal, NUMBA_AVAILABLE
+
+_INV_LOG10: float = 1.0 / math.log(10.0)  # Smooth-coloring log bases
+_INV_LOG3: float = 1.0 / math.log(3.0)
+
+# Roots of z^3 - 1, as separate real and imaginary parts
+_SQRT3_HALF: float = math.sqrt(3.0) / 2
+_ROOTS_R = (1.0, -0.5, -0.5)
+_ROOTS_I = (0.0, _SQRT3_HALF, -_SQRT3_HALF)
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _nova_kernel(xmin, xmax, ymin, ymax, width, height, max_iter, relaxation):
+        """Nova values for a width x height grid, rows in parallel."""
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                zr = 1.0  # Start at root 1
+                zi = 0.0
+                value = float(max_iter)
+                for i in range(max_iter):
+                    zr2 = zr * zr
+                    zi2 = zi * zi
+                    if zr2 + zi2 < 1e-10:
+                        break
+                    
+                    # z - R (z^3 - 1) / (3 z^2) + c
+                    nr = zr * (zr2 - 3.0 * zi2) - 1.0
+                    ni = zi * (3.0 * zr2 - zi2)
+                    dr = 3.0 * (zr2 - zi2)
+                    di = 6.0 * zr * zi
+                    d2 = dr * dr + di * di
+                    zr, zi = (zr - relaxation * (nr * dr + ni * di) / d2 + cr,
+                              zi - relaxation * (ni * dr - nr * di) / d2 + ci)
+                    
+                    # Convergence to one of the roots 1, -1/2 ± i√3/2
+                    er = zr - 1.0
+                    if er * er + zi * zi < 1e-12:
+                        value = float(i)
+                        break
+                    er = zr + 0.5
+                    ei = zi - _SQRT3_HALF
+                    if er * er + ei * ei < 1e-12:
+                        value = i + max_iter / 3
+                        break
+                    ei = zi + _SQRT3_HALF
+                    if er * er + ei * ei < 1e-12:
+                        value = i + 2 * max_iter / 3
+                        break
+                    
+                    # Divergence, |z| > 100
+                    mag2 = zr * zr + zi * zi
+                    if mag2 > 1e4:
+                        log_zn = 0.5 * np.log(mag2)
+                        value = i + 1 - np.log(log_zn * _INV_LOG10) * _INV_LOG3
+                        break
+                out[row, col] = value
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _nova_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 1.0)
 
 
 @register_fractal("nova")
@@ -19,6 +89,7 @@ class NovaFractal(FractalBase):
             "description": "Relaxation parameter R"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -33,39 +104,105 @@ class NovaFractal(FractalBase):
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Nova iteration with smooth coloring."""
-        c = complex(x, y)
-        z = 1.0  # Start at root 1
+        zr, zi = 1.0, 0.0  # Start at root 1
+        relaxation = self.relaxation
         
         for i in range(max_iter):
-            if abs(z) < 1e-10:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 < 1e-10:
                 return float(max_iter)
             
             # Newton's method for z³ - 1 = 0 with relaxation and perturbation
             # z_new = z - R * (z³ - 1) / (3z²) + c
-            z3 = z ** 3
-            z2 = z ** 2
+            nr = zr * (zr2 - 3.0 * zi2) - 1.0
+            ni = zi * (3.0 * zr2 - zi2)
+            dr = 3.0 * (zr2 - zi2)
+            di = 6.0 * zr * zi
+            d2 = dr * dr + di * di
+            zr, zi = (zr - relaxation * (nr * dr + ni * di) / d2 + x,
+                      zi - relaxation * (ni * dr - nr * di) / d2 + y)
             
-            if abs(z2) < 1e-10:
-                return float(max_iter)
+            # Check for convergence to the roots 1, -1/2 ± i√3/2, unrolled;
+            # the value is based on which root and the iteration count
+            er = zr - 1.0
+            if er * er + zi * zi < 1e-12:
+                return float(i)
+            er = zr + 0.5
+            ei = zi - _SQRT3_HALF
+            if er * er + ei * ei < 1e-12:
+                return float(i + max_iter / 3)
+            ei = zi + _SQRT3_HALF
+            if er * er + ei * ei < 1e-12:
+                return float(i + 2 * max_iter / 3)
             
-            z_new = z - self.relaxation * (z3 - 1) / (3 * z2) + c
+            # Check for divergence, |z| > 100
+            mag2 = zr * zr + zi * zi
+            if mag2 > 1e4:
+                log_zn = 0.5 * math.log(mag2)
+                nu = math.log(log_zn * _INV_LOG10) * _INV_LOG3
+                return i + 1 - nu
+        
+        return float(max_iter)
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _nova_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                            bounds["ymax"], width, height, max_iter, self.relaxation)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        # The 1e-6 root test is below float32 resolution, so this stays float64
+        cr, ci = coordinate_grid(bounds, width, height)
+        cr = cr.ravel().copy()
+        ci = ci.ravel().copy()
+        zr = np.ones_like(cr)  # Start at root 1
+        zi = np.zeros_like(ci)
+        active = np.arange(cr.size)
+        values = np.full(cr.size, float(max_iter))
+        # Divergence is smoothed in one pass at the end, from the escape
+        # iteration and |z|² recorded here
+        escape_iter = np.full(cr.size, max_iter, dtype=count_dtype(max_iter))
+        escape_mag2 = np.zeros(cr.size)
+        relaxation = self.relaxation
+        
+        for i in range(max_iter):
+            # Orbits that reach |z²| < 1e-10 have no Newton step (max_iter)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            running = zr2 + zi2 >= 1e-10
             
-            # Check for convergence to any root
-            roots = [complex(1, 0), 
-                     complex(-0.5, np.sqrt(3)/2), 
-                     complex(-0.5, -np.sqrt(3)/2)]
+            # z - R (z^3 - 1) / (3 z^2) + c
+            nr = zr * (zr2 - 3.0 * zi2) - 1.0
+            ni = zi * (3.0 * zr2 - zi2)
+            dr = 3.0 * (zr2 - zi2)
+            di = 6.0 * zr * zi
+            d2 = np.where(running, dr * dr + di * di, 1.0)
+            zr = zr - relaxation * (nr * dr + ni * di) / d2 + cr
+            zi = zi - relaxation * (ni * dr - nr * di) / d2 + ci
             
-            for j, root in enumerate(roots):
-                if abs(z_new - root) < 1e-6:
-                    # Return value based on which root and iteration count
-                    return float(i + j * max_iter / 3)
+            for j in range(3):
+                er = zr - _ROOTS_R[j]
+                ei = zi - _ROOTS_I[j]
+                converged = running & (er * er + ei * ei < 1e-12)
+                values[active[converged]] = i + j * max_iter / 3
+                running &= ~converged
             
-            # Check for divergence
-            if abs(z_new) > 100:
-                log_zn = np.log(abs(z_new))
-                nu = np.log(log_zn / np.log(10)) / np.log(3)
-                return i + 1 - nu
+            # Divergence, |z| > 100
+            mag2 = zr * zr + zi * zi
+            diverged = running & (mag2 > 1e4)
+            if diverged.any():
+                escape_iter[active[diverged]] = i
+                escape_mag2[active[diverged]] = mag2[diverged]
+                running &= ~diverged
             
-            z = z_new
+            if not running.all():
+                zr, zi, active = zr[running], zi[running], active[running]
+                cr, ci = cr[running], ci[running]
+                if not active.size:
+                    break
         
-        return float(max_iter)
+        diverged = escape_iter < max_iter
+        log_zn = 0.5 * np.log(escape_mag2[diverged])
+        values[diverged] = escape_iter[diverged] + 1 - np.log(log_zn * _INV_LOG10) * _INV_LOG3
+        return values.reshape(height, width)
@@ -1,7 +1,95 @@
 """Orbit trap Mandelbrot implementation."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, register_fractal, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+_TRAP_TYPES = ("point", "cross", "circle", "x_axis", "y_axis")  # Kernel trap codes, by index
+
+
+def _point_distance(zr: np.ndarray, zi: np.ndarray, trap_size: float) -> np.ndarray:
+    return np.hypot(zr, zi)
+
+
+def _cross_distance(zr: np.ndarray, zi: np.ndarray, trap_size: float) -> np.ndarray:
+    return np.minimum(np.abs(zi), np.abs(zr))
+
+
+def _circle_distance(zr: np.ndarray, zi: np.ndarray, trap_size: float) -> np.ndarray:
+    return np.abs(np.hypot(zr, zi) - trap_size)
+
+
+def _x_axis_distance(zr: np.ndarray, zi: np.ndarray, trap_size: float) -> np.ndarray:
+    return np.abs(zi)
+
+
+def _y_axis_distance(zr: np.ndarray, zi: np.ndarray, trap_size: float) -> np.ndarray:
+    return np.abs(zr)
+
+
+# Array distance from each zr + i*zi to the trap, indexed by trap code
+_TRAP_DISTANCES = (_point_distance, _cross_distance, _circle_distance,
+                   _x_axis_distance, _y_axis_distance)
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _orbit_trap_kernel(xmin, xmax, ymin, ymax, width, height, max_iter,
+                           trap_code, trap_size):
+        """Orbit trap values for a width x height grid, rows in parallel.
+        
+        trap_code is the trap type's index in _TRAP_TYPES.
+        """
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                zr = 0.0
+                zi = 0.0
+                min_distance = np.inf
+                saved_r = saved_i = 0.0  # Periodicity check
+                period = save_at = PERIOD_START
+                for i in range(max_iter):
+                    if zr * zr + zi * zi > 4.0:
+                        break
+                    # Skip the first iteration, z = 0 is not meaningful for most traps
+                    if i > 0:
+                        if trap_code == 1:
+                            dist = min(abs(zi), abs(zr))
+                        elif trap_code == 2:
+                            dist = abs(np.sqrt(zr * zr + zi * zi) - trap_size)
+                        elif trap_code == 3:
+                            dist = abs(zi)
+                        elif trap_code == 4:
+                            dist = abs(zr)
+                        else:
+                            dist = np.sqrt(zr * zr + zi * zi)
+                        min_distance = min(min_distance, dist)
+                        # Once z repeats, the cycle only revisits points already measured
+                        dr = zr - saved_r
+                        di = zi - saved_i
+                        if dr * dr + di * di < PERIODICITY_EPS:
+                            break
+                        if i == save_at:
+                            saved_r, saved_i = zr, zi
+                            period = min(2 * period, PERIOD_MAX)
+                            save_at += period
+                    zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+                if min_distance == np.inf:
+                    min_distance = trap_size
+                out[row, col] = max(0.0, 1.0 - min(min_distance / trap_size, 1.0)) * max_iter
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _orbit_trap_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 0, 0.5)
 
 
 @register_fractal("mandelbrot_orbit_trap")
@@ -25,6 +113,7 @@ class MandelbrotOrbitTrapFractal(FractalBase):
             "description": "Size of the trap"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -34,67 +123,103 @@ class MandelbrotOrbitTrapFractal(FractalBase):
         except (ValueError, TypeError):
             self.trap_size = 0.5
         self.trap_size = max(0.1, min(2.0, self.trap_size))
+        # Trap type as a _TRAP_TYPES index, resolved once instead of per iteration;
+        # unknown trap types measure distance to the origin
+        self._trap_code = (_TRAP_TYPES.index(self.trap_type)
+                           if self.trap_type in _TRAP_TYPES else 0)
+        self._inv_trap_size = 1.0 / self.trap_size
+        self._trap_distance = _TRAP_DISTANCES[self._trap_code]
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.25, "ymax": 1.25}
     
-    def _distance_to_trap(self, z: complex) -> float:
-        """Calculate distance from point z to the trap."""
-        if self.trap_type == "point":
-            # Distance to origin
-            return abs(z)
-        
-        elif self.trap_type == "cross":
-            # Distance to cross (both axes)
-            dist_x = abs(z.imag)
-            dist_y = abs(z.real)
-            return min(dist_x, dist_y)
-        
-        elif self.trap_type == "circle":
-            # Distance to a circle centered at origin
-            return abs(abs(z) - self.trap_size)
-        
-        elif self.trap_type == "x_axis":
-            # Distance to x-axis (imaginary part is 0)
-            return abs(z.imag)
-        
-        elif self.trap_type == "y_axis":
-            # Distance to y-axis (real part is 0)
-            return abs(z.real)
-        
-        return abs(z)
-    
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Mandelbrot with orbit trap."""
-        c = complex(x, y)
-        z = 0
+        zr = zi = 0.0
+        trap_code = self._trap_code
+        trap_size = self.trap_size
         
+        # The point trap tracks |z|² and takes one square root at the end
         min_distance = float('inf')
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                # Return the minimum distance found
-                # Scale and invert so closer = higher value
-                dist_val = min_distance / self.trap_size
-                # Clamp and invert: 0 distance = max_val, large distance = 0
-                normalized = max(0, 1 - min(dist_val, 1))
-                return normalized * max_iter
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
             
             # Track minimum distance to trap, but skip the first iteration
             # because z=0 is not meaningful for most trap types
             if i > 0:
-                dist = self._distance_to_trap(z)
+                if trap_code == 1:  # cross
+                    dist_x = abs(zi)
+                    dist_y = abs(zr)
+                    dist = dist_x if dist_x < dist_y else dist_y
+                elif trap_code == 2:  # circle
+                    dist = abs(math.sqrt(zr2 + zi2) - trap_size)
+                elif trap_code == 3:  # x_axis
+                    dist = abs(zi)
+                elif trap_code == 4:  # y_axis
+                    dist = abs(zr)
+                else:  # point
+                    dist = zr2 + zi2
                 if dist < min_distance:
                     min_distance = dist
             
-            z = z * z + c
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
         
-        # Inside set - return based on minimum distance
-        # Skip first iteration in the check
         if min_distance == float('inf'):
             # If we never updated min_distance (happens for z that stays at 0)
-            min_distance = self.trap_size  # Use max distance
+            return 0.0  # Max distance
+        if trap_code == 0:
+            min_distance = math.sqrt(min_distance)
         
-        dist_val = min_distance / self.trap_size
+        # Scale and invert so closer = higher value
+        # Clamp and invert: 0 distance = max_val, large distance = 0
+        dist_val = min_distance * self._inv_trap_size
         normalized = max(0, 1 - min(dist_val, 1))
         return normalized * max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _orbit_trap_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                                  bounds["ymax"], width, height, max_iter,
+                                  self._trap_code, self.trap_size)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        cr = cr.ravel().astype(dtype)
+        ci = ci.ravel().astype(dtype)
+        zr = np.zeros_like(cr)
+        zi = np.zeros_like(ci)
+        active = np.arange(cr.size)
+        min_distance = np.full(cr.size, np.inf)
+        running_min = np.full(cr.size, np.inf)  # Per orbit still running
+        trap_distance = self._trap_distance
+        trap_size = self.trap_size
+        
+        for i in range(max_iter):
+            escaped = zr * zr + zi * zi > 4.0
+            if escaped.any():
+                min_distance[active[escaped]] = running_min[escaped]
+                running = ~escaped
+                zr, zi, cr, ci = zr[running], zi[running], cr[running], ci[running]
+                active, running_min = active[running], running_min[running]
+                if not active.size:
+                    break
+            
+            # Skip the first iteration, z = 0 is not meaningful for most traps
+            if i > 0:
+                running_min = np.minimum(running_min, trap_distance(zr, zi, trap_size))
+            
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+        
+        if active.size:
+            min_distance[active] = running_min
+        
+        # Orbits that never left z = 0 count as being a full trap size away
+        min_distance[np.isinf(min_distance)] = trap_size
+        normalized = np.maximum(0, 1 - np.minimum(min_distance * self._inv_trap_size, 1))
+        return (normalized * max_iter).reshape(height, width)
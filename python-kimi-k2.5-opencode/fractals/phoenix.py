@@ -1,7 +1,96 @@
 """Phoenix fractal implementation."""
 
 import numpy as np
-from . import FractalBase, register_fractal, parse_complex_string
+from . import FractalBase, coordinate_grid, register_fractal, parse_complex_string, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import KERNEL_LANES, linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _phoenix_kernel(xmin, xmax, ymin, ymax, width, height, max_iter, pr, pi):
+        """Escape iterations for a width x height grid, rows in parallel.
+        
+        Each row is iterated KERNEL_LANES pixels at a time in lockstep, with
+        per-lane arrays and a select instead of a branch for finished lanes,
+        so the inner loop compiles to SIMD instructions. Lanes caught in a
+        cycle (see mandelbrot_utils) finish with counts max_iter + 1.
+        """
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci0 = ys[height - 1 - row]
+            cr = np.empty(KERNEL_LANES)
+            zr = np.empty(KERNEL_LANES)
+            zi = np.empty(KERNEL_LANES)
+            prev_r = np.empty(KERNEL_LANES)
+            prev_i = np.empty(KERNEL_LANES)
+            counts = np.empty(KERNEL_LANES, dtype=np.int64)
+            # Periodicity check; the state is z and z_prev, so both must repeat
+            saved_r = np.empty(KERNEL_LANES)
+            saved_i = np.empty(KERNEL_LANES)
+            saved_prev_r = np.empty(KERNEL_LANES)
+            saved_prev_i = np.empty(KERNEL_LANES)
+            for start in range(0, width, KERNEL_LANES):
+                n = min(KERNEL_LANES, width - start)
+                for k in range(KERNEL_LANES):
+                    cr[k] = xs[start + k] if k < n else 0.0
+                    zr[k] = 0.0
+                    zi[k] = 0.0
+                    prev_r[k] = 0.0
+                    prev_i[k] = 0.0
+                    saved_r[k] = 0.0
+                    saved_i[k] = 0.0
+                    saved_prev_r[k] = 0.0
+                    saved_prev_i[k] = 0.0
+                    # Padding lanes past the end of the row start out finished
+                    counts[k] = max_iter if k < n else 0
+                period = save_at = PERIOD_START
+                for i in range(max_iter):
+                    running = 0
+                    for k in range(KERNEL_LANES):
+                        zr2 = zr[k] * zr[k]
+                        zi2 = zi[k] * zi[k]
+                        run = counts[k] == max_iter
+                        if run and zr2 + zi2 > 4.0:
+                            counts[k] = i
+                            run = False
+                        # z = z² + c + p * z_prev, p loop-invariant; under fastmath LLVM
+                        # contracts the complex product into FMAs across the lane block
+                        new_r = zr2 - zi2 + cr[k] + (pr * prev_r[k] - pi * prev_i[k])
+                        new_i = 2.0 * zr[k] * zi[k] + ci0 + (pr * prev_i[k] + pi * prev_r[k])
+                        prev_r[k] = zr[k] if run else prev_r[k]
+                        prev_i[k] = zi[k] if run else prev_i[k]
+                        zr[k] = new_r if run else zr[k]
+                        zi[k] = new_i if run else zi[k]
+                        dr = zr[k] - saved_r[k]
+                        di = zi[k] - saved_i[k]
+                        er = prev_r[k] - saved_prev_r[k]
+                        ei = prev_i[k] - saved_prev_i[k]
+                        if run and dr * dr + di * di + er * er + ei * ei < PERIODICITY_EPS:
+                            counts[k] = max_iter + 1
+                            run = False
+                        running += run
+                    if i == save_at:
+                        for k in range(KERNEL_LANES):
+                            saved_r[k] = zr[k]
+                            saved_i[k] = zi[k]
+                            saved_prev_r[k] = prev_r[k]
+                            saved_prev_i[k] = prev_i[k]
+                        period = min(2 * period, PERIOD_MAX)
+                        save_at += period
+                    if running == 0:
+                        break
+                for k in range(n):
+                    out[row, start + k] = min(counts[k], max_iter)
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _phoenix_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 0.0, 0.0)
 
 
 @register_fractal("phoenix")
@@ -17,25 +106,72 @@ class PhoenixFractal(FractalBase):
             "description": "Phoenix constant p"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
         p_str = self.params.get("p", "0.5667")
         self.p = parse_complex_string(p_str)
+        # The default p is real, which drops the cross terms of p * z_prev
+        self._p_real = self.p.imag == 0.0
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.5, "ymin": -1.5, "ymax": 1.5}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        c = complex(x, y)
-        z = 0j
-        z_prev = 0j
+        pr, pi = self.p.real, self.p.imag
+        zr = zi = 0.0
+        prev_r = prev_i = 0.0
         
         for i in range(max_iter):
-            if abs(z) > 2:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
                 return float(i)
-            z_new = z * z + c + self.p * z_prev
-            z_prev = z
-            z = z_new
+            # z = z² + c + p * z_prev
+            new_r = zr2 - zi2 + x + (pr * prev_r - pi * prev_i)
+            new_i = 2.0 * zr * zi + y + (pr * prev_i + pi * prev_r)
+            prev_r, prev_i = zr, zi
+            zr, zi = new_r, new_i
         
         return float(max_iter)
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _phoenix_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                               bounds["ymax"], width, height, max_iter,
+                               self.p.real, self.p.imag)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        cr = cr.ravel().astype(dtype)
+        ci = ci.ravel().astype(dtype)
+        pr, pi = self.p.real, self.p.imag
+        zr = np.zeros_like(cr)
+        zi = np.zeros_like(ci)
+        prev_r = np.zeros_like(cr)
+        prev_i = np.zeros_like(ci)
+        active = np.arange(cr.size)
+        values = np.full(cr.size, float(max_iter))
+        
+        for i in range(max_iter):
+            escaped = zr * zr + zi * zi > 4.0
+            if escaped.any():
+                values[active[escaped]] = i
+                running = ~escaped
+                zr, zi, cr, ci = zr[running], zi[running], cr[running], ci[running]
+                prev_r, prev_i, active = prev_r[running], prev_i[running], active[running]
+                if not active.size:
+                    break
+            # z = z² + c + p * z_prev
+            if self._p_real:
+                new_r = zr * zr - zi * zi + cr + pr * prev_r
+                new_i = 2.0 * zr * zi + ci + pr * prev_i
+            else:
+                new_r = zr * zr - zi * zi + cr + (pr * prev_r - pi * prev_i)
+                new_i = 2.0 * zr * zi + ci + (pr * prev_i + pi * prev_r)
+            prev_r, prev_i = zr, zi
+            zr, zi = new_r, new_i
+        
+        return values.reshape(height, width)
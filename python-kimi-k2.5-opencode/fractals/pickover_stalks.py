@@ -1,7 +1,70 @@
 """Pickover stalks fractal implementation."""
 
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, register_fractal, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+_STALK_TYPES = ("both", "real", "imag", "diagonal")  # Kernel stalk codes, by index
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _stalks_kernel(xmin, xmax, ymin, ymax, width, height, max_iter, stalk_code, scale):
+        """Pickover stalk values for a width x height grid, rows in parallel.
+        
+        stalk_code is the stalk type's index in _STALK_TYPES.
+        """
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci = ys[height - 1 - row]
+            for col in range(width):
+                cr = xs[col]
+                zr = 0.0
+                zi = 0.0
+                min_real = np.inf
+                min_imag = np.inf
+                min_diagonal = np.inf
+                saved_r = saved_i = 0.0  # Periodicity check
+                period = save_at = PERIOD_START
+                for i in range(max_iter):
+                    if zr * zr + zi * zi > 4.0:
+                        break
+                    # Track minimum distances, skip first iteration
+                    if i > 0:
+                        real_abs = abs(zr)
+                        imag_abs = abs(zi)
+                        min_real = min(min_real, real_abs)
+                        min_imag = min(min_imag, imag_abs)
+                        min_diagonal = min(min_diagonal, real_abs + imag_abs)
+                        # Once z repeats, the cycle only revisits points already measured
+                        dr = zr - saved_r
+                        di = zi - saved_i
+                        if dr * dr + di * di < PERIODICITY_EPS:
+                            break
+                        if i == save_at:
+                            saved_r, saved_i = zr, zi
+                            period = min(2 * period, PERIOD_MAX)
+                            save_at += period
+                    zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+                if stalk_code == 1:
+                    dist_val = min_real * 10 * scale
+                elif stalk_code == 2:
+                    dist_val = min_imag * 10 * scale
+                elif stalk_code == 3:
+                    dist_val = min_diagonal * 10 * scale
+                else:
+                    dist_val = (min_real + min_imag) * 5 * scale
+                out[row, col] = max(0.0, min(1.0, 1.0 - dist_val)) * max_iter
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _stalks_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1, 0, 1.0)
 
 
 @register_fractal("mandelbrot_stalks")
@@ -25,6 +88,7 @@ class MandelbrotStalksFractal(FractalBase):
             "description": "Stalk intensity scale"
         }
     }
+    parallel_kernel = True
     
     def __init__(self, **params):
         super().__init__(**params)
@@ -34,44 +98,32 @@ class MandelbrotStalksFractal(FractalBase):
         except (ValueError, TypeError):
             self.scale = 1.0
         self.scale = max(0.1, min(5.0, self.scale))
+        # Stalk type as a _STALK_TYPES index, resolved once instead of per pixel;
+        # unknown stalk types combine both axes
+        self._stalk_code = (_STALK_TYPES.index(self.stalk_type)
+                            if self.stalk_type in _STALK_TYPES else 0)
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.0, "ymin": -1.25, "ymax": 1.25}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Mandelbrot with Pickover stalks coloring."""
-        c = complex(x, y)
-        z = 0
+        zr = zi = 0.0
         
         min_real = float('inf')
         min_imag = float('inf')
         min_diagonal = float('inf')
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                # Calculate stalk value based on type
-                if self.stalk_type == "real":
-                    # Track closest to y-axis (min |Re(z)|)
-                    dist_val = min_real * 10 * self.scale
-                elif self.stalk_type == "imag":
-                    # Track closest to x-axis (min |Im(z)|)
-                    dist_val = min_imag * 10 * self.scale
-                elif self.stalk_type == "diagonal":
-                    # Track closest to diagonal (|Re(z)| + |Im(z)|)
-                    dist_val = min_diagonal * 10 * self.scale
-                else:  # both
-                    # Combine both axes
-                    dist_val = (min_real + min_imag) * 5 * self.scale
-                
-                # Normalize and return
-                # Smaller distance = higher value (brighter)
-                normalized = max(0, min(1, 1 - dist_val))
-                return normalized * max_iter
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                break
             
             # Track minimum distances, skip first iteration
             if i > 0:
-                real_abs = abs(z.real)
-                imag_abs = abs(z.imag)
+                real_abs = abs(zr)
+                imag_abs = abs(zi)
                 
                 if real_abs < min_real:
                     min_real = real_abs
@@ -83,17 +135,83 @@ class MandelbrotStalksFractal(FractalBase):
                 if diagonal_dist < min_diagonal:
                     min_diagonal = diagonal_dist
             
-            z = z * z + c
+            zi = 2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
         
-        # Inside set
-        if self.stalk_type == "real":
+        # Escaped or inside the set, the value depends only on the minima
+        stalk_code = self._stalk_code
+        if stalk_code == 1:
+            # Track closest to y-axis (min |Re(z)|)
             dist_val = min_real * 10 * self.scale
-        elif self.stalk_type == "imag":
+        elif stalk_code == 2:
+            # Track closest to x-axis (min |Im(z)|)
             dist_val = min_imag * 10 * self.scale
-        elif self.stalk_type == "diagonal":
+        elif stalk_code == 3:
+            # Track closest to diagonal (|Re(z)| + |Im(z)|)
             dist_val = min_diagonal * 10 * self.scale
         else:  # both
+            # Combine both axes
             dist_val = (min_real + min_imag) * 5 * self.scale
         
+        # Smaller distance = higher value (brighter)
         normalized = max(0, min(1, 1 - dist_val))
         return normalized * max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _stalks_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                              bounds["ymax"], width, height, max_iter,
+                              self._stalk_code, self.scale)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        cr = cr.ravel().astype(dtype)
+        ci = ci.ravel().astype(dtype)
+        zr = np.zeros_like(cr)
+        zi = np.zeros_like(ci)
+        active = np.arange(cr.size)
+        
+        # Closest approach of each pixel's orbit, tracking only what the
+        # stalk type uses: |Re(z)| and |Im(z)| for "both", else one row
+        # of |Re(z)|, |Im(z)| or |Re(z)| + |Im(z)|
+        stalk_code = self._stalk_code
+        rows = 2 if stalk_code == 0 else 1
+        min_dist = np.full((rows, cr.size), np.inf, dtype=dtype)
+        run_min = np.full((rows, cr.size), np.inf, dtype=dtype)
+        
+        for i in range(max_iter):
+            escaped = zr * zr + zi * zi > 4.0
+            if escaped.any():
+                min_dist[:, active[escaped]] = run_min[:, escaped]
+                running = ~escaped
+                zr, zi, cr, ci = zr[running], zi[running], cr[running], ci[running]
+                active, run_min = active[running], run_min[:, running]
+                if not active.size:
+                    break
+            
+            # Track minimum distances, skip first iteration
+            if i > 0:
+                if stalk_code == 0:
+                    np.minimum(run_min[0], np.abs(zr), out=run_min[0])
+                    np.minimum(run_min[1], np.abs(zi), out=run_min[1])
+                elif stalk_code == 1:
+                    np.minimum(run_min[0], np.abs(zr), out=run_min[0])
+                elif stalk_code == 2:
+                    np.minimum(run_min[0], np.abs(zi), out=run_min[0])
+                else:
+                    np.minimum(run_min[0], np.abs(zr) + np.abs(zi), out=run_min[0])
+            
+            zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+        
+        if active.size:
+            min_dist[:, active] = run_min
+        
+        if stalk_code == 0:
+            # Combine both axes
+            dist_val = (min_dist[0] + min_dist[1]) * 5 * self.scale
+        else:
+            dist_val = min_dist[0] * 10 * self.scale
+        
+        normalized = np.clip(1 - dist_val, 0, 1)
+        return (normalized * max_iter).reshape(height, width)
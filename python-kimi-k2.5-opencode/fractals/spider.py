@@ -1,7 +1,93 @@
 """Spider fractal implementation."""
 
 import numpy as np
-from . import FractalBase, register_fractal
+from . import COMPACT_FRACTION, FractalBase, coordinate_grid, register_fractal, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import KERNEL_LANES, linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _spider_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Escape iterations for a width x height grid, rows in parallel.
+        
+        Each row is iterated KERNEL_LANES pixels at a time in lockstep, with
+        per-lane arrays and a select instead of a branch for finished lanes,
+        so the inner loop compiles to SIMD instructions. Lanes caught in a
+        cycle (see mandelbrot_utils) finish with counts max_iter + 1.
+        """
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci0 = ys[height - 1 - row]
+            cr = np.empty(KERNEL_LANES)
+            ci = np.empty(KERNEL_LANES)
+            zr = np.empty(KERNEL_LANES)
+            zi = np.empty(KERNEL_LANES)
+            counts = np.empty(KERNEL_LANES, dtype=np.int64)
+            # Periodicity check; c moves too, so it must repeat along with z
+            saved_zr = np.empty(KERNEL_LANES)
+            saved_zi = np.empty(KERNEL_LANES)
+            saved_cr = np.empty(KERNEL_LANES)
+            saved_ci = np.empty(KERNEL_LANES)
+            for start in range(0, width, KERNEL_LANES):
+                n = min(KERNEL_LANES, width - start)
+                for k in range(KERNEL_LANES):
+                    cr[k] = xs[start + k] if k < n else 0.0
+                    ci[k] = ci0
+                    zr[k] = 0.0
+                    zi[k] = 0.0
+                    saved_zr[k] = 0.0
+                    saved_zi[k] = 0.0
+                    saved_cr[k] = cr[k]
+                    saved_ci[k] = ci0
+                    # Padding lanes past the end of the row start out finished
+                    counts[k] = max_iter if k < n else 0
+                period = save_at = PERIOD_START
+                for i in range(max_iter):
+                    running = 0
+                    for k in range(KERNEL_LANES):
+                        zr2 = zr[k] * zr[k]
+                        zi2 = zi[k] * zi[k]
+                        run = counts[k] == max_iter
+                        if run and zr2 + zi2 > 4.0:
+                            counts[k] = i
+                            run = False
+                        # z = z² + c, then c = c/2 + z with the new z
+                        new_r = zr2 - zi2 + cr[k]
+                        new_i = 2.0 * zr[k] * zi[k] + ci[k]
+                        zr[k] = new_r if run else zr[k]
+                        zi[k] = new_i if run else zi[k]
+                        cr[k] = 0.5 * cr[k] + new_r if run else cr[k]
+                        ci[k] = 0.5 * ci[k] + new_i if run else ci[k]
+                        dr = zr[k] - saved_zr[k]
+                        di = zi[k] - saved_zi[k]
+                        er = cr[k] - saved_cr[k]
+                        ei = ci[k] - saved_ci[k]
+                        if run and dr * dr + di * di + er * er + ei * ei < PERIODICITY_EPS:
+                            counts[k] = max_iter + 1
+                            run = False
+                        running += run
+                    if i == save_at:
+                        for k in range(KERNEL_LANES):
+                            saved_zr[k] = zr[k]
+                            saved_zi[k] = zi[k]
+                            saved_cr[k] = cr[k]
+                            saved_ci[k] = ci[k]
+                        period = min(2 * period, PERIOD_MAX)
+                        save_at += period
+                    if running == 0:
+                        break
+                for k in range(n):
+                    out[row, start + k] = min(counts[k], max_iter)
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _spider_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
 
 
 @register_fractal("spider")
@@ -11,18 +97,64 @@ class SpiderFractal(FractalBase):
     name = "Spider"
     description = "z = z² + c, c = c/2 + z"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.5, "ymin": -2.0, "ymax": 2.0}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
-        c = complex(x, y)
-        z = 0
+        zr = zi = 0.0
+        cr, ci = x, y
         
         for i in range(max_iter):
-            if abs(z) > 2:
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
                 return float(i)
-            z = z * z + c
-            c = c / 2 + z
+            # z = z² + c, then c = c/2 + z with the new z
+            zi = 2.0 * zr * zi + ci
+            zr = zr2 - zi2 + cr
+            cr = 0.5 * cr + zr
+            ci = 0.5 * ci + zi
         
         return float(max_iter)
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _spider_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                              bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        cr = cr.ravel().astype(dtype)
+        ci = ci.ravel().astype(dtype)
+        zr = np.zeros_like(cr)
+        zi = np.zeros_like(ci)
+        active = np.arange(cr.size)
+        running = np.ones(cr.size, dtype=bool)
+        num_running = cr.size
+        values = np.full(cr.size, float(max_iter))
+        
+        # Escaped pixels are masked out and dropped in batches, as in
+        # escape_time_numpy; until then their orbits may overflow
+        with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+            for i in range(max_iter):
+                escaped = zr * zr + zi * zi > 4.0
+                escaped &= running
+                if escaped.any():
+                    values[active[escaped]] = i
+                    running &= ~escaped
+                    num_running -= np.count_nonzero(escaped)
+                    if not num_running:
+                        break
+                    if num_running <= (1.0 - COMPACT_FRACTION) * running.size:
+                        zr, zi, cr, ci = zr[running], zi[running], cr[running], ci[running]
+                        active = active[running]
+                        running = np.ones(num_running, dtype=bool)
+                # z = z² + c, then c = c/2 + z with the new z
+                zr, zi = zr * zr - zi * zi + cr, 2.0 * zr * zi + ci
+                cr = 0.5 * cr + zr
+                ci = 0.5 * ci + zi
+        
+        return values.reshape(height, width)
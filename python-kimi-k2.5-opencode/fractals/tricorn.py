@@ -1,7 +1,94 @@
 """Tricorn (Mandelbar) fractal implementation."""
 
+import math
 import numpy as np
-from . import FractalBase, register_fractal
+from . import FractalBase, coordinate_grid, escape_time_numpy, register_fractal, NUMBA_AVAILABLE
+from .mandelbrot_utils import PERIOD_MAX, PERIOD_START, PERIODICITY_EPS
+
+_INV_LOG2: float = 1.0 / math.log(2.0)  # Smooth-coloring log base
+
+if NUMBA_AVAILABLE:
+    from numba import njit, prange
+    from . import KERNEL_LANES, linspace_jit
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, parallel=True, nogil=True)
+    def _tricorn_kernel(xmin, xmax, ymin, ymax, width, height, max_iter):
+        """Escape-time values for a width x height grid, rows in parallel.
+        
+        Each row is iterated KERNEL_LANES pixels at a time in lockstep, with
+        per-lane arrays and a select instead of a branch for finished lanes,
+        so the inner loop compiles to SIMD instructions. Lanes caught in a
+        cycle (see mandelbrot_utils) finish with counts max_iter + 1.
+        """
+        xs = linspace_jit(xmin, xmax, width)
+        ys = linspace_jit(ymin, ymax, height)
+        out = np.empty((height, width))
+        for row in prange(height):
+            ci0 = ys[height - 1 - row]
+            cr = np.empty(KERNEL_LANES)
+            zr = np.empty(KERNEL_LANES)
+            zi = np.empty(KERNEL_LANES)
+            mag2 = np.empty(KERNEL_LANES)
+            saved_r = np.empty(KERNEL_LANES)  # Periodicity check
+            saved_i = np.empty(KERNEL_LANES)
+            counts = np.empty(KERNEL_LANES, dtype=np.int64)
+            for start in range(0, width, KERNEL_LANES):
+                n = min(KERNEL_LANES, width - start)
+                for k in range(KERNEL_LANES):
+                    cr[k] = xs[start + k] if k < n else 0.0
+                    zr[k] = 0.0
+                    zi[k] = 0.0
+                    saved_r[k] = 0.0
+                    saved_i[k] = 0.0
+                    # Padding lanes past the end of the row start out finished
+                    counts[k] = max_iter if k < n else 0
+                period = save_at = PERIOD_START
+                for i in range(max_iter):
+                    running = 0
+                    for k in range(KERNEL_LANES):
+                        zr2 = zr[k] * zr[k]
+                        zi2 = zi[k] * zi[k]
+                        run = counts[k] == max_iter
+                        if run and zr2 + zi2 > 4.0:
+                            counts[k] = i
+                            mag2[k] = zr2 + zi2
+                            run = False
+                        new_i = -2.0 * zr[k] * zi[k] + ci0
+                        zr[k] = zr2 - zi2 + cr[k] if run else zr[k]
+                        zi[k] = new_i if run else zi[k]
+                        dr = zr[k] - saved_r[k]
+                        di = zi[k] - saved_i[k]
+                        if run and dr * dr + di * di < PERIODICITY_EPS:
+                            counts[k] = max_iter + 1
+                            run = False
+                        running += run
+                    if i == save_at:
+                        for k in range(KERNEL_LANES):
+                            saved_r[k] = zr[k]
+                            saved_i[k] = zi[k]
+                        period = min(2 * period, PERIOD_MAX)
+                        save_at += period
+                    if running == 0:
+                        break
+                for k in range(n):
+                    if counts[k] < max_iter:
+                        log_zn = 0.5 * np.log(mag2[k])
+                        out[row, start + k] = counts[k] + 1 - np.log(log_zn * _INV_LOG2) * _INV_LOG2
+                    else:
+                        out[row, start + k] = max_iter
+        return out
+    
+    # Compile (or load from the on-disk cache) now rather than on first render
+    _tricorn_kernel(0.0, 1.0, 0.0, 1.0, 2, 2, 1)
+
+
+def _tricorn_step(zr, zi, cr, ci):
+    """One Tricorn step over arrays: conj(z)² + c on separate real/imaginary parts."""
+    zr2 = zr * zr
+    zi2 = zi * zi
+    return zr2 - zi2 + cr, -2.0 * zr * zi + ci
 
 
 @register_fractal("tricorn")
@@ -11,20 +98,35 @@ class TricornFractal(FractalBase):
     name = "Tricorn"
     description = "z = conj(z)² + c"
     parameters = {}
+    parallel_kernel = True
     
     def get_default_bounds(self):
         return {"xmin": -2.5, "xmax": 1.5, "ymin": -1.5, "ymax": 1.5}
     
     def compute_pixel(self, x: float, y: float, max_iter: int) -> float:
         """Compute Tricorn iteration with smooth coloring."""
-        c = complex(x, y)
-        z = 0j
+        zr = zi = 0.0
         
         for i in range(max_iter):
-            if abs(z) > 2:
-                log_zn = np.log(abs(z))
-                nu = np.log(log_zn / np.log(2)) / np.log(2)
+            zr2 = zr * zr
+            zi2 = zi * zi
+            if zr2 + zi2 > 4.0:
+                log_zn = 0.5 * math.log(zr2 + zi2)
+                nu = math.log(log_zn * _INV_LOG2) * _INV_LOG2
                 return i + 1 - nu
-            z = z.conjugate() ** 2 + c
+            # conj(z)² + c flips the sign of the cross term
+            zi = -2.0 * zr * zi + y
+            zr = zr2 - zi2 + x
         
         return max_iter
+    
+    def compute_image(self, bounds, width, height, max_iter, backend="auto", preview=False):
+        if not NUMBA_AVAILABLE:
+            return super().compute_image(bounds, width, height, max_iter, preview=preview)
+        return _tricorn_kernel(bounds["xmin"], bounds["xmax"], bounds["ymin"],
+                               bounds["ymax"], width, height, max_iter)
+    
+    def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+        cr, ci = coordinate_grid(bounds, width, height)
+        return escape_time_numpy(0.0 * cr, 0.0 * ci, cr, ci, max_iter, _tricorn_step,
+                                 dtype=dtype)
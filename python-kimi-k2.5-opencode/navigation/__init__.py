@@ -1,7 +1,7 @@
 """Zoom controller for fractal navigation."""
 
 from typing import Tuple, Optional
-from PIL import ImageTk
+from PIL import Image, ImageTk
 
 # Constants
 MIN_DRAG_THRESHOLD: int = 5  # Pixels
@@ -9,6 +9,7 @@ ZOOM_IN_FACTOR: float = 0.5
 ZOOM_OUT_FACTOR: float = 2.0
 WHEEL_ZOOM_IN_FACTOR: float = 0.8
 WHEEL_ZOOM_OUT_FACTOR: float = 1.25
+PREVIEW_INTERVAL_MS: int = 16  # Redraw the zoom preview at most ~60 Hz
 
 
 class ZoomController:
@@ -25,6 +26,9 @@ class ZoomController:
         self.drag_start: Optional[Tuple[int, int]] = None
         self.drag_current: Optional[Tuple[int, int]] = None
         self.selection_rect: Optional[int] = None
+        self._preview_box: Optional[Tuple[int, int, int, int]] = None
+        self._preview_item: Optional[int] = None
+        self._preview_after_id: Optional[str] = None
         
     def setup_bindings(self) -> None:
         """Setup mouse event bindings on the canvas."""
@@ -166,21 +170,22 @@ class ZoomController:
         Returns:
             Complex number corresponding to screen position
         """
-        bounds = self.app.get_bounds()
-        x_min, x_max = bounds["xmin"], bounds["xmax"]
-        y_min, y_max = bounds["ymin"], bounds["ymax"]
-        
-        # Map pixel coordinates to complex plane
-        real = x_min + (x / self.app.width) * (x_max - x_min)
-        imag = y_max - (y / self.app.height) * (y_max - y_min)
-        
-        return complex(real, imag)
+        return self.app.pixel_to_complex(x, y)
     
     def _display_zoom_preview(self, x1: int, y1: int, x2: int, y2: int) -> None:
+        """Schedule a preview of the zoomed region, coalescing rapid drags."""
+        self._preview_box = (x1, y1, x2, y2)
+        if self._preview_after_id is None:
+            self._preview_after_id = self.app.root.after(PREVIEW_INTERVAL_MS,
+                                                         self._flush_zoom_preview)
+    
+    def _flush_zoom_preview(self) -> None:
         """Display preview of zoomed region using subsampled image."""
+        self._preview_after_id = None
         try:
-            if not hasattr(self.app, 'image') or self.app.image is None:
+            if not hasattr(self.app, 'image') or self.app.image is None or self._preview_box is None:
                 return
+            x1, y1, x2, y2 = self._preview_box
             
             # Calculate selection rectangle in image coordinates
             img_width, img_height = self.app.image.size
@@ -199,19 +204,32 @@ class ZoomController:
             if px2 - px1 < MIN_DRAG_THRESHOLD or py2 - py1 < MIN_DRAG_THRESHOLD:
                 return
             
-            # Crop and resize the selected region
-            cropped = self.app.image.crop((px1, py1, px2, py2))
-            preview = cropped.resize((self.app.width, self.app.height), 0)  # 0 = NEAREST
+            # Resize straight from the selected box, without an intermediate crop
+            size = (self.app.width, self.app.height)
+            preview = self.app.image.resize(size, Image.NEAREST, box=(px1, py1, px2, py2))
             
-            # Display preview
-            self.app.preview_photo = ImageTk.PhotoImage(preview)
-            self.app.canvas.delete("all")
-            self.app.canvas.create_image(0, 0, anchor="nw", image=self.app.preview_photo)
+            # Paste into the existing PhotoImage and canvas item when they are
+            # still there; a new render or a resize clears the canvas
+            canvas = self.app.canvas
+            photo = getattr(self.app, 'preview_photo', None)
+            if photo is None or (photo.width(), photo.height()) != size:
+                photo = self.app.preview_photo = ImageTk.PhotoImage(preview)
+            else:
+                photo.paste(preview)
+            if self._preview_item is None or not canvas.type(self._preview_item):
+                self._preview_item = canvas.create_image(0, 0, anchor="nw", image=photo)
+            else:
+                canvas.itemconfigure(self._preview_item, image=photo, state="normal")
+                canvas.tag_raise(self._preview_item)
             
-            # Redraw selection rectangle
-            self.selection_rect = self.app.canvas.create_rectangle(
-                x1, y1, x2, y2, outline="white", width=2, dash=(5, 5)
-            )
+            # Keep the selection rectangle above the preview
+            if self.selection_rect and canvas.type(self.selection_rect):
+                canvas.coords(self.selection_rect, x1, y1, x2, y2)
+                canvas.tag_raise(self.selection_rect)
+            else:
+                self.selection_rect = canvas.create_rectangle(
+                    x1, y1, x2, y2, outline="white", width=2, dash=(5, 5)
+                )
             
         except Exception:
             # Silently fail if preview can't be created
@@ -220,8 +238,12 @@ class ZoomController:
     def _clear_zoom_preview(self) -> None:
         """Clear preview and restore original image."""
         try:
-            if hasattr(self.app, 'photo') and self.app.photo:
-                self.app.canvas.delete("all")
-                self.app.canvas.create_image(0, 0, anchor="nw", image=self.app.photo)
+            if self._preview_after_id is not None:
+                self.app.root.after_cancel(self._preview_after_id)
+                self._preview_after_id = None
+            self._preview_box = None
+            # The rendered image is still underneath, so hiding the preview reveals it
+            if self._preview_item is not None:
+                self.app.canvas.itemconfigure(self._preview_item, state="hidden")
         except Exception:
             pass
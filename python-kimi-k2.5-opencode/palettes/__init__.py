@@ -4,9 +4,16 @@ Color palette module.
 Each palette should inherit from PaletteBase and implement get_color().
 """
 
+import importlib
+import pkgutil
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Type, Tuple
 
+import numpy as np
+
+# Constants
+PALETTE_LUT_SIZE: int = 4096  # Colors sampled per palette for get_colors
+
 
 class PaletteBase(ABC):
     """Base class for all color palette implementations."""
@@ -19,6 +26,37 @@ class PaletteBase(ABC):
     def __init__(self, **params):
         """Initialize with parameters."""
         self.params = params
+        self._lut: Optional[np.ndarray] = None  # build_lut result, dropped by set_params
+        self._apply_params()
+    
+    def _apply_params(self) -> None:
+        """
+        Resolve self.params into plain attributes.
+        
+        Called on construction and by set_params. Palettes with parameters
+        override this so get_color reads attributes instead of looking each
+        parameter up for every color.
+        """
+        pass
+    
+    def _param(self, name: str) -> Any:
+        """
+        Read a parameter, converted to its declared type and clamped to its
+        declared range; values that do not convert fall back to the default.
+        """
+        spec = self.parameters[name]
+        value = self.params.get(name, spec["default"])
+        try:
+            if spec["type"] == "bool":
+                return bool(value)
+            value = int(value) if spec["type"] == "int" else float(value)
+        except (ValueError, TypeError):
+            return spec["default"]
+        if "min" in spec:
+            value = max(spec["min"], value)
+        if "max" in spec:
+            value = min(spec["max"], value)
+        return value
     
     @abstractmethod
     def get_color(self, value: float, max_val: float) -> Tuple[int, int, int]:
@@ -34,6 +72,42 @@ class PaletteBase(ABC):
         """
         pass
     
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        """
+        Sample the palette into a color lookup table.
+        
+        Colors depend only on value / max_val, so the palette is sampled at
+        value = k and max_val = n. The default calls get_color once per
+        entry; palettes with closed-form colors override this with array math.
+        
+        Args:
+            n: Number of samples over [0, 1)
+            
+        Returns:
+            uint8 array of shape (n + 1, 3); row k is the color of
+            value / max_val = k / n, and row n the color of points inside
+            the set (value >= max_val)
+        """
+        return np.array([self.get_color(k, n) for k in range(n + 1)], dtype=np.uint8)
+    
+    def get_colors(self, values: np.ndarray, max_val: float) -> np.ndarray:
+        """
+        Color a whole array of iteration values with one table lookup.
+        
+        Values are quantized to 1 / PALETTE_LUT_SIZE of max_val; the table
+        is built on first use and kept until the parameters change.
+        
+        Args:
+            values: Iteration values of any shape
+            max_val: Maximum iteration count
+            
+        Returns:
+            uint8 array of shape values.shape + (3,)
+        """
+        if self._lut is None:
+            self._lut = self.build_lut()
+        return lookup_colors(self._lut, values, max_val)
+    
     def get_params(self) -> Dict[str, Any]:
         """Get current parameters."""
         return self.params
@@ -41,12 +115,32 @@ class PaletteBase(ABC):
     def set_params(self, **params):
         """Update parameters."""
         self.params.update(params)
+        self._lut = None
+        self._apply_params()
+
+
+def lookup_colors(lut: np.ndarray, values: np.ndarray, max_val: float) -> np.ndarray:
+    """
+    Color iteration values through a table from PaletteBase.build_lut.
+    
+    Args:
+        lut: uint8 array of shape (n + 1, 3)
+        values: Iteration values of any shape
+        max_val: Maximum iteration count
+        
+    Returns:
+        uint8 array of shape values.shape + (3,)
+    """
+    n = len(lut) - 1
+    index = np.clip(np.asarray(values) * (n / max_val), 0, n).astype(np.intp)
+    return lut[index]
 
 
 class PaletteRegistry:
     """Registry for palette implementations."""
     
     _palettes: Dict[str, Type[PaletteBase]] = {}
+    _sorted_names: Optional[list] = None  # Sorted palette names, rebuilt after register
     
     @classmethod
     def register(cls, name: str, palette_class: Type[PaletteBase]):
@@ -54,6 +148,7 @@ class PaletteRegistry:
         if not issubclass(palette_class, PaletteBase):
             raise ValueError(f"Palette must inherit from PaletteBase: {palette_class}")
         cls._palettes[name] = palette_class
+        cls._sorted_names = None
     
     @classmethod
     def get(cls, name: str) -> Optional[Type[PaletteBase]]:
@@ -63,7 +158,9 @@ class PaletteRegistry:
     @classmethod
     def list_palettes(cls) -> list:
         """List all registered palette names."""
-        return sorted(cls._palettes.keys())
+        if cls._sorted_names is None:
+            cls._sorted_names = sorted(cls._palettes.keys())
+        return list(cls._sorted_names)
     
     @classmethod
     def create(cls, name: str, **params) -> PaletteBase:
@@ -82,3 +179,12 @@ def register_palette(name: str):
         cls.name = name
         return cls
     return decorator
+
+
+def _autoload() -> None:
+    """Import every module in this package so its @register_palette classes register."""
+    for module in pkgutil.iter_modules(__path__):
+        importlib.import_module(f"{__name__}.{module.name}")
+
+
+_autoload()
@@ -1,7 +1,36 @@
 """Standard color palette implementations."""
 
 import colorsys
-from . import PaletteBase, register_palette
+import numpy as np
+from . import PALETTE_LUT_SIZE, PaletteBase, register_palette
+
+
+def _lut_from_channels(r, g, b) -> np.ndarray:
+    """Stack float channel arrays (truncated like int()) into a lookup table
+    whose last row, the inside of the set, is black."""
+    lut = np.stack([r, g, b], axis=-1).astype(np.uint8)
+    lut[-1] = 0
+    return lut
+
+
+def _hsv_lut(hue: np.ndarray, sat: float, val: float) -> np.ndarray:
+    """colorsys.hsv_to_rgb over an array of hues, as a lookup table.
+    
+    Same arithmetic as colorsys, with the six-way sector branch done by
+    np.choose, so the table matches per-color sampling exactly.
+    """
+    h6 = hue * 6.0
+    sector = h6.astype(np.int64)
+    f = h6 - sector
+    v = np.full_like(hue, val)
+    p = np.full_like(hue, val * (1.0 - sat))
+    q = val * (1.0 - sat * f)
+    t = val * (1.0 - sat * (1.0 - f))
+    sector %= 6
+    r = np.choose(sector, [v, q, p, p, t, v])
+    g = np.choose(sector, [t, v, v, q, p, p])
+    b = np.choose(sector, [p, p, t, v, v, q])
+    return _lut_from_channels(r * 255, g * 255, b * 255)
 
 
 @register_palette("smooth")
@@ -16,16 +45,22 @@ class SmoothPalette(PaletteBase):
         "value": {"type": "float", "default": 0.9, "min": 0.0, "max": 1.0, "description": "Brightness"}
     }
     
+    def _apply_params(self) -> None:
+        self.hue = self._param("hue")
+        self.sat = self._param("saturation")
+        self.val = self._param("value")
+    
     def get_color(self, value: float, max_val: float):
         if value >= max_val:
             return (0, 0, 0)
         
-        hue = (self.params.get("hue", 0.0) + value / max_val) % 1.0
-        sat = self.params.get("saturation", 0.8)
-        val = self.params.get("value", 0.9)
-        
-        r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
+        hue = (self.hue + value / max_val) % 1.0
+        r, g, b = colorsys.hsv_to_rgb(hue, self.sat, self.val)
         return (int(r * 255), int(g * 255), int(b * 255))
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        hue = (self.hue + np.arange(n + 1) / n) % 1.0
+        return _hsv_lut(hue, self.sat, self.val)
 
 
 @register_palette("banded")
@@ -40,18 +75,24 @@ class BandedPalette(PaletteBase):
         "value": {"type": "float", "default": 0.9, "min": 0.0, "max": 1.0, "description": "Brightness"}
     }
     
+    def _apply_params(self) -> None:
+        self.bands = self._param("bands")
+        self.sat = self._param("saturation")
+        self.val = self._param("value")
+    
     def get_color(self, value: float, max_val: float):
         if value >= max_val:
             return (0, 0, 0)
         
-        bands = self.params.get("bands", 16)
+        bands = self.bands
         band = int(value / max_val * bands) % bands
-        hue = band / bands
-        sat = self.params.get("saturation", 0.8)
-        val = self.params.get("value", 0.9)
-        
-        r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
+        r, g, b = colorsys.hsv_to_rgb(band / bands, self.sat, self.val)
         return (int(r * 255), int(g * 255), int(b * 255))
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        bands = self.bands
+        band = (np.arange(n + 1) / n * bands).astype(np.int64) % bands
+        return _hsv_lut(band / bands, self.sat, self.val)
 
 
 @register_palette("grayscale")
@@ -64,14 +105,24 @@ class GrayscalePalette(PaletteBase):
         "invert": {"type": "bool", "default": False, "description": "Invert colors"}
     }
     
+    def _apply_params(self) -> None:
+        self.invert = self._param("invert")
+    
     def get_color(self, value: float, max_val: float):
         if value >= max_val:
             return (0, 0, 0)
         
         v = int(255 * value / max_val)
-        if self.params.get("invert", False):
+        if self.invert:
             v = 255 - v
         return (v, v, v)
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        k = np.arange(n + 1)
+        v = (255 * k / n).astype(np.int64)
+        if self.invert:
+            v = 255 - v
+        return _lut_from_channels(v, v, v)
 
 
 @register_palette("fire")
@@ -91,6 +142,12 @@ class FirePalette(PaletteBase):
         g = int(255 * max(0, min(1, (t - 0.5) * 2)))
         b = int(255 * max(0, t - 0.75) * 4)
         return (r, g, b)
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        t = np.arange(n + 1) / n
+        return _lut_from_channels(255 * np.minimum(1, t * 2),
+                                  255 * np.clip((t - 0.5) * 2, 0, 1),
+                                  255 * np.maximum(0, t - 0.75) * 4)
 
 
 @register_palette("ocean")
@@ -110,6 +167,12 @@ class OceanPalette(PaletteBase):
         g = int(255 * min(1, t * 1.5))
         b = int(255 * (0.3 + 0.7 * t))
         return (r, g, b)
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        t = np.arange(n + 1) / n
+        return _lut_from_channels(255 * np.maximum(0, t - 0.5) * 2,
+                                  255 * np.minimum(1, t * 1.5),
+                                  255 * (0.3 + 0.7 * t))
 
 
 @register_palette("rainbow")
@@ -123,16 +186,21 @@ class RainbowPalette(PaletteBase):
         "value": {"type": "float", "default": 1.0, "min": 0.0, "max": 1.0, "description": "Brightness"}
     }
     
+    def _apply_params(self) -> None:
+        self.sat = self._param("saturation")
+        self.val = self._param("value")
+    
     def get_color(self, value: float, max_val: float):
         if value >= max_val:
             return (0, 0, 0)
         
         hue = (value / max_val) % 1.0
-        sat = self.params.get("saturation", 1.0)
-        val = self.params.get("value", 1.0)
-        
-        r, g, b = colorsys.hsv_to_rgb(hue, sat, val)
+        r, g, b = colorsys.hsv_to_rgb(hue, self.sat, self.val)
         return (int(r * 255), int(g * 255), int(b * 255))
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        hue = (np.arange(n + 1) / n) % 1.0
+        return _hsv_lut(hue, self.sat, self.val)
 
 
 @register_palette("electric")
@@ -152,6 +220,13 @@ class ElectricPalette(PaletteBase):
         g = int(255 * (0.5 + t * 0.5))
         b = int(255 * (0.8 + t * 0.2))
         return (min(255, r), min(255, g), min(255, b))
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        t = np.arange(n + 1) / n
+        # Truncate before clamping, as get_color does
+        channels = [np.minimum(255, (255 * c).astype(np.int64))
+                    for c in (t * 0.2, 0.5 + t * 0.5, 0.8 + t * 0.2)]
+        return _lut_from_channels(*channels)
 
 
 @register_palette("neon")
@@ -172,3 +247,10 @@ class NeonPalette(PaletteBase):
             return (int(255 * (0.5 + 0.5 * t)), int(255 * 0.2), int(255 * (0.8 + 0.2 * t)))
         else:
             return (int(255 * 0.2), int(255 * (0.8 + 0.2 * t)), int(255 * 0.3))
+    
+    def build_lut(self, n: int = PALETTE_LUT_SIZE) -> np.ndarray:
+        t = np.arange(n + 1) / n
+        pink = (t * 8).astype(np.int64) % 2 == 0
+        return _lut_from_channels(np.where(pink, 255 * (0.5 + 0.5 * t), int(255 * 0.2)),
+                                  np.where(pink, int(255 * 0.2), 255 * (0.8 + 0.2 * t)),
+                                  np.where(pink, 255 * (0.8 + 0.2 * t), int(255 * 0.3)))
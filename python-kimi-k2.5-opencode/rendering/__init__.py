@@ -3,13 +3,14 @@
 import numpy as np
 from PIL import Image, ImageTk
 import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Any, TYPE_CHECKING
 
 # Import at module level to avoid repeated imports in render method
 from fractals import FractalRegistry
-from fractals.ifs_base import IFSFractalBase
+from fractals.ifs_base import IFSFractalBase, bin_points, shade_counts
 
-from .parallel import compute_fractal_parallel
+from .parallel import compute_fractal_parallel, compute_fractal_preview
 
 if TYPE_CHECKING:
     pass  # Avoid circular imports
@@ -17,12 +18,10 @@ if TYPE_CHECKING:
 # Constants
 THREAD_JOIN_TIMEOUT: float = 1.0
 DEFAULT_IFS_POINTS: int = 100000
-IFS_GAMMA: float = 0.5
-IFS_COLOR_TINT: tuple = (0.3, 0.9, 0.2)  # RGB multipliers
 IFS_PROGRESS_INTERVAL: int = 10000  # Update progress every N points
 
 # Re-export for convenience
-__all__ = ['RenderEngine', 'compute_fractal_parallel']
+__all__ = ['RenderEngine', 'compute_fractal_parallel', 'compute_fractal_preview']
 
 
 class RenderEngine:
@@ -40,6 +39,20 @@ class RenderEngine:
         self.render_thread: Optional[threading.Thread] = None
         self._cancel_render: bool = False
         
+        # IFS renders run on one reusable worker; a generation counter lets
+        # a newer request supersede a render that is already running
+        self._ifs_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ifs-render")
+        self._ifs_future: Optional[Future] = None
+        self._ifs_generation: int = 0
+        
+        # Last IFS point cloud and histogram (worker thread only). Points
+        # depend only on the fractal and its parameters, counts also on the view.
+        self._ifs_points_key: Optional[tuple] = None
+        self._ifs_points: Optional[np.ndarray] = None
+        self._ifs_counts_key: Optional[tuple] = None
+        self._ifs_counts: Optional[np.ndarray] = None
+        self._last_fractal_class: Optional[type] = None
+        
     def render(self) -> None:
         """Render the fractal using parallel processing."""
         if self.is_rendering:
@@ -51,6 +64,11 @@ class RenderEngine:
                     self.app.status_var.set("Warning: Render thread did not terminate in time")
             self._cancel_render = False
         
+        # Supersede any queued or running IFS render
+        self._ifs_generation += 1
+        if self._ifs_future is not None:
+            self._ifs_future.cancel()
+        
         self.is_rendering = True
         self.app.status_var.set(f"Rendering {self.app.fractal_name}...")
         self.app.progress_var.set(0)
@@ -66,17 +84,47 @@ class RenderEngine:
             self.is_rendering = False
             return
         
+        # Drop the last IFS point cloud and histogram once another fractal is
+        # shown. The clear runs on the IFS worker, behind any superseded job,
+        # so the caches are still only touched from that thread.
+        if fractal_class is not self._last_fractal_class:
+            self._last_fractal_class = fractal_class
+            self._ifs_pool.submit(self._clear_ifs_caches)
+        
         if is_ifs:
             self._render_ifs()
         else:
             self._render_escape_time()
     
+    def _clear_ifs_caches(self) -> None:
+        """Release the cached IFS point cloud and histogram (IFS worker only)."""
+        self._ifs_points_key = None
+        self._ifs_points = None
+        self._ifs_counts_key = None
+        self._ifs_counts = None
+    
     def _render_escape_time(self) -> None:
         """Render escape-time fractal using parallel processing."""
         def render_thread() -> None:
             try:
                 bounds = self.app.get_bounds()
                 
+                # Pool renders take a while; show a blocky quick look first
+                preview = compute_fractal_preview(
+                    width=self.app.width,
+                    height=self.app.height,
+                    bounds=bounds,
+                    fractal_name=self.app.fractal_name,
+                    fractal_params=self.app.fractal_params,
+                    max_iter=self.app.max_iter,
+                    palette_name=self.app.palette_name,
+                    palette_params=self.app.palette_params,
+                    backend=self.app.backend
+                )
+                if preview is not None and not self._cancel_render:
+                    size = (self.app.width, self.app.height)
+                    self.app.root.after(0, lambda: self._show_preview(preview, size))
+                
                 img_array = compute_fractal_parallel(
                     width=self.app.width,
                     height=self.app.height,
@@ -88,13 +136,15 @@ class RenderEngine:
                     palette_params=self.app.palette_params,
                     num_workers=self.app.num_workers,
                     progress_callback=self._progress_callback,
-                    cancel_check=self._cancel_check
+                    cancel_check=self._cancel_check,
+                    backend=self.app.backend
                 )
                 
                 if img_array is not None and not self._cancel_render:
                     self.app.root.after(0, lambda: self.display_image(img_array))
             except Exception as e:
-                self.app.root.after(0, lambda: self.app.status_var.set(f"Error: {str(e)}"))
+                message = f"Error: {e}"
+                self.app.root.after(0, lambda: self.app.status_var.set(message))
             finally:
                 self.is_rendering = False
         
@@ -102,83 +152,67 @@ class RenderEngine:
         self.render_thread.start()
     
     def _render_ifs(self) -> None:
-        """Render IFS fractal using point generation with incremental progress."""
-        def render_thread() -> None:
+        """Render IFS fractal on the IFS worker and hand the image to the Tk thread."""
+        # Snapshot the view on the Tk thread; the worker must not read live UI state
+        fractal_class = FractalRegistry.get(self.app.fractal_name)
+        fractal_params = dict(self.app.fractal_params)
+        bounds = self.app.get_bounds().copy()
+        width, height = self.app.width, self.app.height
+        
+        generation = self._ifs_generation
+        
+        def set_progress(progress: float) -> None:
+            if generation == self._ifs_generation:
+                self.app.root.after(0, lambda: self.app.progress_var.set(progress))
+        
+        def render_job() -> None:
             try:
-                fractal_class = FractalRegistry.get(self.app.fractal_name)
                 if fractal_class is None:
                     raise ValueError(f"Unknown fractal: {self.app.fractal_name}")
                 
-                # Create IFS fractal instance
-                ifs_fractal = fractal_class(**self.app.fractal_params)
-                
-                # Get number of points to generate
-                num_points = getattr(ifs_fractal, 'num_points', DEFAULT_IFS_POINTS)
-                
-                # Generate points with progress updates
-                points = ifs_fractal.generate_points(num_points)
-                progress = 10  # Start at 10%
-                self.app.root.after(0, lambda p=progress: self.app.progress_var.set(p))
-                
-                # Create histogram/image buffer
-                bounds = self.app.get_bounds()
-                width, height = self.app.width, self.app.height
-                img_buffer = np.zeros((height, width), dtype=np.float64)
+                points_key = (fractal_class, tuple(sorted(fractal_params.items())))
+                if points_key != self._ifs_points_key:
+                    # Create IFS fractal instance
+                    ifs_fractal = fractal_class(**fractal_params)
+                    
+                    # Get number of points to generate
+                    num_points = getattr(ifs_fractal, 'num_points', DEFAULT_IFS_POINTS)
+                    
+                    # Generate points (Numba kernels release the GIL while they run)
+                    self._ifs_points_key = None
+                    self._ifs_points = ifs_fractal.generate_points(num_points)
+                    self._ifs_points_key = points_key
+                set_progress(10)
                 
-                # Map points to pixel coordinates with incremental progress
-                x_min, x_max = bounds['xmin'], bounds['xmax']
-                y_min, y_max = bounds['ymin'], bounds['ymax']
+                # Bin points into per-pixel counts; palette and iteration
+                # changes keep the view, so they reuse the last histogram
+                counts_key = (points_key, bounds['xmin'], bounds['xmax'],
+                              bounds['ymin'], bounds['ymax'], width, height)
+                if counts_key != self._ifs_counts_key:
+                    self._ifs_counts_key = None
+                    self._ifs_counts = bin_points(self._ifs_points, width, height, bounds)
+                    self._ifs_counts_key = counts_key
+                counts = self._ifs_counts
+                set_progress(40)
                 
-                x_scale = width / (x_max - x_min)
-                y_scale = height / (y_max - y_min)
+                # Gamma-corrected, tinted conversion straight into an RGBA
+                # buffer that PIL wraps in place instead of copying
+                rgba = shade_counts(counts, alpha=True)
+                image = Image.frombuffer('RGBA', (width, height), rgba, 'raw', 'RGBA', 0, 1)
+                set_progress(90)
                 
-                # Vectorized coordinate transformation
-                px = ((points[:, 0] - x_min) * x_scale).astype(np.int32)
-                py = ((y_max - points[:, 1]) * y_scale).astype(np.int32)
-                
-                # Filter points within bounds
-                mask = (px >= 0) & (px < width) & (py >= 0) & (py < height)
-                px_valid = px[mask]
-                py_valid = py[mask]
-                
-                # Accumulate points
-                np.add.at(img_buffer, (py_valid, px_valid), 1)
-                
-                # Update progress during accumulation (if many points)
-                if num_points > 50000:
-                    progress = 40
-                    self.app.root.after(0, lambda p=progress: self.app.progress_var.set(p))
-                
-                # Normalize
-                max_val = img_buffer.max()
-                if max_val > 0:
-                    img_buffer = img_buffer / max_val
-                
-                if num_points > 50000:
-                    progress = 60
-                    self.app.root.after(0, lambda p=progress: self.app.progress_var.set(p))
-                
-                # Vectorized RGB conversion
-                intensity = (255 * img_buffer ** IFS_GAMMA).astype(np.uint8)
-                
-                # Create RGB image with color tint
-                rgb_img = np.zeros((height, width, 3), dtype=np.uint8)
-                rgb_img[:, :, 0] = (intensity * IFS_COLOR_TINT[0]).astype(np.uint8)
-                rgb_img[:, :, 1] = (intensity * IFS_COLOR_TINT[1]).astype(np.uint8)
-                rgb_img[:, :, 2] = (intensity * IFS_COLOR_TINT[2]).astype(np.uint8)
-                
-                progress = 90
-                self.app.root.after(0, lambda p=progress: self.app.progress_var.set(p))
-                
-                if rgb_img is not None and not self._cancel_render:
-                    self.app.root.after(0, lambda: self.display_image(rgb_img))
+                if generation == self._ifs_generation:
+                    self.app.root.after(0, lambda: self._show_image(image))
             except Exception as e:
-                self.app.root.after(0, lambda: self.app.status_var.set(f"Error: {str(e)}"))
+                if generation == self._ifs_generation:
+                    message = f"Error: {e}"
+                    self.app.root.after(0, lambda: self.app.status_var.set(message))
             finally:
-                self.is_rendering = False
+                if generation == self._ifs_generation:
+                    self.is_rendering = False
         
-        self.render_thread = threading.Thread(target=render_thread, daemon=True)
-        self.render_thread.start()
+        self.render_thread = None
+        self._ifs_future = self._ifs_pool.submit(render_job)
     
     def _cancel_check(self) -> bool:
         """Check if rendering should be cancelled."""
@@ -205,11 +239,29 @@ class RenderEngine:
                 self.app.status_var.set("Error: Image contains invalid values (NaN/Inf)")
                 return
             
-            self.app.image = Image.fromarray(img_array)
-            self.app.photo = ImageTk.PhotoImage(self.app.image)
-            
-            self.app.canvas.delete("all")
-            self.app.canvas.create_image(0, 0, anchor="nw", image=self.app.photo)
+            self._show_image(Image.fromarray(img_array))
+        except Exception as e:
+            self.app.status_var.set(f"Error displaying image: {str(e)}")
+    
+    def _show_preview(self, img_array: np.ndarray, size: tuple) -> None:
+        """Show a quick-look image scaled up to the canvas (Tk thread only)."""
+        try:
+            self._put_image(Image.fromarray(img_array).resize(size, Image.NEAREST))
+        except Exception as e:
+            self.app.status_var.set(f"Error displaying preview: {str(e)}")
+    
+    def _put_image(self, image: Image.Image) -> None:
+        """Replace the canvas contents with an image (Tk thread only)."""
+        self.app.image = image
+        self.app.photo = ImageTk.PhotoImage(self.app.image)
+        
+        self.app.canvas.delete("all")
+        self.app.canvas.create_image(0, 0, anchor="nw", image=self.app.photo)
+    
+    def _show_image(self, image: Image.Image) -> None:
+        """Put a finished image on the canvas (Tk thread only)."""
+        try:
+            self._put_image(image)
             
             bounds = self.app.get_bounds()
             info = (f"{self.app.fractal_name}: x=[{bounds['xmin']:.6f}, {bounds['xmax']:.6f}], "
@@ -2,35 +2,63 @@
 
 import numpy as np
 import multiprocessing as mp
+from multiprocessing import shared_memory
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from typing import Callable, Optional
 
+from fractals.cuda_kernels import use_cuda
 
-def compute_row_wrapper(args):
-    """Wrapper for computing a single row - must be module-level for pickling."""
-    row_idx, x_coords, y_coord, fractal_name, fractal_params, max_iter, palette_name, palette_params = args
-    
+# Constants
+TILES_PER_WORKER: int = 4  # Row tiles queued per worker process
+IN_PROCESS_BANDS: int = 16  # Row bands of an in-process render, for progress and cancellation
+PREVIEW_SCALE: int = 8  # Quick-look renders 1/PREVIEW_SCALE of each image dimension
+
+
+def _row_tiles(bounds: dict, height: int, num_tiles: int):
+    """Split a viewport into contiguous row tiles of (row_start, row_end, tile_bounds)."""
+    # Pixel rows run top (ymax) to bottom (ymin)
+    y = np.linspace(bounds["ymin"], bounds["ymax"], height)[::-1]
+    edges = np.linspace(0, height, max(1, min(height, num_tiles)) + 1).astype(int)
+    return [(int(row_start), int(row_end),
+             {"xmin": bounds["xmin"], "xmax": bounds["xmax"],
+              "ymin": float(y[row_end - 1]), "ymax": float(y[row_start])})
+            for row_start, row_end in zip(edges[:-1], edges[1:])]
+
+
+# Per-process state of pool workers, set once by _init_tile_worker
+_worker_state: dict = {}
+
+
+def _init_tile_worker(shm_name: str, shape: tuple, fractal_name: str, fractal_params: dict,
+                      palette_lut: np.ndarray) -> None:
+    """Attach a pool worker to the shared output image and build its fractal once."""
     # Import here to avoid circular imports and ensure fresh imports in subprocess
     from fractals import FractalRegistry
-    from palettes import PaletteRegistry
     
-    # Create fractal and palette instances
-    try:
-        fractal = FractalRegistry.create(fractal_name, **fractal_params)
-        palette = PaletteRegistry.create(palette_name, **palette_params)
-    except Exception as e:
-        # Return empty row on error
-        width = len(x_coords)
-        return (row_idx, np.zeros((width, 3), dtype=np.uint8))
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _worker_state["shm"] = shm  # Keeps the mapping alive for the worker's lifetime
+    _worker_state["out"] = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf)
+    _worker_state["fractal"] = FractalRegistry.create(fractal_name, **fractal_params)
+    _worker_state["lut"] = palette_lut
+
+
+def compute_tile_wrapper(args):
+    """Wrapper for computing a tile of rows - must be module-level for pickling.
     
-    width = len(x_coords)
-    row = np.zeros((width, 3), dtype=np.uint8)
+    The colored tile is written straight into the shared output image, so
+    only the tile's row range travels back to the parent.
+    """
+    row_start, tile_bounds, width, tile_height, max_iter = args
     
-    for j in range(width):
-        x = x_coords[j]
-        value = fractal.compute_pixel(x, y_coord, max_iter)
-        row[j] = palette.get_color(value, max_iter)
+    from palettes import lookup_colors
     
-    return (row_idx, row)
+    # The tile is its own viewport, so fractals with a compiled kernel fill it in one call
+    fractal = _worker_state["fractal"]
+    values = fractal.compute_image(tile_bounds, width, tile_height, max_iter, backend="cpu")
+    
+    _worker_state["out"][row_start:row_start + tile_height] = lookup_colors(
+        _worker_state["lut"], values, max_iter)
+    return (row_start, tile_height)
 
 
 def compute_fractal_parallel(
@@ -44,11 +72,17 @@ def compute_fractal_parallel(
     palette_params: dict,
     num_workers: Optional[int] = None,
     progress_callback: Optional[Callable[[float], None]] = None,
-    cancel_check: Optional[Callable[[], bool]] = None
+    cancel_check: Optional[Callable[[], bool]] = None,
+    backend: str = "auto"
 ) -> Optional[np.ndarray]:
     """
     Compute fractal using parallel processing.
     
+    Fractals whose compute_image is a thread-parallel Numba kernel (see
+    FractalBase.uses_parallel_kernel) render in this process, in
+    IN_PROCESS_BANDS bands that each use every core, so num_workers does
+    not apply to them and no worker has to start or import the fractals.
+    
     Args:
         width, height: Image dimensions
         bounds: Viewport bounds dict with xmin, xmax, ymin, ymax
@@ -60,54 +94,167 @@ def compute_fractal_parallel(
         num_workers: Number of worker processes (default: CPU count - 1)
         progress_callback: Called with progress percentage (0-100)
         cancel_check: Called periodically, return True to cancel
+        backend: "auto", "cpu" or "cuda"; when the GPU is used the whole
+            view is one kernel launch in this process instead of row tiles
         
     Returns:
         Numpy array of shape (height, width, 3) or None if cancelled
     """
+    if use_cuda(backend, width, height):
+        return _compute_fractal_cuda(width, height, bounds, fractal_name, fractal_params,
+                                     max_iter, palette_name, palette_params, backend,
+                                     progress_callback, cancel_check)
+    
+    from fractals import FractalRegistry
+    fractal = FractalRegistry.create(fractal_name, **fractal_params)
+    if fractal.uses_parallel_kernel(bounds):
+        return _compute_fractal_in_process(width, height, bounds, fractal, max_iter,
+                                           palette_name, palette_params,
+                                           progress_callback, cancel_check)
+    
     if num_workers is None:
         num_workers = max(1, mp.cpu_count() - 1)
     
-    # Generate coordinate arrays
-    x = np.linspace(bounds["xmin"], bounds["xmax"], width)
-    y = np.linspace(bounds["ymin"], bounds["ymax"], height)
+    # The palette is sampled once here and handed to each worker with the
+    # fractal, rather than rebuilt from palette_name / palette_params per tile
+    from palettes import PaletteRegistry
+    palette_lut = PaletteRegistry.create(palette_name, **palette_params).build_lut()
     
-    # Prepare arguments for each row
-    rows_args = []
-    for i in range(height):
-        y_coord = y[height - 1 - i]  # Flip y for correct orientation
-        rows_args.append((
-            i, x, y_coord,
-            fractal_name, fractal_params,
-            max_iter,
-            palette_name, palette_params
-        ))
-    
-    # Create output array
-    img_array = np.zeros((height, width, 3), dtype=np.uint8)
+    # Contiguous row tiles, several per worker so that tiles crossing the
+    # slow interior of the set do not leave the other workers idle
+    tiles_args = [(row_start, tile_bounds, width, row_end - row_start, max_iter)
+                  for row_start, row_end, tile_bounds
+                  in _row_tiles(bounds, height, num_workers * TILES_PER_WORKER)]
     
+    # Workers write their tiles into one shared output image
+    shape = (height, width, 3)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, height * width * 3))
+    executor = ProcessPoolExecutor(max_workers=num_workers, initializer=_init_tile_worker,
+                                   initargs=(shm.name, shape, fractal_name, fractal_params,
+                                             palette_lut))
     try:
-        with mp.Pool(processes=num_workers) as pool:
-            results = pool.imap_unordered(compute_row_wrapper, rows_args)
+        futures = [executor.submit(compute_tile_wrapper, args) for args in tiles_args]
+        
+        completed = 0
+        for future in as_completed(futures):
+            if cancel_check and cancel_check():
+                return None
             
-            completed = 0
-            for row_idx, row_data in results:
-                if cancel_check and cancel_check():
-                    pool.terminate()
-                    return None
-                
-                img_array[row_idx] = row_data
-                completed += 1
-                
-                if progress_callback and completed % 10 == 0:
-                    progress = (completed / height) * 100
-                    progress_callback(progress)
+            row_start, tile_height = future.result()
+            completed += tile_height
             
             if progress_callback:
-                progress_callback(100.0)
-                
+                progress = (completed / height) * 100
+                progress_callback(progress)
+        
+        if progress_callback:
+            progress_callback(100.0)
+            
+        # Copy out before the shared block goes away
+        img_array = np.ndarray(shape, dtype=np.uint8, buffer=shm.buf).copy()
+            
     except Exception as e:
         print(f"Error in parallel computation: {e}")
         return None
+    finally:
+        # Queued tiles are dropped at once when the render is cancelled; workers
+        # still finishing a tile keep their own mapping of the block
+        executor.shutdown(wait=False, cancel_futures=True)
+        shm.close()
+        shm.unlink()
+    
+    return img_array
+
+
+def compute_fractal_preview(
+    width: int,
+    height: int,
+    bounds: dict,
+    fractal_name: str,
+    fractal_params: dict,
+    max_iter: int,
+    palette_name: str,
+    palette_params: dict,
+    backend: str = "auto",
+    scale: int = PREVIEW_SCALE
+) -> Optional[np.ndarray]:
+    """
+    Compute a low-resolution quick look at a view before its full render.
+    
+    Only views that compute_fractal_parallel spreads over the process pool
+    get one; compiled and GPU renders finish before a preview would help.
+    The preview is one in-process compute_image(..., preview=True) call,
+    which iterates in float32 where preview_dtype allows.
+    
+    Args:
+        width, height: Full image dimensions
+        bounds: Viewport bounds dict with xmin, xmax, ymin, ymax
+        fractal_name, fractal_params: Fractal to render and its parameters
+        max_iter: Maximum iterations
+        palette_name, palette_params: Palette to color with and its parameters
+        backend: The backend the full render will use
+        scale: Reduction factor of each image dimension
+        
+    Returns:
+        Numpy array of shape (height // scale, width // scale, 3) (at least
+        one pixel each way), or None if the view gets no preview
+    """
+    if use_cuda(backend, width, height):
+        return None
+    
+    from fractals import FractalRegistry
+    from palettes import PaletteRegistry
+    
+    fractal = FractalRegistry.create(fractal_name, **fractal_params)
+    if fractal.uses_parallel_kernel(bounds):
+        return None
+    
+    palette = PaletteRegistry.create(palette_name, **palette_params)
+    values = fractal.compute_image(bounds, max(1, width // scale), max(1, height // scale),
+                                   max_iter, backend="cpu", preview=True)
+    return palette.get_colors(values, max_iter)
+
+
+def _compute_fractal_in_process(width, height, bounds, fractal, max_iter,
+                                palette_name, palette_params,
+                                progress_callback, cancel_check) -> Optional[np.ndarray]:
+    """Compute and color row bands with the fractal's parallel kernel in this process."""
+    from palettes import PaletteRegistry
+    
+    palette = PaletteRegistry.create(palette_name, **palette_params)
+    img_array = np.zeros((height, width, 3), dtype=np.uint8)
+    
+    for row_start, row_end, band_bounds in _row_tiles(bounds, height, IN_PROCESS_BANDS):
+        if cancel_check and cancel_check():
+            return None
+        
+        values = fractal.compute_image(band_bounds, width, row_end - row_start, max_iter,
+                                       backend="cpu")
+        img_array[row_start:row_end] = palette.get_colors(values, max_iter)
+        
+        if progress_callback:
+            progress_callback((row_end / height) * 100)
+    
+    return img_array
+
+
+def _compute_fractal_cuda(width, height, bounds, fractal_name, fractal_params, max_iter,
+                          palette_name, palette_params, backend,
+                          progress_callback, cancel_check) -> Optional[np.ndarray]:
+    """Compute all values in one GPU launch, then color them in one lookup."""
+    from fractals import FractalRegistry
+    from palettes import PaletteRegistry
+    
+    fractal = FractalRegistry.create(fractal_name, **fractal_params)
+    palette = PaletteRegistry.create(palette_name, **palette_params)
+    values = fractal.compute_image(bounds, width, height, max_iter, backend=backend)
+    if cancel_check and cancel_check():
+        return None
+    
+    img_array = palette.get_colors(values, max_iter)
+    
+    if progress_callback:
+        progress_callback(100.0)
     
     return img_array
 
@@ -11,8 +11,9 @@ from typing import Dict, Any
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import fractal modules to trigger registration
-from fractals import FractalRegistry, FractalBase
-from fractals.ifs_base import IFSFractalBase
+from fractals import FractalRegistry, FractalBase, register_fractal, preview_dtype, NUMBA_AVAILABLE
+from fractals.ifs_base import IFSFractalBase, bin_points
+from fractals.mandelbrot_utils import in_main_body
 from fractals.mandelbrot import *
 from fractals.julia import *
 from fractals.barnsley_fern import *
@@ -44,6 +45,36 @@ class TestFractalRegistry(unittest.TestCase):
             self.assertIsNotNone(fractal)
             self.assertIsInstance(fractal, FractalBase)
     
+    def test_list_fractals_cached(self):
+        """Test the cached name list stays sorted and is not shared with callers."""
+        names = FractalRegistry.list_fractals()
+        self.assertEqual(names, sorted(names))
+        
+        names.append('not_a_fractal')
+        self.assertNotIn('not_a_fractal', FractalRegistry.list_fractals())
+        
+        @register_fractal('aaa_test_fractal')
+        class _TestFractal(FractalBase):
+            def compute_pixel(self, x, y, max_iter):
+                return 0.0
+        try:
+            self.assertEqual(FractalRegistry.list_fractals()[0], 'aaa_test_fractal')
+        finally:
+            del FractalRegistry._fractals['aaa_test_fractal']
+            FractalRegistry._sorted_names = None
+    
+    def test_registry_default_bounds(self):
+        """Test cached default bounds match the fractal and are fresh copies."""
+        expected = FractalRegistry.create('mandelbrot').get_default_bounds()
+        bounds = FractalRegistry.default_bounds('mandelbrot')
+        self.assertEqual(bounds, expected)
+        
+        bounds['xmin'] = 100.0
+        self.assertEqual(FractalRegistry.default_bounds('mandelbrot'), expected)
+        
+        with self.assertRaises(ValueError):
+            FractalRegistry.default_bounds('nonexistent')
+    
     def test_fractal_default_bounds(self):
         """Test that all fractals have valid default bounds."""
         for name in FractalRegistry.list_fractals():
@@ -66,6 +97,43 @@ class TestFractalRegistry(unittest.TestCase):
                           f"{name}: xmin >= xmax")
             self.assertLess(bounds['ymin'], bounds['ymax'],
                           f"{name}: ymin >= ymax")
+    
+    def test_compute_image_numpy_overrides(self):
+        """Test that whole-image paths agree with the per-pixel default."""
+        cases = [('tricorn', {}), ('spider', {}), ('phoenix', {}), ('nova', {}),
+                 ('mandelbrot_orbit_trap', {'trap_type': 'circle'}),
+                 ('mandelbrot_stalks', {'stalk_type': 'both'})]
+        for name, params in cases:
+            fractal = FractalRegistry.create(name, **params)
+            bounds = fractal.get_default_bounds()
+            values = fractal.compute_image_numpy(bounds, 16, 12, 40)
+            expected = FractalBase.compute_image_numpy(fractal, bounds, 16, 12, 40)
+            self.assertEqual(values.shape, (12, 16), name)
+            np.testing.assert_allclose(values, expected, atol=1e-6, err_msg=name)
+            
+            # Compiled kernels, where present, differ only by rounding (fastmath)
+            values = fractal.compute_image(bounds, 16, 12, 40)
+            np.testing.assert_allclose(values, expected, atol=1e-3, err_msg=name)
+    
+    def test_compute_image_default_dtype(self):
+        """Test that the default compute_image uses float32 only for wide-pixel previews."""
+        class _DtypeFractal(FractalBase):
+            def compute_pixel(self, x, y, max_iter):
+                return 0.0
+            
+            def compute_image_numpy(self, bounds, width, height, max_iter, dtype=np.float64):
+                self.dtype = dtype
+                return np.zeros((height, width))
+        
+        fractal = _DtypeFractal()
+        bounds = fractal.get_default_bounds()
+        fractal.compute_image(bounds, 64, 48, 50)
+        self.assertIs(fractal.dtype, np.float64)
+        fractal.compute_image(bounds, 64, 48, 50, preview=True)
+        self.assertIs(fractal.dtype, np.float32)
+        deep = {'xmin': -0.75, 'xmax': -0.75 + 1e-6, 'ymin': 0.1, 'ymax': 0.1 + 1e-6}
+        fractal.compute_image(deep, 64, 48, 50, preview=True)
+        self.assertIs(fractal.dtype, np.float64)
 
 
 class TestMandelbrotFractal(unittest.TestCase):
@@ -91,6 +159,87 @@ class TestMandelbrotFractal(unittest.TestCase):
         result = self.fractal.compute_pixel(-0.5, 0.0, 100)
         self.assertIsInstance(result, (int, float))
         self.assertGreaterEqual(result, 0)
+    
+    def test_main_body_check(self):
+        """Test the main cardioid / period-2 bulb check on scalars and arrays."""
+        self.assertTrue(in_main_body(0.0, 0.0))
+        self.assertTrue(in_main_body(-1.0, 0.1))
+        self.assertFalse(in_main_body(0.4, 0.0))
+        self.assertFalse(in_main_body(-1.5, 0.0))
+        
+        mask = in_main_body(np.array([0.0, -1.0, 0.4]), np.array([0.0, 0.1, 0.0]))
+        np.testing.assert_array_equal(mask, [True, True, False])
+        
+        # Main-body points return max_iter without iterating
+        self.assertEqual(self.fractal.compute_pixel(-1.0, 0.1, 100), 100)
+    
+    def test_compute_image_matches_compute_pixel(self):
+        """Test that the batch image agrees with per-pixel computation."""
+        bounds = self.fractal.get_default_bounds()
+        values = self.fractal.compute_image(bounds, 16, 12, 50)
+        self.assertEqual(values.shape, (12, 16))
+        
+        # Row 0 is the top of the view
+        x = np.linspace(bounds['xmin'], bounds['xmax'], 16)
+        y = np.linspace(bounds['ymin'], bounds['ymax'], 12)
+        for i in range(12):
+            for j in range(16):
+                expected = self.fractal.compute_pixel(x[j], y[11 - i], 50)
+                self.assertAlmostEqual(values[i, j], expected, places=5)
+    
+    def test_compute_image_single_row(self):
+        """Test that a one-row viewport (one render tile row) is computed."""
+        bounds = {'xmin': -2.5, 'xmax': 1.0, 'ymin': 0.3, 'ymax': 0.3}
+        values = self.fractal.compute_image(bounds, 6, 1, 50)
+        
+        x = np.linspace(-2.5, 1.0, 6)
+        for j in range(6):
+            self.assertAlmostEqual(values[0, j], self.fractal.compute_pixel(x[j], 0.3, 50), places=5)
+    
+    def test_compute_image_numpy_float32(self):
+        """Test float32 previews agree with float64 away from the set boundary."""
+        bounds = self.fractal.get_default_bounds()
+        self.assertIs(preview_dtype(bounds, 64, 48), np.float32)
+        deep = {'xmin': -0.75, 'xmax': -0.75 + 1e-6, 'ymin': 0.1, 'ymax': 0.1 + 1e-6}
+        self.assertIs(preview_dtype(deep, 64, 48), np.float64)
+        
+        full = self.fractal.compute_image_numpy(bounds, 64, 48, 50)
+        preview = self.fractal.compute_image_numpy(bounds, 64, 48, 50, dtype=np.float32)
+        self.assertEqual(preview.dtype, np.float64)
+        self.assertLess(np.mean(np.abs(preview - full) > 0.01), 0.01)
+    
+    def test_compute_image_perturbation(self):
+        """Test the reference-orbit path against direct iteration."""
+        bounds = {'xmin': -0.7453, 'xmax': -0.7443, 'ymin': 0.1125, 'ymax': 0.1133}
+        direct = self.fractal.compute_image_numpy(bounds, 24, 18, 200)
+        perturbed = self.fractal.compute_image_perturbation(bounds, 24, 18, 200)
+        np.testing.assert_allclose(perturbed, direct, atol=1e-6)
+        
+        # Deep views take the perturbation path
+        center = -0.743643887037158
+        deep = {'xmin': center - 1e-12, 'xmax': center + 1e-12, 'ymin': 0.131825904205311,
+                'ymax': 0.131825904205311 + 1.5e-12}
+        values = self.fractal.compute_image(deep, 8, 6, 500)
+        self.assertEqual(values.shape, (6, 8))
+        self.assertTrue(np.all(np.isfinite(values)))
+    
+    def test_compute_image_backend(self):
+        """Test backend selection for batch images."""
+        bounds = self.fractal.get_default_bounds()
+        auto = self.fractal.compute_image(bounds, 8, 6, 30)
+        cpu = self.fractal.compute_image(bounds, 8, 6, 30, backend="cpu")
+        np.testing.assert_array_equal(auto, cpu)
+        
+        with self.assertRaises(ValueError):
+            self.fractal.compute_image(bounds, 8, 6, 30, backend="opencl")
+    
+    def test_uses_parallel_kernel(self):
+        """Test that deep zooms leave the compiled kernel for perturbation."""
+        bounds = self.fractal.get_default_bounds()
+        self.assertEqual(self.fractal.uses_parallel_kernel(bounds), NUMBA_AVAILABLE)
+        deep = {'xmin': -0.75, 'xmax': -0.75 + 1e-12, 'ymin': 0.1, 'ymax': 0.1 + 1e-12}
+        self.assertFalse(self.fractal.uses_parallel_kernel(deep))
+        self.assertFalse(FractalRegistry.create('barnsley_fern').uses_parallel_kernel(bounds))
 
 
 class TestJuliaFractal(unittest.TestCase):
@@ -105,6 +254,20 @@ class TestJuliaFractal(unittest.TestCase):
         # Test computation
         result = julia.compute_pixel(0.0, 0.0, 100)
         self.assertIsInstance(result, (int, float))
+    
+    def test_compute_image_numpy_matches_compute_pixel(self):
+        """Test that the vectorized NumPy image agrees with per-pixel computation."""
+        julia = FractalRegistry.create('julia', c="-0.7+0.27j")
+        bounds = julia.get_default_bounds()
+        values = julia.compute_image_numpy(bounds, 16, 12, 50)
+        self.assertEqual(values.shape, (12, 16))
+        
+        x = np.linspace(bounds['xmin'], bounds['xmax'], 16)
+        y = np.linspace(bounds['ymin'], bounds['ymax'], 12)
+        for i in range(12):
+            for j in range(16):
+                expected = julia.compute_pixel(x[j], y[11 - i], 50)
+                self.assertAlmostEqual(values[i, j], expected, places=5)
 
 
 class TestIFSFractals(unittest.TestCase):
@@ -149,6 +312,86 @@ class TestIFSFractals(unittest.TestCase):
         # Check that some pixels are non-zero (fractal was drawn)
         self.assertGreater(np.count_nonzero(img), 0)
     
+    def test_barnsley_fern_point_generation(self):
+        """Test batched Barnsley fern point generation."""
+        fractal = FractalRegistry.create('barnsley_fern')
+        bounds = fractal.get_default_bounds()
+        
+        for count in (1, 1000, 1500):
+            points = fractal.generate_points(count)
+            self.assertEqual(points.shape, (count, 2))
+        
+        # All points stay on the fern inside its default viewport
+        self.assertTrue(np.all(points[:, 0] >= bounds['xmin']))
+        self.assertTrue(np.all(points[:, 0] <= bounds['xmax']))
+        self.assertTrue(np.all(points[:, 1] >= bounds['ymin']))
+        self.assertTrue(np.all(points[:, 1] <= bounds['ymax']))
+    
+    def test_barnsley_fern_variants(self):
+        """Test each fern variant generates finite points in its viewport."""
+        for variant in ('tree', 'spiral', 'crystal'):
+            fractal = FractalRegistry.create('barnsley_fern_variant', variant=variant)
+            bounds = fractal.get_default_bounds()
+            points = fractal.generate_points(2000)
+            
+            self.assertEqual(points.shape, (2000, 2))
+            self.assertTrue(np.all(np.isfinite(points)))
+            self.assertTrue(np.all(points[:, 0] >= bounds['xmin']))
+            self.assertTrue(np.all(points[:, 0] <= bounds['xmax']))
+    
+    def test_ifs_affine_tables(self):
+        """Test each table-driven IFS has consistent maps and stays in its viewport."""
+        for name in ('sierpinski_triangle', 'sierpinski_carpet', 'dragon_curve', 'maple_leaf'):
+            fractal = FractalRegistry.create(name)
+            maps, cum_probs = fractal._affine_maps, fractal._cum_probs
+            self.assertEqual(maps.shape, (len(cum_probs), 6))
+            self.assertTrue(np.all(np.diff(cum_probs) > 0))
+            self.assertEqual(cum_probs[-1], 1.0)
+            
+            bounds = fractal.get_default_bounds()
+            points = fractal.generate_points(2000)
+            self.assertEqual(points.shape, (2000, 2))
+            self.assertTrue(np.all(points[:, 0] >= bounds['xmin']))
+            self.assertTrue(np.all(points[:, 0] <= bounds['xmax']))
+            self.assertTrue(np.all(points[:, 1] >= bounds['ymin']))
+            self.assertTrue(np.all(points[:, 1] <= bounds['ymax']))
+    
+    def test_iterate_point_table_lookup(self):
+        """Test iterate_point picks the affine map whose probability band holds r."""
+        fractal = FractalRegistry.create('sierpinski_triangle')
+        self.assertEqual(fractal.iterate_point(1.0, 1.0, 0.1), (0.5, 0.5))
+        self.assertEqual(fractal.iterate_point(1.0, 1.0, 0.5), (1.0, 0.5))
+        self.assertEqual(fractal.iterate_point(1.0, 1.0, 0.9), (0.75, 1.0))
+    
+    def test_iterate_point_fallback(self):
+        """Test the per-point loop for IFS fractals without an affine table."""
+        class NonlinearIFS(IFSFractalBase):
+            def iterate_point(self, x, y, r):
+                return (np.sin(x + r), 0.5 * y + r)
+        
+        fractal = NonlinearIFS()
+        np.random.seed(7)
+        points = fractal.generate_points(500)
+        np.random.seed(7)
+        again = fractal.generate_points(500)
+        
+        self.assertEqual(points.shape, (500, 2))
+        np.testing.assert_array_equal(points, again)
+        self.assertTrue(np.all((points[:, 1] >= 0) & (points[:, 1] < 2)))
+    
+    def test_bin_points(self):
+        """Test point binning counts hits per pixel with row 0 at ymax."""
+        bounds = {'xmin': 0.0, 'xmax': 4.0, 'ymin': 0.0, 'ymax': 2.0}
+        points = np.array([[0.5, 1.5], [0.5, 1.5], [3.5, 0.5], [9.0, 0.5]])
+        
+        counts = bin_points(points, 4, 2, bounds)
+        
+        self.assertEqual(counts.shape, (2, 4))
+        self.assertEqual(counts.dtype, np.uint32)
+        self.assertEqual(counts[0, 0], 2)
+        self.assertEqual(counts[1, 3], 1)
+        self.assertEqual(counts.sum(), 3)  # Out-of-bounds point dropped
+    
     def test_barnsley_fern_rendering(self):
         """Test Barnsley fern image rendering."""
         fractal = FractalRegistry.create('barnsley_fern')
@@ -205,6 +448,39 @@ class TestPaletteRegistry(unittest.TestCase):
         
         # Should be black (0, 0, 0)
         self.assertEqual(color, (0, 0, 0))
+    
+    def test_build_lut_matches_get_color(self):
+        """Test that vectorized lookup tables match per-color sampling."""
+        for name in PaletteRegistry.list_palettes():
+            for params in ({}, {'invert': True}):
+                palette = PaletteRegistry.create(name, **params)
+                expected = PaletteBase.build_lut(palette, 256)
+                np.testing.assert_array_equal(palette.build_lut(256), expected, err_msg=name)
+    
+    def test_get_colors(self):
+        """Test whole-array coloring against get_color and after set_params."""
+        palette = PaletteRegistry.create('smooth')
+        values = np.array([[0.0, 512.0], [1024.0, 4096.0]])
+        colors = palette.get_colors(values, 4096)
+        self.assertEqual(colors.shape, (2, 2, 3))
+        self.assertEqual(colors.dtype, np.uint8)
+        for index in np.ndindex(values.shape):
+            self.assertEqual(tuple(colors[index]), palette.get_color(values[index], 4096))
+        
+        # Changing parameters rebuilds the table
+        palette.set_params(hue=0.5)
+        colors = palette.get_colors(values, 4096)
+        self.assertEqual(tuple(colors[0, 1]), palette.get_color(512.0, 4096))
+    
+    def test_params_resolved(self):
+        """Test parameters are converted, clamped and refreshed by set_params."""
+        palette = PaletteRegistry.create('banded', bands="8", saturation=3.0, value="bad")
+        self.assertEqual(palette.bands, 8)
+        self.assertEqual(palette.sat, 1.0)
+        self.assertEqual(palette.val, 0.9)
+        
+        palette.set_params(bands=1)
+        self.assertEqual(palette.bands, 2)
 
 
 class TestBoundsCalculations(unittest.TestCase):
@@ -4,15 +4,19 @@
 import sys
 import os
 import unittest
+from unittest import mock
+
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # Import to trigger registration
-from fractals import FractalRegistry
+from fractals import FractalRegistry, NUMBA_AVAILABLE
 from fractals.mandelbrot import *
 from fractals.ifs_fractals import *
 from palettes import PaletteRegistry
 from palettes.standard import *
+from rendering.parallel import compute_fractal_preview
 
 
 class TestFractalComputationCorrectness(unittest.TestCase):
@@ -139,9 +143,32 @@ class TestRegistry(unittest.TestCase):
             PaletteRegistry.create('nonexistent_palette')
 
 
-if __name__ == '__main__':
-    import numpy as np
+class TestQuickLookPreview(unittest.TestCase):
+    """Test the low-resolution quick look shown before pool renders."""
     
+    def test_preview_iterates_in_float32(self):
+        """Test that the quick look takes the float32 NumPy path at the default view."""
+        bounds = MandelbrotFractal().get_default_bounds()
+        original = MandelbrotFractal.compute_image_numpy
+        dtypes = []
+        
+        def record(fractal, *args, dtype=np.float64):
+            dtypes.append(dtype)
+            return original(fractal, *args, dtype=dtype)
+        
+        with mock.patch.object(MandelbrotFractal, 'compute_image_numpy', record):
+            preview = compute_fractal_preview(160, 120, bounds, 'mandelbrot', {}, 50,
+                                              'smooth', {}, backend="cpu", scale=8)
+        
+        if NUMBA_AVAILABLE:
+            # The compiled in-process render needs no quick look
+            self.assertIsNone(preview)
+            return
+        self.assertEqual(preview.shape, (15, 20, 3))
+        self.assertEqual(dtypes, [np.float32])
+
+
+if __name__ == '__main__':
     loader = unittest.TestLoader()
     suite = unittest.TestSuite()
     
@@ -149,6 +176,7 @@ if __name__ == '__main__':
     suite.addTests(loader.loadTestsFromTestCase(TestPaletteConsistency))
     suite.addTests(loader.loadTestsFromTestCase(TestIFSGeometry))
     suite.addTests(loader.loadTestsFromTestCase(TestRegistry))
+    suite.addTests(loader.loadTestsFromTestCase(TestQuickLookPreview))
     
     runner = unittest.TextTestRunner(verbosity=2)
     result = runner.run(suite)